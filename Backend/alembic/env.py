@@ -11,6 +11,12 @@ from app.models.membership import Membership
 from app.models.invitation import Invitation
 from app.models.audit_log import AuditLog
 from app.models.favorite import Favorite
+from app.models.workflow_run import WorkflowRun, WorkflowRunStep, WorkflowRunCandidate, WorkflowRunRanking
+from app.models.result_record import ResultRecord
+from app.models.document_blob import DocumentBlob
+from app.models.jd import JD
+from app.models.jd_artifact import JDArtifact
+from app.models.resume_ranking import ResumeRanking
 from app.config import settings
 
 config = context.config
@@ -0,0 +1,88 @@
+"""add workflow run history tables
+
+Revision ID: 3c5a9e1f7b20
+Revises: b0e238c1f1ed
+Create Date: 2026-10-19 10:12:04.118230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3c5a9e1f7b20'
+down_revision: Union[str, None] = 'b0e238c1f1ed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('workflow_runs',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('org_id', sa.Uuid(), nullable=True),
+    sa.Column('user_id', sa.Uuid(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('job_title', sa.String(length=200), nullable=True),
+    sa.Column('job_description_text', sa.Text(), nullable=True),
+    sa.Column('job_data', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('max_candidates', sa.Integer(), nullable=False),
+    sa.Column('candidates_found', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('candidates_ranked', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('processing_time_seconds', sa.Float(), nullable=False),
+    sa.Column('workflow_version', sa.String(length=20), nullable=True),
+    sa.Column('errors', postgresql.JSONB(astext_type=sa.Text()), server_default='[]', nullable=False),
+    sa.Column('warnings', postgresql.JSONB(astext_type=sa.Text()), server_default='[]', nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['org_id'], ['organizations.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_workflow_runs_org_id'), 'workflow_runs', ['org_id'], unique=False)
+    op.create_index(op.f('ix_workflow_runs_created_at'), 'workflow_runs', ['created_at'], unique=False)
+
+    op.create_table('workflow_run_steps',
+    sa.Column('run_id', sa.Uuid(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=80), nullable=False),
+    sa.Column('success', sa.Boolean(), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('duration_ms', sa.Float(), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['run_id'], ['workflow_runs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('run_id', 'position')
+    )
+
+    op.create_table('workflow_run_candidates',
+    sa.Column('run_id', sa.Uuid(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('candidate_id', sa.String(length=512), nullable=False),
+    sa.Column('full_name', sa.String(length=200), nullable=False),
+    sa.Column('current_title', sa.String(length=200), nullable=True),
+    sa.Column('current_company', sa.String(length=200), nullable=True),
+    sa.Column('profile', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.ForeignKeyConstraint(['run_id'], ['workflow_runs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('run_id', 'position')
+    )
+
+    op.create_table('workflow_run_rankings',
+    sa.Column('run_id', sa.Uuid(), nullable=False),
+    sa.Column('rank', sa.Integer(), nullable=False),
+    sa.Column('candidate_id', sa.String(length=512), nullable=False),
+    sa.Column('candidate_name', sa.String(length=200), nullable=False),
+    sa.Column('overall_score', sa.Float(), nullable=False),
+    sa.Column('confidence_level', sa.String(length=10), nullable=False),
+    sa.Column('ranking', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.ForeignKeyConstraint(['run_id'], ['workflow_runs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('run_id', 'rank')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('workflow_run_rankings')
+    op.drop_table('workflow_run_candidates')
+    op.drop_table('workflow_run_steps')
+    op.drop_index(op.f('ix_workflow_runs_created_at'), table_name='workflow_runs')
+    op.drop_index(op.f('ix_workflow_runs_org_id'), table_name='workflow_runs')
+    op.drop_table('workflow_runs')
@@ -32,7 +32,23 @@ class Settings(BaseSettings):
     DATABASE_URL: str
 
     # --- External Services ---
-    OPENAI_API_KEY: str
+    # Checked when the first OpenAI-backed request arrives. The client itself (and
+    # OPENAI_BASE_URL, LLM_REQUESTS_PER_MINUTE, ...) comes from the pipeline settings
+    # through the shared LLM gateway.
+    OPENAI_API_KEY: str = ""
+
+    # --- Tracing (none, console, file, otlp; OTLP endpoint from OTEL_EXPORTER_OTLP_ENDPOINT) ---
+    TRACE_EXPORTER: str = "none"
+    TRACE_FILE: str = "traces.jsonl"
+    OTEL_SERVICE_NAME: str = "recruiter-api"
+
+    # --- Uploads (read in chunks and rejected as soon as they pass the limit) ---
+    MAX_UPLOAD_MB: int = 20
+
+    # --- Text Extraction Process Pool (0 = one worker per core / 4 queued per worker) ---
+    EXTRACTION_WORKERS: int = 0
+    EXTRACTION_MAX_PENDING: int = 0
+    EXTRACTION_TIMEOUT_SECONDS: float = 60.0
 
     # --- Business Logic Rules ---
     INVITE_ONLY: bool = True
@@ -1,17 +1,37 @@
 # backend/app/dependencies.py
 
 from fastapi import Depends, HTTPException, status, Request
-from supabase import Client
+from supabase import AsyncClient, Client
 from jose import JWTError, jwt
 from typing import Optional
 
 from .config import settings
-from .supabase import supabase_client
+from .pipeline import llm_gateway
+from .supabase import get_async_client, get_client
 from .models.user import User
 
 def get_supabase_client() -> Client:
     """Dependency to get the Supabase client instance."""
-    return supabase_client
+    try:
+        return get_client()
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+async def get_async_supabase_client() -> AsyncClient:
+    """Dependency to get the shared async Supabase client (batch ingestion)."""
+    try:
+        return await get_async_client()
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+def get_llm_gateway() -> llm_gateway.LLMGateway:
+    """Dependency to get the process-wide LLM gateway shared with the pipeline."""
+    if not settings.OPENAI_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="OPENAI_API_KEY is not configured.",
+        )
+    return llm_gateway.get_gateway()
 
 async def get_current_user(
     request: Request, 
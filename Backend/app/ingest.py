@@ -0,0 +1,111 @@
+# backend/app/ingest.py
+"""
+Bulk import of resumes from a directory, for one JD.
+
+Runs the same path as POST /upload/resumes/{jd_id} (dedup by content hash,
+extraction in the process pool, concurrent storage uploads, one bulk insert
+per batch) without going through HTTP, so thousands of files are extracted
+across all cores.
+
+Usage (from Backend/, with the API's .env):
+    python -m app.ingest resumes/ --jd-id <jd uuid> --user-id <user uuid>
+    EXTRACTION_WORKERS=8 python -m app.ingest resumes/ --jd-id ... --user-id ... --recursive --batch-size 100
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+from app.config import settings
+from app.pipeline import llm_gateway
+from app.services.extraction_pool import get_extraction_pool
+from app.services.resume_parsing_service import ingest_resumes
+from app.services.uploads import SUPPORTED_SUFFIXES, local_upload
+from app.supabase import get_async_client
+
+
+def find_resumes(directory: Path, recursive: bool) -> List[Path]:
+    pattern = "**/*" if recursive else "*"
+    return sorted(path for path in directory.glob(pattern)
+                  if path.is_file() and path.suffix.lower() in SUPPORTED_SUFFIXES)
+
+
+async def ingest_directory(paths: List[Path], jd_id: str, user_id: str, batch_size: int) -> int:
+    """Ingest files batch by batch; returns the number that failed."""
+    supabase = await get_async_client()
+    llm = llm_gateway.get_gateway()
+    max_bytes = settings.MAX_UPLOAD_MB * 1024 * 1024
+    inserted = failed = 0
+
+    for start in range(0, len(paths), batch_size):
+        uploads, errors = [], []
+        for path in paths[start:start + batch_size]:
+            try:
+                uploads.append(local_upload(path, max_bytes))
+            except (OSError, ValueError) as e:
+                errors.append({"filename": path.name, "error": str(e)})
+
+        started = time.perf_counter()
+        if uploads:
+            try:
+                rows, batch_errors = await ingest_resumes(supabase, llm, uploads, user_id, jd_id)
+            except Exception as e:
+                rows, batch_errors = [], [{"filename": upload.filename, "error": str(e)} for upload in uploads]
+            errors.extend(batch_errors)
+        else:
+            rows = []
+
+        inserted += len(rows)
+        failed += len(errors)
+        done = min(start + batch_size, len(paths))
+        print(f" [{done}/{len(paths)}] {len(rows)} inserted, {len(errors)} failed "
+              f"({time.perf_counter() - started:.1f}s)")
+        for error in errors:
+            print(f"   • {error['filename']}: {error['error']}")
+
+    print(f" Done: {inserted} resumes inserted, {failed} failed.")
+    return failed
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0].strip(),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("directory", type=Path, help="Directory of .pdf, .docx and .txt resumes")
+    parser.add_argument("--jd-id", required=True, help="JD the resumes are linked to")
+    parser.add_argument("--user-id", required=True, help="User the resumes are uploaded as")
+    parser.add_argument("--recursive", action="store_true", help="Include subdirectories")
+    parser.add_argument("--batch-size", type=int, default=50,
+                        help="Files per bulk insert (default: 50)")
+    return parser
+
+
+def main() -> int:
+    args = create_argument_parser().parse_args()
+    if not args.directory.is_dir():
+        print(f" Error: {args.directory} is not a directory")
+        return 1
+    if not settings.OPENAI_API_KEY:
+        print(" Error: OPENAI_API_KEY is not configured")
+        return 1
+
+    paths = find_resumes(args.directory, args.recursive)
+    if not paths:
+        print(f" No resumes found in {args.directory}")
+        return 1
+
+    pool = get_extraction_pool()
+    print(f" Ingesting {len(paths)} resumes for JD {args.jd_id} with {pool.workers} extraction workers...")
+    try:
+        failed = asyncio.run(ingest_directory(paths, args.jd_id, args.user_id, max(1, args.batch_size)))
+    finally:
+        pool.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,25 @@
 # recruiter-platform/backend/app/main.py
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.sessions import SessionMiddleware
 from fastapi.middleware.cors import CORSMiddleware
 from .config import settings
-from .routers import auth, health, me, orgs, superadmin, favorites, upload, roles
+from .pipeline import tracing
+from .routers import auth, health, me, orgs, superadmin, favorites, upload, roles, runs, metrics
 
 app = FastAPI(
     title="Recruiter Platform API",
     description="API for the multi-tenant recruiter platform.",
     version="0.1.0",
+    # orjson serializes the large ranking and run-history payloads several times faster
+    default_response_class=ORJSONResponse,
 )
 
+# --- Tracing: one span per request, parent of the workflow and external call spans ---
+tracing.configure(settings.TRACE_EXPORTER, settings.OTEL_SERVICE_NAME, settings.TRACE_FILE)
+tracing.instrument_fastapi(app)
+
 # --- CORS Middleware Configuration ---
 origins = [
     settings.FRONTEND_BASE_URL,
@@ -36,6 +44,7 @@ app.add_middleware(
 # --- API Routers ---
 # Routers are now included directly on the app without the /api/v1 prefix
 app.include_router(health.router)
+app.include_router(metrics.router)
 app.include_router(auth.router)
 app.include_router(me.router)
 app.include_router(upload.router)
@@ -43,6 +52,7 @@ app.include_router(orgs.router)
 app.include_router(superadmin.router, prefix="/superadmin", tags=["Super Admin"])
 app.include_router(favorites.router, tags=["Favorites"])
 app.include_router(roles.router, prefix="/roles", tags=["Roles"])
+app.include_router(runs.router)
 
 
 @app.get("/", tags=["Health Check"])
@@ -6,6 +6,11 @@
 from .user import User
 from .organization import Organization
 from .jd import JD
+from .workflow_run import WorkflowRun, WorkflowRunStep, WorkflowRunCandidate, WorkflowRunRanking
+from .result_record import ResultRecord
+from .document_blob import DocumentBlob
+from .jd_artifact import JDArtifact
+from .resume_ranking import ResumeRanking
 # Add any other models you have here, for example:
 # from .membership import Membership
 # from .invitation import Invitation
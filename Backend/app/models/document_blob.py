@@ -0,0 +1,23 @@
+# backend/app/models/document_blob.py
+
+# One row per distinct uploaded document (SHA-256 of its bytes) and kind ('jd'
+# or 'resume'): where its single stored copy lives and what it parsed to. The
+# upload services check it before parsing, so re-uploading a file reuses both
+# (app/services/document_store.py).
+
+from datetime import datetime
+from sqlalchemy import String, Text, DateTime, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class DocumentBlob(Base):
+    __tablename__ = "document_blobs"
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(20), primary_key=True)
+    file_url: Mapped[str] = mapped_column(Text, nullable=False)
+    size_bytes: Mapped[int] = mapped_column(nullable=False)
+    parsed: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
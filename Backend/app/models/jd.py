@@ -3,13 +3,15 @@
 from __future__ import annotations
 import uuid
 from datetime import datetime
-from sqlalchemy import String, DateTime, Text, ForeignKey, UUID
+from sqlalchemy import String, DateTime, Text, ForeignKey, UUID, Integer, Index
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from ..db.base import Base
 
 class JD(Base):
     __tablename__ = "jds"
+    __table_args__ = (Index("ix_jds_skills", "skills", postgresql_using="gin"),)
 
     # Columns based on your provided schema
     jd_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -18,6 +20,15 @@ class JD(Base):
     job_type: Mapped[str | None] = mapped_column(Text, nullable=True)
     experience_required: Mapped[str | None] = mapped_column(Text, nullable=True)
     jd_parsed_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # The structured JobDescription from the upload parse (job_data), and the parts
+    # of it that roles are filtered by. Empty for JDs uploaded before it was kept.
+    title: Mapped[str | None] = mapped_column(Text, nullable=True, index=True)
+    seniority: Mapped[str | None] = mapped_column(String(20), nullable=True, index=True)
+    experience_min: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    experience_max: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    skills: Mapped[list[str] | None] = mapped_column(ARRAY(Text), nullable=True)
+    job_data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Foreign Key to the User who uploaded it
@@ -0,0 +1,29 @@
+# backend/app/models/jd_artifact.py
+
+# Everything derived from one JD, computed once and reused by every stage: the
+# extracted text, a summary, the pipeline's parsed JobDescription and the PDL
+# search terms. The upload service writes the text and summary; the first
+# workflow run for the JD fills in the parsed job and search terms
+# (app/src/storage/jd_artifacts.py). document_sha256 lets a re-upload of the
+# same file copy the artifact instead of recomputing it.
+
+import uuid
+from datetime import datetime
+from sqlalchemy import ForeignKey, String, Text, DateTime, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class JDArtifact(Base):
+    __tablename__ = "jd_artifacts"
+
+    jd_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("jds.jd_id", ondelete="CASCADE"), primary_key=True)
+    document_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    text_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    extracted_text: Mapped[str] = mapped_column(Text, nullable=False)
+    summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    parsed_job: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    search_terms: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,21 @@
+# backend/app/models/result_record.py
+
+# Append-only store for intermediate pipeline results (Gemini discovery
+# batches, post-discovery rankings). Written with COPY by the pipeline's
+# database result sink (app/src/storage/result_sink.py) when RESULT_SINK=database.
+
+from datetime import datetime
+from sqlalchemy import BigInteger, String, DateTime, Index, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class ResultRecord(Base):
+    __tablename__ = "result_records"
+    __table_args__ = (Index("ix_result_records_stream_created_at", "stream", "created_at"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    stream: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,31 @@
+# backend/app/models/resume_ranking.py
+
+# The ranking of each resume uploaded against a JD, as POST /roles/{jd_id}/rank
+# last computed it (app/services/ranking_service.py). input_sha256 hashes what
+# the ranker was given (model, JobDescription, candidate profile): a stored
+# ranking is reused while it matches, so re-ranking a role only sends new or
+# changed resumes to the LLM. resume_id is the id of the 'resume' row, which
+# lives outside these migrations.
+
+import uuid
+from datetime import datetime
+from sqlalchemy import ForeignKey, String, Float, DateTime, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class ResumeRanking(Base):
+    __tablename__ = "resume_rankings"
+
+    jd_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("jds.jd_id", ondelete="CASCADE"), primary_key=True)
+    resume_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    input_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    candidate_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    overall_score: Mapped[float] = mapped_column(Float, nullable=False)
+    confidence_level: Mapped[str] = mapped_column(String(10), nullable=False)
+
+    # The full CandidateRanking, as dumped by Pydantic
+    ranking: Mapped[dict] = mapped_column(JSONB)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,81 @@
+# backend/app/models/workflow_run.py
+
+# Persistent history of recruitment workflow runs. Rows are written in bulk by
+# the pipeline's run store (app/src/storage/run_store.py) when a run finishes,
+# and read back by the /runs API so a past search can be re-opened without
+# paying for another round of LLM and PDL calls. API runs (POST /runs) record
+# the organization and user that started them; CLI runs record neither.
+
+import uuid
+from datetime import datetime
+from sqlalchemy import ForeignKey, String, Text, Integer, Float, Boolean, DateTime, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class WorkflowRun(Base):
+    __tablename__ = "workflow_runs"
+
+    id: Mapped[uuid.UUID] = mapped_column(default=uuid.uuid4, primary_key=True)
+
+    # Who ran it. Both are empty for runs started from the CLI.
+    org_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("organizations.id", ondelete="CASCADE"), nullable=True, index=True)
+    user_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+
+    status: Mapped[str] = mapped_column(String(20), nullable=False)  # 'completed' or 'failed'
+    job_title: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    job_description_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    job_data: Mapped[dict] = mapped_column(JSONB)
+    max_candidates: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    candidates_found: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    candidates_ranked: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    llm_tokens_used: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    fallbacks_used: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    processing_time_seconds: Mapped[float] = mapped_column(Float, nullable=False)
+    workflow_version: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    errors: Mapped[list] = mapped_column(JSONB, server_default="[]")
+    warnings: Mapped[list] = mapped_column(JSONB, server_default="[]")
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+
+class WorkflowRunStep(Base):
+    __tablename__ = "workflow_run_steps"
+
+    run_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("workflow_runs.id", ondelete="CASCADE"), primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(80), nullable=False)
+    success: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    duration_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+class WorkflowRunCandidate(Base):
+    __tablename__ = "workflow_run_candidates"
+
+    run_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("workflow_runs.id", ondelete="CASCADE"), primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    candidate_id: Mapped[str] = mapped_column(String(512), nullable=False)
+    full_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    current_title: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    current_company: Mapped[str | None] = mapped_column(String(200), nullable=True)
+
+    # The full CandidateProfile, as dumped by Pydantic
+    profile: Mapped[dict] = mapped_column(JSONB)
+
+
+class WorkflowRunRanking(Base):
+    __tablename__ = "workflow_run_rankings"
+
+    run_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("workflow_runs.id", ondelete="CASCADE"), primary_key=True)
+    rank: Mapped[int] = mapped_column(Integer, primary_key=True)
+    candidate_id: Mapped[str] = mapped_column(String(512), nullable=False)
+    candidate_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    overall_score: Mapped[float] = mapped_column(Float, nullable=False)
+    confidence_level: Mapped[str] = mapped_column(String(10), nullable=False)
+
+    # The full CandidateRanking, as dumped by Pydantic
+    ranking: Mapped[dict] = mapped_column(JSONB)
@@ -0,0 +1,27 @@
+# backend/app/pipeline.py
+"""
+Access to the recruitment pipeline (app/src) from the API.
+
+The pipeline uses absolute ``src.`` imports, so this directory is put on
+sys.path. It is appended, not prepended, so that app/supabase.py never
+shadows the supabase client library.
+"""
+
+import os
+import sys
+
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+if _APP_DIR not in sys.path:
+    sys.path.append(_APP_DIR)
+
+from src.core import llm_gateway, metrics, pdf_text, singleflight, tracing  # noqa: E402
+from src.core import models as core_models  # noqa: E402
+from src.modules.candidate_ranking import ranker as candidate_ranker  # noqa: E402
+from src.modules.jd_parser import parser as jd_parser  # noqa: E402
+from src.modules.resume_parser import extractor as resume_extractor  # noqa: E402
+from src.workflows import recruitment_workflow  # noqa: E402
+
+__all__ = [
+    "candidate_ranker", "core_models", "jd_parser", "llm_gateway", "metrics", "pdf_text",
+    "recruitment_workflow", "resume_extractor", "singleflight", "tracing",
+]
@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+
+from app.pipeline import metrics
+
+router = APIRouter(tags=["metrics"])
+
+@router.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """Prometheus scrape endpoint: external call latency, tokens, errors, fallbacks, cache hits."""
+    body, content_type = metrics.exposition()
+    return Response(content=body, media_type=content_type)
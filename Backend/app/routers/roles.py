@@ -1,17 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+import logging
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session, defer
+from typing import List, Optional
+
+from supabase import Client
 
 from .. import models
 from ..db.session import get_db
-from ..dependencies import get_current_user
+from ..dependencies import get_current_user, get_supabase_client
+from ..pipeline import core_models
 # CORRECTED: Importing the specific schema directly
-from ..schemas.jd import JDSchema
+from ..schemas.jd import JDDetailSchema, JDSchema
+from ..schemas.resume_ranking import RoleRankingResponse
+from ..services.ranking_service import rank_role
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 @router.get("/roles", response_model=List[JDSchema]) # CORRECTED: Using the direct import
 def read_roles_for_organization(
+    seniority: Optional[str] = Query(None, description="Only JDs at this experience level, e.g. 'senior'"),
+    skill: Optional[List[str]] = Query(None, description="Only JDs requiring all of these skills"),
     db: Session = Depends(get_db),
     current_user: models.user.User = Depends(get_current_user)
 ):
@@ -19,7 +30,8 @@ def read_roles_for_organization(
     Retrieve all job descriptions for the current user's organization.
 
     This works by first finding all users in the organization and then
-    collecting all JDs associated with those users.
+    collecting all JDs associated with those users. The filters use the
+    indexed structured columns (seniority, skills).
     """
     if not current_user.organization_id:
         raise HTTPException(
@@ -39,9 +51,77 @@ def read_roles_for_organization(
         return [] # Return empty list if no users are in the organization
 
     # Step 2: Fetch all JDs where the user_id is in our list of organization members.
-    roles = db.query(models.jd.JD).filter(
+    query = db.query(models.jd.JD).options(defer(models.jd.JD.job_data)).filter(
         models.jd.JD.user_id.in_(user_ids_in_org)
-    ).all()
+    )
+    if seniority:
+        query = query.filter(models.jd.JD.seniority == seniority.lower())
+    if skill:
+        query = query.filter(models.jd.JD.skills.contains([name.lower() for name in skill]))
+
+    return query.all()
+
+
+@router.get("/{jd_id}", response_model=JDDetailSchema)
+def read_role(
+    jd_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: models.user.User = Depends(get_current_user)
+):
+    """
+    Retrieve one job description of the current user's organization, with the
+    structured JobDescription parsed at upload (one indexed read, no re-parse).
+    """
+    return _role_for_user(db, current_user, jd_id)
+
+
+@router.post("/{jd_id}/rank", response_model=RoleRankingResponse)
+def rank_role_resumes(
+    jd_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    supabase: Client = Depends(get_supabase_client),
+    current_user: models.user.User = Depends(get_current_user)
+):
+    """
+    Rank the resumes uploaded against a job description with the pipeline's
+    CandidateRanker, best first. Rankings are stored per resume: a repeated
+    request returns them without LLM calls, and only resumes uploaded (or
+    re-parsed) since are sent to the ranker.
+    """
+    role = _role_for_user(db, current_user, jd_id)
+    job_data = role.job_data
+    if job_data is None:
+        artifact = db.get(models.jd_artifact.JDArtifact, jd_id)
+        job_data = artifact.parsed_job if artifact else None
+    if job_data is None:
+        raise HTTPException(
+            status_code=409,
+            detail="This role has no structured job description yet. Re-upload the JD to rank its resumes."
+        )
+
+    try:
+        return rank_role(supabase, str(jd_id), core_models.JobDescription(**job_data))
+    except Exception as e:
+        logger.exception("An unexpected error occurred while ranking resumes for JD %s: %s", jd_id, e)
+        raise HTTPException(status_code=500, detail="An internal error occurred.")
+
+
+def _role_for_user(db: Session, current_user: models.user.User, jd_id: uuid.UUID) -> models.jd.JD:
+    """The JD, if it belongs to the current user's organization (403/404 otherwise)."""
+    if not current_user.organization_id:
+        raise HTTPException(
+            status_code=403,
+            detail="Operation not allowed: User is not associated with an organization."
+        )
+
+    role = db.query(models.jd.JD).join(
+        models.user.User, models.user.User.id == models.jd.JD.user_id
+    ).filter(
+        models.jd.JD.jd_id == jd_id,
+        models.user.User.organization_id == current_user.organization_id
+    ).one_or_none()
 
-    return roles
+    if role is None:
+        raise HTTPException(status_code=404, detail="Role not found.")
+    return role
 
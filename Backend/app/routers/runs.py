@@ -0,0 +1,143 @@
+# backend/app/routers/runs.py
+
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.db.session import get_db
+from app.pipeline import recruitment_workflow
+from app.security.deps import require_user
+from app.models.jd import JD
+from app.models.membership import Membership
+from app.models.workflow_run import WorkflowRun, WorkflowRunStep, WorkflowRunCandidate, WorkflowRunRanking
+from app.schemas.workflow_run import (
+    WorkflowRunCreate, WorkflowRunSummary, WorkflowRunDetail, WorkflowRunStepSchema,
+    WorkflowRunRankingSchema, WorkflowRunCandidateSchema
+)
+
+router = APIRouter(prefix="/runs", tags=["Workflow Runs"])
+
+
+@router.post("", response_model=WorkflowRunDetail, status_code=status.HTTP_201_CREATED)
+def start_workflow_run(
+    body: WorkflowRunCreate,
+    db: Session = Depends(get_db),
+    ctx: dict = Depends(require_user)
+):
+    """
+    Runs the recruitment workflow (candidate search and ranking) for a JD
+    uploaded by the user's organization. The run is stored under the
+    organization and user, and returned as GET /runs/{run_id} would.
+    max_candidates is capped at 1 by the workflow's PDL safety net.
+    """
+    membership = ctx["membership"]
+    if not membership:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not a member of an organization.")
+    jd = db.execute(
+        select(JD)
+        .join(Membership, Membership.user_id == JD.user_id)
+        .where(JD.jd_id == body.jd_id, Membership.org_id == membership.org_id)
+    ).scalar_one_or_none()
+    if not jd:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Role not found.")
+
+    # Not shared: a workflow keeps its step state on the instance while it runs
+    workflow = recruitment_workflow.RecruitmentWorkflow()
+    if workflow.run_store is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Workflow run persistence is not configured.")
+    try:
+        artifact = workflow.load_jd_artifact(str(jd.jd_id))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    result = workflow.run_workflow(
+        artifact.text,
+        body.max_candidates,
+        org_id=str(membership.org_id),
+        user_id=str(ctx["user"].id),
+        jd_artifact=artifact,
+    )
+    run_id = uuid.UUID(result.metadata.run_id)
+    # Storing a run is best-effort in the workflow; the run itself already happened
+    if db.get(WorkflowRun, run_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Workflow run {run_id} finished but could not be stored."
+        )
+    return get_workflow_run(run_id, db=db, ctx=ctx)
+
+
+@router.get("", response_model=List[WorkflowRunSummary])
+def list_workflow_runs(
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    ctx: dict = Depends(require_user)
+):
+    """
+    Lists past workflow runs for the user's organization, newest first.
+    """
+    membership = ctx["membership"]
+    if not membership:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not a member of an organization.")
+    runs = db.execute(
+        select(WorkflowRun)
+        .where(WorkflowRun.org_id == membership.org_id)
+        .order_by(WorkflowRun.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    ).scalars().all()
+    return runs
+
+
+@router.get("/{run_id}", response_model=WorkflowRunDetail)
+def get_workflow_run(
+    run_id: uuid.UUID,
+    include_candidates: bool = False,
+    db: Session = Depends(get_db),
+    ctx: dict = Depends(require_user)
+):
+    """
+    Re-opens a past workflow run: job analysis, step timings and the stored
+    rankings, read straight from the database instead of re-running the search.
+    """
+    membership = ctx["membership"]
+    if not membership:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not a member of an organization.")
+    run = db.execute(
+        select(WorkflowRun).where(
+            WorkflowRun.id == run_id,
+            WorkflowRun.org_id == membership.org_id
+        )
+    ).scalar_one_or_none()
+
+    if not run:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workflow run not found.")
+
+    steps = db.execute(
+        select(WorkflowRunStep)
+        .where(WorkflowRunStep.run_id == run.id)
+        .order_by(WorkflowRunStep.position)
+    ).scalars().all()
+
+    rankings = db.execute(
+        select(WorkflowRunRanking)
+        .where(WorkflowRunRanking.run_id == run.id)
+        .order_by(WorkflowRunRanking.rank)
+    ).scalars().all()
+
+    candidates = []
+    if include_candidates:
+        candidates = db.execute(
+            select(WorkflowRunCandidate)
+            .where(WorkflowRunCandidate.run_id == run.id)
+            .order_by(WorkflowRunCandidate.position)
+        ).scalars().all()
+
+    detail = WorkflowRunDetail.model_validate(run)
+    detail.steps = [WorkflowRunStepSchema.model_validate(step) for step in steps]
+    detail.rankings = [WorkflowRunRankingSchema.model_validate(ranking) for ranking in rankings]
+    detail.candidates = [WorkflowRunCandidateSchema.model_validate(candidate) for candidate in candidates]
+    return detail
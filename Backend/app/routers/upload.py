@@ -1,49 +1,56 @@
 # backend/app/routers/upload.py
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from typing import List
-import tempfile
-from pathlib import Path
-from openai import OpenAI, APITimeoutError, AuthenticationError, BadRequestError
+from supabase import AsyncClient
+from openai import APITimeoutError, AuthenticationError, BadRequestError
 
-from app.dependencies import get_current_user, get_supabase_client
+from app.config import settings
+from app.dependencies import get_async_supabase_client, get_current_user, get_llm_gateway, get_supabase_client
+from app.pipeline import llm_gateway
 from app.services.jd_parsing_service import process_jd_file
-from app.services.resume_parsing_service import process_resume_file
+from app.services.resume_parsing_service import ingest_resumes
+from app.services.uploads import UploadTooLarge, spool_upload
 from app.models.user import User
-from app.config import settings # Import the settings object
 
 router = APIRouter(
     prefix="/upload",
     tags=["Upload & Parse"],
 )
 
-# --- Production-Ready OpenAI Client Initialization ---
-if not settings.OPENAI_API_KEY:
-    raise RuntimeError("OPENAI_API_KEY is not set in the environment. The application cannot start.")
-
-openai_client = OpenAI(
-    api_key=settings.OPENAI_API_KEY,
-    timeout=120.0,
-)
+# OpenAI calls go through the shared LLM gateway (get_llm_gateway): its client is
+# created on the first request, it budgets requests/tokens per minute, puts JD
+# parsing ahead of bulk resume parsing and retries transient errors. Processing runs
+# in the threadpool so concurrent uploads overlap (and identical ones share one parse).
+# Files are streamed in chunks into a spooled buffer (spool_upload) that both text
+# extraction and the storage upload read from. A resume batch goes through the
+# async Supabase client: parses and storage uploads overlap and the rows are
+# written with one bulk insert.
+MAX_UPLOAD_BYTES = settings.MAX_UPLOAD_MB * 1024 * 1024
 
 @router.post("/jd")
 async def upload_jd(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
-    supabase = Depends(get_supabase_client)
+    supabase = Depends(get_supabase_client),
+    llm: llm_gateway.LLMGateway = Depends(get_llm_gateway)
 ):
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file provided.")
 
-    # Create a temporary file to store the upload
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
-        tmp.write(await file.read())
-        tmp_path = Path(tmp.name)
+    try:
+        upload = await spool_upload(file, MAX_UPLOAD_BYTES)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     try:
-        result = process_jd_file(
+        result = await run_in_threadpool(
+            process_jd_file,
             supabase=supabase,
-            openai_client=openai_client,
-            file_path=tmp_path,
+            llm=llm,
+            upload=upload,
             user_id=str(current_user.id)
         )
         return result
@@ -64,9 +71,8 @@ async def upload_jd(
         print(f"An unexpected error occurred during JD processing: {e}")
         raise HTTPException(status_code=500, detail="An internal error occurred.")
     finally:
-        # Ensure the temporary file is always deleted
-        if tmp_path.exists():
-            tmp_path.unlink()
+        # Ensure a rolled-over temporary file is always deleted
+        upload.close()
 
 
 @router.post("/resumes/{jd_id}")
@@ -74,37 +80,39 @@ async def upload_resumes(
     jd_id: str,
     files: List[UploadFile] = File(...),
     current_user: User = Depends(get_current_user),
-    supabase = Depends(get_supabase_client)
+    supabase: AsyncClient = Depends(get_async_supabase_client),
+    llm: llm_gateway.LLMGateway = Depends(get_llm_gateway)
 ):
     if not files:
         raise HTTPException(status_code=400, detail="No resume files provided.")
 
-    results = []
+    uploads = []
     errors = []
 
-    for file in files:
-        if not file.filename:
-            continue
+    try:
+        for file in files:
+            if not file.filename:
+                continue
+            try:
+                uploads.append(await spool_upload(file, MAX_UPLOAD_BYTES))
+            except ValueError as e:
+                errors.append({"filename": file.filename, "error": str(e)})
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
-            tmp.write(await file.read())
-            tmp_path = Path(tmp.name)
+        results = []
+        if uploads:
+            try:
+                results, failed = await ingest_resumes(supabase, llm, uploads, str(current_user.id), jd_id)
+            except Exception as e:
+                # The bulk insert failed, so none of the batch was saved
+                print(f"Resume batch insert failed: {e}")
+                raise HTTPException(status_code=500, detail={"message": "All resume uploads failed.", "errors": errors + [
+                    {"filename": upload.filename, "error": str(e)} for upload in uploads]})
+            errors.extend(failed)
+    finally:
+        # Ensure rolled-over temporary files are always deleted
+        for upload in uploads:
+            upload.close()
 
-        try:
-            result = process_resume_file(
-                supabase=supabase,
-                openai_client=openai_client,
-                file_path=tmp_path,
-                user_id=str(current_user.id),
-                jd_id=jd_id
-            )
-            results.append(result)
-        except Exception as e:
-            errors.append({"filename": file.filename, "error": str(e)})
-        finally:
-            if tmp_path.exists():
-                tmp_path.unlink()
-            
     if not results and errors:
         raise HTTPException(status_code=500, detail={"message": "All resume uploads failed.", "errors": errors})
 
@@ -2,7 +2,7 @@
 
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 import uuid
 
 # This schema defines the structure for API responses for a single JD
@@ -16,10 +16,17 @@ class JDSchema(BaseModel):
     jd_parsed_summary: Optional[str] = None
     created_at: datetime
 
-    # The 'title' is a key part of the UI design.
-    # We will need to add a title field to the jds table or derive it.
-    # For now, we will add it to the schema and can populate it from another field.
-    title: Optional[str] = "Default Role Title" # Placeholder
+    # Read off the structured JD at upload; empty for JDs uploaded before it was kept
+    title: Optional[str] = None
+    seniority: Optional[str] = None
+    experience_min: Optional[int] = None
+    experience_max: Optional[int] = None
+    skills: Optional[List[str]] = None
 
     class Config:
         from_attributes = True # Pydantic v2 setting
+
+
+# A single JD with its full structured JobDescription (the pipeline's model, as JSON)
+class JDDetailSchema(JDSchema):
+    job_data: Optional[dict] = None
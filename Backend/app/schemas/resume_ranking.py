@@ -0,0 +1,24 @@
+# backend/app/schemas/resume_ranking.py
+
+from pydantic import BaseModel
+from typing import List, Optional
+import uuid
+
+# One uploaded resume's place in a role's ranking
+class ResumeRankingSchema(BaseModel):
+    rank: int
+    resume_id: str
+    file_url: Optional[str] = None
+    candidate_name: str
+    overall_score: float
+    confidence_level: str
+    cached: bool  # reused from a previous request rather than ranked now
+    ranking: dict  # the full CandidateRanking, as dumped by Pydantic
+
+
+# The ranking of every resume uploaded against a JD, best first
+class RoleRankingResponse(BaseModel):
+    jd_id: uuid.UUID
+    ranked: int
+    cached: int
+    rankings: List[ResumeRankingSchema]
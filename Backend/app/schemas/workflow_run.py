@@ -0,0 +1,77 @@
+# backend/app/schemas/workflow_run.py
+
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List, Optional
+import uuid
+
+# Start a workflow run for a JD uploaded by the user's organization. The workflow's
+# PDL safety net (_search_candidates) aborts any search for more than one candidate,
+# so a run started here searches for exactly one.
+class WorkflowRunCreate(BaseModel):
+    jd_id: uuid.UUID
+    max_candidates: int = Field(1, ge=1, le=1)
+
+
+# Summary row for listing past workflow runs
+class WorkflowRunSummary(BaseModel):
+    id: uuid.UUID
+    status: str
+    job_title: Optional[str] = None
+    candidates_found: int
+    candidates_ranked: int
+    processing_time_seconds: float
+    created_at: datetime
+
+    class Config:
+        from_attributes = True # Pydantic v2 setting
+
+
+class WorkflowRunStepSchema(BaseModel):
+    position: int
+    name: str
+    success: bool
+    started_at: Optional[datetime] = None
+    duration_ms: Optional[float] = None
+    error_message: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class WorkflowRunRankingSchema(BaseModel):
+    rank: int
+    candidate_id: str
+    candidate_name: str
+    overall_score: float
+    confidence_level: str
+    ranking: dict
+
+    class Config:
+        from_attributes = True
+
+
+class WorkflowRunCandidateSchema(BaseModel):
+    position: int
+    candidate_id: str
+    full_name: str
+    current_title: Optional[str] = None
+    current_company: Optional[str] = None
+    profile: dict
+
+    class Config:
+        from_attributes = True
+
+
+# Everything needed to re-open a past search without re-running it
+class WorkflowRunDetail(WorkflowRunSummary):
+    job_data: dict
+    max_candidates: int
+    llm_tokens_used: int = 0
+    fallbacks_used: int = 0
+    workflow_version: Optional[str] = None
+    errors: List[str] = []
+    warnings: List[str] = []
+    steps: List[WorkflowRunStepSchema] = []
+    rankings: List[WorkflowRunRankingSchema] = []
+    candidates: List[WorkflowRunCandidateSchema] = []
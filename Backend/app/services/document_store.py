@@ -0,0 +1,103 @@
+# backend/app/services/document_store.py
+import mimetypes
+from typing import Dict, Iterable, List, Optional
+
+from supabase import AsyncClient, Client
+
+from app.pipeline import metrics
+from app.services.uploads import SpooledUpload
+
+# --- Content-Hash Deduplication ---
+# Each distinct document (SHA-256 of its bytes, per kind) is stored once in its
+# bucket under a key derived from the hash, and its parse is kept in the
+# document_blobs table. Re-uploading the same bytes skips extraction, parsing and
+# the storage upload: only the new jds/resume row is inserted, pointing at the
+# existing object. The async variants serve batch ingestion: one lookup and one
+# upsert per batch, with the storage uploads run concurrently.
+BLOBS_TABLE = "document_blobs"
+
+
+def find_document(supabase: Client, kind: str, sha256: str) -> Optional[dict]:
+    """The stored copy of this content ({file_url, parsed}), or None if it is new."""
+    with metrics.external_call("supabase", "select_document_blob"):
+        res = (
+            supabase.table(BLOBS_TABLE)
+            .select("file_url, parsed")
+            .eq("sha256", sha256)
+            .eq("kind", kind)
+            .limit(1)
+            .execute()
+        )
+    blob = res.data[0] if res.data else None
+    metrics.record_cache(f"{kind}_dedup", blob is not None)
+    return blob
+
+
+def store_document(supabase: Client, kind: str, bucket: str, upload: SpooledUpload, parsed: dict) -> str:
+    """Store new content under its hash and remember its parse; returns the object name."""
+    object_name = object_name_for(upload)
+    with upload.storage_body() as body:
+        with metrics.external_call("supabase", "storage_upload"):
+            supabase.storage.from_(bucket).upload(path=object_name, file=body, file_options=_file_options(upload))
+
+    with metrics.external_call("supabase", "upsert_document_blob"):
+        supabase.table(BLOBS_TABLE).upsert(blob_row(kind, upload, parsed), on_conflict="sha256,kind").execute()
+    return object_name
+
+
+async def find_documents(supabase: AsyncClient, kind: str, hashes: Iterable[str]) -> Dict[str, dict]:
+    """Stored copies ({file_url, parsed}) by hash, for the hashes seen before; one query."""
+    hashes = sorted(set(hashes))
+    if not hashes:
+        return {}
+    with metrics.external_call("supabase", "select_document_blobs"):
+        res = await (
+            supabase.table(BLOBS_TABLE)
+            .select("sha256, file_url, parsed")
+            .eq("kind", kind)
+            .in_("sha256", hashes)
+            .execute()
+        )
+    found = {row["sha256"]: row for row in res.data or []}
+    for sha256 in hashes:
+        metrics.record_cache(f"{kind}_dedup", sha256 in found)
+    return found
+
+
+async def upload_document(supabase: AsyncClient, bucket: str, upload: SpooledUpload) -> str:
+    """Upload new content under its hash; returns the object name."""
+    object_name = object_name_for(upload)
+    with upload.storage_body() as body:
+        with metrics.external_call("supabase", "storage_upload"):
+            await supabase.storage.from_(bucket).upload(path=object_name, file=body, file_options=_file_options(upload))
+    return object_name
+
+
+async def save_documents(supabase: AsyncClient, rows: List[dict]) -> None:
+    """Remember the parses of newly stored documents (blob_row dicts) in one upsert."""
+    # A batch can hold the same file twice; one statement may not upsert a key twice
+    unique = list({(row["sha256"], row["kind"]): row for row in rows}.values())
+    if not unique:
+        return
+    with metrics.external_call("supabase", "upsert_document_blobs"):
+        await supabase.table(BLOBS_TABLE).upsert(unique, on_conflict="sha256,kind").execute()
+
+
+def object_name_for(upload: SpooledUpload) -> str:
+    return f"sha256/{upload.sha256}{upload.suffix}"
+
+
+def blob_row(kind: str, upload: SpooledUpload, parsed: dict) -> dict:
+    return {
+        "sha256": upload.sha256,
+        "kind": kind,
+        "file_url": object_name_for(upload),
+        "size_bytes": upload.size,
+        "parsed": parsed,
+    }
+
+
+def _file_options(upload: SpooledUpload) -> dict:
+    content_type, _ = mimetypes.guess_type(upload.filename)
+    # Concurrent first uploads of the same bytes write the same object
+    return {"contentType": content_type or "application/octet-stream", "upsert": "true"}
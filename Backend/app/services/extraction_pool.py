@@ -0,0 +1,123 @@
+# backend/app/services/extraction_pool.py
+import os
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from app.config import settings
+from app.pipeline import tracing
+from app.services.uploads import SpooledUpload, extract_text
+
+# --- Extraction Process Pool ---
+# PDF/DOCX text extraction is CPU-bound pure Python, so in the serving process it
+# holds the GIL against every other request, and a bulk import of thousands of
+# files would run on one core. The pool runs it in worker processes:
+# - at most max_pending documents are queued or running; submit() blocks beyond
+#   that, so a bulk import cannot queue every file (and its bytes) at once;
+# - each document gets `timeout` seconds, enforced inside the worker with a
+#   timer signal so a pathological PDF frees its worker, and by the caller;
+# - a worker that dies breaks the executor; the next submit starts a new one.
+GRACE_SECONDS = 5.0  # caller-side slack over the worker's own timer
+
+
+class ExtractionError(ValueError):
+    """Text could not be extracted from a document in time, or at all."""
+
+
+class _WorkerTimeout(Exception):
+    pass
+
+
+def _raise_timeout(signum, frame):
+    raise _WorkerTimeout()
+
+
+def _extract_in_worker(upload: SpooledUpload, timeout: float) -> str:
+    timer = timeout > 0 and hasattr(signal, "setitimer")
+    if timer:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return extract_text(upload)
+    except _WorkerTimeout:
+        raise ExtractionError(f"Text extraction from {upload.filename} took longer than {timeout:g}s.")
+    finally:
+        if timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class ExtractionPool:
+    """Bounded process pool for text extraction; safe to share between threads."""
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None, timeout: float = 60.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 4
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def submit(self, upload: SpooledUpload) -> Future:
+        """Queue a document, waiting while max_pending are already queued or running."""
+        self._slots.acquire()
+        try:
+            executor = self._get_executor()
+            try:
+                future = executor.submit(_extract_in_worker, upload, self.timeout)
+            except BrokenProcessPool:
+                # A worker died since the last document; start a fresh pool
+                future = self._get_executor(replace=executor).submit(_extract_in_worker, upload, self.timeout)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def extract(self, upload: SpooledUpload) -> str:
+        """Extract a document's text in a worker process; raises ExtractionError on timeout."""
+        if upload.suffix == ".txt":
+            return extract_text(upload)  # decoding only; not worth the round trip
+        with tracing.span("extract_text_pooled", **{"document.bytes": upload.size}):
+            future = self.submit(upload)
+            try:
+                return future.result(timeout=self.timeout + GRACE_SECONDS if self.timeout > 0 else None)
+            except FutureTimeout:
+                future.cancel()
+                raise ExtractionError(f"Text extraction from {upload.filename} took longer than {self.timeout:g}s.")
+            except BrokenProcessPool:
+                raise ExtractionError(f"The extraction worker crashed on {upload.filename}.")
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_executor(self, replace: Optional[ProcessPoolExecutor] = None) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is not None and self._executor is replace:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+
+_pool: Optional[ExtractionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_extraction_pool() -> ExtractionPool:
+    """The process-wide extraction pool, sized from settings on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ExtractionPool(
+                    workers=settings.EXTRACTION_WORKERS or None,
+                    max_pending=settings.EXTRACTION_MAX_PENDING or None,
+                    timeout=settings.EXTRACTION_TIMEOUT_SECONDS,
+                )
+    return _pool
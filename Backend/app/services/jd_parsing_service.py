@@ -1,58 +1,55 @@
 # backend/app/services/jd_parsing_service.py
-import os
+import hashlib
 import json
-import mimetypes
-from pathlib import Path
-from datetime import datetime
-import tempfile
+import logging
+from typing import Optional
 
-from openai import OpenAI
 from supabase import Client
-import docx2txt
-from pypdf import PdfReader
-
-# --- Text Extraction Logic ---
-def extract_text(path: Path) -> str:
-    ext = path.suffix.lower()
-    if ext == ".txt":
-        return path.read_text(encoding="utf-8", errors="ignore")
-    elif ext == ".docx":
-        return docx2txt.process(str(path)) or ""
-    elif ext == ".pdf":
-        text_parts = []
-        with open(path, "rb") as f:
-            reader = PdfReader(f)
-            for page in reader.pages:
-                text_parts.append(page.extract_text() or "")
-        return "\n".join(text_parts).strip()
-    raise ValueError(f"Unsupported file type: {ext}")
+
+from app.pipeline import jd_parser, llm_gateway, metrics, singleflight, tracing
+from app.services.document_store import find_document, store_document
+from app.services.extraction_pool import get_extraction_pool
+from app.services.uploads import SpooledUpload
 
 # --- JD Parser Logic (Updated based on jd_parser.py) ---
+# One call returns both the display fields of the jds row and the pipeline's full
+# JobDescription ("job", the schema src/modules/jd_parser uses), so ranking and
+# search read a stored JD instead of parsing it again.
 JD_SYSTEM_PROMPT = """You are an expert job description parser. Extract the following fields from the provided job description text:
 
 - location: City/State/Country if present; else null/empty
 - job_type: One of ['Full Time', 'Part Time', 'Internship', 'Contract'] if you can infer, else null/empty
 - experience_required: Return as short free text, e.g. '2-3 years', '5+ years', or null/empty
 - jd_parsed_summary: 2-4 sentence summary capturing the role, seniority, key responsibilities, and core skills.
+- job: the structured job description, as this JSON object (null for missing values, skills concise):
+""" + jd_parser.JOB_DESCRIPTION_SCHEMA + """
 
 If a field is not present, return it as an empty string.
-Return strictly as compact JSON with keys: location, job_type, experience_required, jd_parsed_summary.
+Return strictly as compact JSON with keys: location, job_type, experience_required, jd_parsed_summary, job.
 """
 JD_USER_TEMPLATE = "Job Description Text:\n---\n{content}\n---"
+OPENAI_TIMEOUT_SECONDS = 120.0  # per attempt; the gateway retries timeouts
+
+logger = logging.getLogger(__name__)
 
-def parse_jd_text(client: OpenAI, text: str) -> dict:
+# Concurrent uploads of the same document share one parse
+@singleflight.single_flight("parse_jd", key=lambda llm, text: singleflight.content_key(text[:120000]))
+def parse_jd_text(llm: llm_gateway.LLMGateway, text: str) -> dict:
     """
     Calls the OpenAI API to parse text and normalizes the response.
     """
-    resp = client.chat.completions.create(
-        model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+    content = llm.complete(
+        route="extraction",
         messages=[
             {"role": "system", "content": JD_SYSTEM_PROMPT},
             {"role": "user", "content": JD_USER_TEMPLATE.format(content=text[:120000])},
         ],
+        operation="parse_jd",
+        priority=llm_gateway.Priority.INTERACTIVE,
         response_format={"type": "json_object"},
+        timeout=OPENAI_TIMEOUT_SECONDS,
     )
-    data = json.loads(resp.choices[0].message.content)
+    data = json.loads(content)
 
     # Normalize the data to ensure consistency, similar to jd_parser.py
     normalized_data = {
@@ -67,27 +64,53 @@ def parse_jd_text(client: OpenAI, text: str) -> dict:
     if normalized_data["job_type"] not in allowed_job_types:
         normalized_data["job_type"] = "" # Set to empty if not a valid type
 
+    # The structured JD, validated by the pipeline's model; None if the model rejects it
+    try:
+        job = jd_parser.job_description_from_dict(data.get("job") or {})
+        normalized_data["job"] = job.model_dump(mode="json")
+    except Exception as e:
+        logger.warning("The parsed JD has no valid structured job description: %s", e)
+        normalized_data["job"] = None
+
     return normalized_data
 
-def process_jd_file(supabase: Client, openai_client: OpenAI, file_path: Path, user_id: str) -> dict:
-    text = extract_text(file_path)
-    if not text.strip():
-        raise ValueError("No text could be extracted from the JD file.")
 
-    parsed_data = parse_jd_text(openai_client, text)
+def _structured_columns(job: Optional[dict]) -> dict:
+    """The jds columns read off the structured JD, for indexed filtering."""
+    if not job:
+        return {"title": None, "seniority": None, "experience_min": None, "experience_max": None,
+                "skills": None, "job_data": None}
+    years = job.get("experience_years") or {}
+    return {
+        "title": job.get("title") or None,
+        "seniority": job.get("experience_level"),
+        "experience_min": years.get("minimum"),
+        "experience_max": years.get("maximum"),
+        "skills": sorted({skill.lower() for skill in job.get("required_skills") or []}) or None,
+        "job_data": job,
+    }
 
-    # Upload the original file to Supabase storage
-    bucket = "jds"
-    ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-    object_name = f"{user_id}/{ts}_{file_path.name}"
-    
-    with open(file_path, "rb") as f:
-        content_type, _ = mimetypes.guess_type(file_path.name)
-        supabase.storage.from_(bucket).upload(
-            path=object_name, 
-            file=f, 
-            file_options={"contentType": content_type or "application/octet-stream"}
-        )
+@tracing.traced("process_jd_file")
+def process_jd_file(supabase: Client, llm: llm_gateway.LLMGateway, upload: SpooledUpload, user_id: str) -> dict:
+    # Identical bytes uploaded before: reuse the stored copy, its parse and its artifact.
+    # Parses without a structured JD (stored before it was part of them, or rejected
+    # by the model) are redone.
+    stored = find_document(supabase, "jd", upload.sha256)
+    if stored and not stored["parsed"].get("job"):
+        stored = None
+    artifact = _find_artifact(supabase, upload.sha256) if stored else None
+    if artifact:
+        text = artifact["extracted_text"]
+    else:
+        text = get_extraction_pool().extract(upload)
+        if not text.strip():
+            raise ValueError("No text could be extracted from the JD file.")
+
+    if stored:
+        object_name, parsed_data = stored["file_url"], stored["parsed"]
+    else:
+        parsed_data = parse_jd_text(llm, text)
+        object_name = store_document(supabase, "jd", "jds", upload, parsed_data)
 
     # Prepare data for insertion, mapping empty strings to None for the database
     row = {
@@ -97,11 +120,50 @@ def process_jd_file(supabase: Client, openai_client: OpenAI, file_path: Path, us
         "job_type": parsed_data.get("job_type") or None,
         "experience_required": parsed_data.get("experience_required") or None,
         "jd_parsed_summary": parsed_data.get("jd_parsed_summary") or None,
+        **_structured_columns(parsed_data.get("job")),
     }
     
-    res = supabase.table("jds").insert(row).execute()
+    with metrics.external_call("supabase", "insert_jds"):
+        res = supabase.table("jds").insert(row).execute()
     
     if not res.data:
         raise RuntimeError(f"Supabase insert error: No data returned after insert.")
-        
+
+    _save_artifact(supabase, {
+        **(artifact or {}),
+        "jd_id": res.data[0]["jd_id"],
+        "document_sha256": upload.sha256,
+        "text_sha256": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        "extracted_text": text,
+        "summary": (artifact or {}).get("summary") or row["jd_parsed_summary"],
+        "parsed_job": (artifact or {}).get("parsed_job") or parsed_data.get("job"),
+    })
     return res.data[0]
+
+
+# --- JD Artifacts ---
+# The extracted text and summary are kept per JD (jd_artifacts) so the recruitment
+# workflow never re-extracts or re-summarizes an uploaded JD; its first run adds the
+# parsed job and search terms (app/src/storage/jd_artifacts.py). A re-upload of the
+# same file copies the earlier JD's artifact, including whatever that run added.
+def _find_artifact(supabase: Client, document_sha256: str) -> Optional[dict]:
+    with metrics.external_call("supabase", "select_jd_artifact"):
+        res = (
+            supabase.table("jd_artifacts")
+            .select("text_sha256, extracted_text, summary, parsed_job, search_terms")
+            .eq("document_sha256", document_sha256)
+            .order("updated_at", desc=True)
+            .limit(1)
+            .execute()
+        )
+    return res.data[0] if res.data else None
+
+
+def _save_artifact(supabase: Client, artifact: dict) -> None:
+    # The JD row is already in; without its artifact, workflow runs for it are
+    # refused (load_jd_artifact) until the same file is uploaded again
+    try:
+        with metrics.external_call("supabase", "insert_jd_artifact"):
+            supabase.table("jd_artifacts").insert(artifact).execute()
+    except Exception as e:
+        logger.warning("Could not store the artifact of JD %s: %s", artifact["jd_id"], e)
@@ -0,0 +1,181 @@
+# backend/app/services/ranking_service.py
+import logging
+import re
+import threading
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from supabase import Client
+
+from app.pipeline import candidate_ranker, core_models, llm_gateway, metrics, singleflight, tracing
+
+# --- Role Ranking ---
+# POST /roles/{jd_id}/rank scores the resumes uploaded against a JD with the
+# pipeline's CandidateRanker, against the JobDescription stored at upload. Each
+# ranking is kept in resume_rankings with a hash of what the ranker was given
+# (the ranking route's model, JobDescription, candidate profile). The next
+# request reuses every ranking whose hash still matches and sends only new or
+# changed resumes to the LLM, so re-ranking an unchanged role is two reads.
+# Heuristic rankings (CandidateRanking.is_fallback, set when the AI ranking
+# failed) are returned but not stored, so those resumes are tried again next
+# time. The flag travels with the result, so it also holds for a request that
+# joined another request's single-flighted ranking batch.
+RANKINGS_TABLE = "resume_rankings"
+RESUME_COLUMNS = "id, file_url, json_content, person_name, role, company, profile_url"
+EMAIL_PATTERN = re.compile(r'^[^@]+@[^@]+\.[^@]+$')
+
+logger = logging.getLogger(__name__)
+
+_ranker: Optional[candidate_ranker.CandidateRanker] = None
+_ranker_lock = threading.Lock()
+
+
+def get_ranker() -> candidate_ranker.CandidateRanker:
+    """The process-wide ranker, created (and its settings read) on first use."""
+    global _ranker
+    if _ranker is None:
+        with _ranker_lock:
+            if _ranker is None:
+                _ranker = candidate_ranker.CandidateRanker()
+    return _ranker
+
+
+def _text(value, limit: int) -> Optional[str]:
+    value = (value or "").strip() if isinstance(value, str) else ""
+    return value[:limit] or None
+
+
+def _unique(values, limit: int) -> List[str]:
+    seen, result = set(), []
+    for value in values:
+        if isinstance(value, str) and value.strip() and value.strip().lower() not in seen:
+            seen.add(value.strip().lower())
+            result.append(value.strip())
+    return result[:limit]
+
+
+def _location(value) -> Optional[core_models.Location]:
+    if isinstance(value, dict):
+        return core_models.Location(**{key: value.get(key) for key in ("city", "state", "country")})
+    if isinstance(value, str) and value.strip():
+        parts = [part.strip() for part in value.split(",")]
+        return core_models.Location(city=parts[0], state=parts[1] if len(parts) > 2 else None,
+                                    country=parts[-1] if len(parts) > 1 else None)
+    return None
+
+
+def candidate_profile(resume: dict) -> core_models.CandidateProfile:
+    """The ranker's CandidateProfile for a parsed 'resume' row."""
+    content = resume.get("json_content") or {}
+    contact = content.get("contact") or {}
+    skills = content.get("skills") or {}
+    emails = [email for email in contact.get("emails") or [] if isinstance(email, str) and EMAIL_PATTERN.match(email)]
+    phones = contact.get("phones") or []
+    locations = contact.get("locations") or []
+    profile_url = _text(resume.get("profile_url"), 500)
+    education = [
+        ", ".join(str(item[key]) for key in ("degree", "field", "institution") if item.get(key))
+        if isinstance(item, dict) else item
+        for item in content.get("education") or []
+    ]
+    return core_models.CandidateProfile(
+        candidate_id=f"resume_{resume['id']}",
+        full_name=_text(resume.get("person_name"), 100) or "Unknown",
+        current_title=_text(resume.get("role"), 150),
+        current_company=_text(resume.get("company"), 100),
+        location=_location(locations[0]) if locations else None,
+        linkedin_url=profile_url if profile_url and "linkedin.com" in profile_url and profile_url.startswith("http") else None,
+        email=emails[0] if emails else None,
+        phone=_text(phones[0], 20) if phones else None,
+        skills=_unique((skills.get("hard_skills") or []) + (skills.get("tools") or []), 100),
+        education=_unique(education, 10),
+        previous_companies=_unique((item.get("company") for item in content.get("experience") or []
+                                    if isinstance(item, dict)), 20),
+        candidate_description=_text(content.get("summary"), 2000),
+    )
+
+
+def rank_role(supabase: Client, jd_id: str, job: core_models.JobDescription) -> dict:
+    """
+    Rank every resume uploaded against jd_id, best first.
+
+    Stored rankings are reused while the ranker's input is unchanged; the rest
+    are ranked in one pass and stored. Returns {jd_id, ranked, cached, rankings}.
+    """
+    with metrics.external_call("supabase", "select_resumes"):
+        resumes = supabase.table("resume").select(RESUME_COLUMNS).eq("jd_id", jd_id).execute().data or []
+    with metrics.external_call("supabase", "select_resume_rankings"):
+        res = supabase.table(RANKINGS_TABLE).select("resume_id, input_sha256, ranking").eq("jd_id", jd_id).execute()
+    stored = {row["resume_id"]: row for row in res.data or []}
+
+    ranker = get_ranker()
+    model = llm_gateway.get_gateway().model("ranking")
+    results, pending = [], []
+    for resume in resumes:
+        resume_id = str(resume["id"])
+        try:
+            profile = candidate_profile(resume)
+        except ValueError as e:
+            logger.warning("Skipping resume %s for ranking: %s", resume_id, e)
+            continue
+        input_sha256 = singleflight.content_key(model, job, profile)
+        hit = stored.get(resume_id)
+        is_hit = hit is not None and hit["input_sha256"] == input_sha256
+        metrics.record_cache("resume_ranking", is_hit)
+        if is_hit:
+            results.append((resume, hit["ranking"], True))
+        else:
+            pending.append((resume, profile, input_sha256))
+
+    if pending:
+        with tracing.span("rank_resumes", **{"resume.count": len(pending)}):
+            rankings = ranker.rank_candidates(job, [profile for _, profile, _ in pending])
+        by_candidate = {ranking.candidate_id: ranking for ranking in rankings}
+
+        rows, fallbacks = [], 0
+        now = datetime.now(timezone.utc).isoformat()
+        for resume, profile, input_sha256 in pending:
+            ranking = by_candidate.get(profile.candidate_id)
+            if ranking is None:
+                continue
+            data = ranking.model_dump(mode="json")
+            results.append((resume, data, False))
+            if ranking.is_fallback:
+                fallbacks += 1
+                continue
+            rows.append({
+                "jd_id": jd_id,
+                "resume_id": str(resume["id"]),
+                "input_sha256": input_sha256,
+                "candidate_name": ranking.candidate_name[:200],
+                "overall_score": ranking.overall_score,
+                "confidence_level": data["confidence_level"],
+                "ranking": data,
+                "updated_at": now,
+            })
+
+        if fallbacks:
+            logger.warning("Ranking for JD %s used fallback scores; not storing %d rankings.", jd_id, fallbacks)
+        if rows:
+            with metrics.external_call("supabase", "upsert_resume_rankings"):
+                supabase.table(RANKINGS_TABLE).upsert(rows, on_conflict="jd_id,resume_id").execute()
+
+    results.sort(key=lambda result: result[1]["overall_score"], reverse=True)
+    return {
+        "jd_id": jd_id,
+        "ranked": sum(1 for _, _, cached in results if not cached),
+        "cached": sum(1 for _, _, cached in results if cached),
+        "rankings": [
+            {
+                "rank": rank,
+                "resume_id": str(resume["id"]),
+                "file_url": resume.get("file_url"),
+                "candidate_name": data["candidate_name"],
+                "overall_score": data["overall_score"],
+                "confidence_level": data["confidence_level"],
+                "cached": cached,
+                "ranking": data,
+            }
+            for rank, (resume, data, cached) in enumerate(results, start=1)
+        ],
+    }
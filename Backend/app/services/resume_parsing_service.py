@@ -1,53 +1,30 @@
 # backend/app/services/resume_parsing_service.py
-import os
+import asyncio
 import json
-import mimetypes
-from pathlib import Path
-from datetime import datetime
-import tempfile
-
-from openai import OpenAI
-from supabase import Client
-import docx2txt
-from pypdf import PdfReader
-
-# --- Text Extraction Logic (Shared) ---
-def extract_text(path: Path) -> str:
-    ext = path.suffix.lower()
-    if ext == ".txt":
-        return path.read_text(encoding="utf-8", errors="ignore")
-    elif ext == ".docx":
-        return docx2txt.process(str(path)) or ""
-    elif ext == ".pdf":
-        text_parts = []
-        with open(path, "rb") as f:
-            reader = PdfReader(f)
-            for page in reader.pages:
-                text_parts.append(page.extract_text() or "")
-        return "\n".join(text_parts).strip()
-    raise ValueError(f"Unsupported file type: {ext}")
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from typing import Any, List, Tuple
+
+from supabase import AsyncClient
+
+from app.pipeline import llm_gateway, metrics, resume_extractor, singleflight, tracing
+from app.services.document_store import blob_row, find_documents, save_documents, upload_document
+from app.services.extraction_pool import get_extraction_pool
+from app.services.uploads import MAX_TEXT_CHARS, SpooledUpload
 
 # --- Resume Parser Logic ---
-RESUME_SYSTEM_PROMPT = """You are an expert resume parser. Extract a comprehensive JSON profile and key fields from the resume text.
-
-Return strictly valid JSON with these top-level keys:
-- person_name: string (best guess, full name; empty if unknown)
-- role: string (current or most recent role title; empty if unknown)
-- company: string (current or most recent company; empty if unknown)
-- profile_url: string (LinkedIn or personal site if present; empty if unknown)
-- json_content: object with detailed fields:
-  - contact: { emails: [..], phones: [..], locations: [..], links: [..] }
-  - summary: string (professional summary)
-  - skills: { hard_skills: [..], soft_skills: [..], tools: [..], languages: [..] }
-  - education: [ { degree, field, institution, start_date, end_date, location, gpa } ]
-  - experience: [ 
-      { title, company, location, start_date, end_date, current, bullets: [..], achievements: [..], skills: [..] } 
-    ]
-  - projects: [ { name, description, technologies: [..], links: [..] } ]
-  - certifications: [ { name, issuer, date } ]
-  - publications: [ { title, venue, date, link } ]
-  - awards: [ { name, issuer, date } ]
-  - extras: { volunteer: [..], interests: [..] }
+# A heuristic pass (resume_extractor) fills contact details, links, skills, dated
+# experience/education and the summary; the LLM is asked only for the fields it
+# could not fill confidently, and sees only the sections those fields come from.
+# Excerpts longer than CHUNK_CHARS (long academic CVs) are split into chunks at
+# section and paragraph boundaries. The chunks are parsed concurrently, each
+# asked only for the fields its sections hold, and the partial results are
+# merged in document order. Latency is then that of the largest chunk, and
+# nothing up to MAX_RESUME_CHARS is cut.
+RESUME_SYSTEM_PROMPT = """You are an expert resume parser. Extract the requested fields from the resume text.
+
+Return strictly valid JSON with exactly these top-level keys:
+{fields}
 
 Rules:
 - Use empty strings, empty arrays, or nulls where information is missing.
@@ -55,42 +32,137 @@ Rules:
 - Do not invent data; infer conservatively from the text.
 """
 RESUME_USER_TEMPLATE = "Resume Text:\n---\n{content}\n---"
+OPENAI_TIMEOUT_SECONDS = 120.0  # per attempt; the gateway retries timeouts
+CHUNK_CHARS = 24_000  # resume text per LLM call
+MAX_RESUME_CHARS = MAX_TEXT_CHARS  # all the text extraction keeps
+
+# Fields the LLM can be asked for: prompt schema, and the extractor field it replaces
+RESUME_FIELDS = {
+    "person_name": ("string (best guess, full name; empty if unknown)", "full_name"),
+    "role": ("string (current or most recent role title; empty if unknown)", "current_title"),
+    "company": ("string (current or most recent company; empty if unknown)", "current_company"),
+    "locations": ("[..] (candidate's city/state/country)", "location"),
+    "summary": ("string (professional summary)", "summary"),
+    "skills": ("{ hard_skills: [..], soft_skills: [..], tools: [..], languages: [..] }", "skills"),
+    "education": ("[ { degree, field, institution, start_date, end_date, location, gpa } ]", "education"),
+    "experience": ("[ { title, company, location, start_date, end_date, current, bullets: [..], achievements: [..], skills: [..] } ]", "experience"),
+    "projects": ("[ { name, description, technologies: [..], links: [..] } ]", "projects"),
+    "certifications": ("[ { name, issuer, date } ]", "certifications"),
+    "publications": ("[ { title, venue, date, link } ]", "publications"),
+    "awards": ("[ { name, issuer, date } ]", "awards"),
+    "extras": ("{ volunteer: [..], interests: [..] }", "extras"),
+}
+TOP_LEVEL_FIELDS = ("person_name", "role", "company")
+
+
+def _heuristic_profile(extraction: resume_extractor.ResumeExtraction) -> dict:
+    """The parse result shape, filled from the heuristic extraction."""
+    location = extraction.get("location")
+    links = extraction.get("links") or []
+    return {
+        "person_name": extraction.get("full_name") or "",
+        "role": extraction.get("current_title") or "",
+        "company": extraction.get("current_company") or "",
+        "profile_url": extraction.get("linkedin_url") or (links[0] if links else ""),
+        "json_content": {
+            "contact": {
+                "emails": extraction.get("emails") or [],
+                "phones": extraction.get("phones") or [],
+                "locations": [location] if location else [],
+                "links": links,
+            },
+            "summary": extraction.get("summary") or "",
+            "skills": {"hard_skills": extraction.get("skills") or [], "soft_skills": [], "tools": [], "languages": []},
+            "education": extraction.get("education") or [],
+            "experience": extraction.get("experience") or [],
+            "projects": [],
+            "certifications": [],
+            "publications": [],
+            "awards": [],
+            "extras": extraction.get("extras") or {"volunteer": [], "interests": []},
+        },
+    }
 
-def parse_resume_text(client: OpenAI, text: str) -> dict:
-    resp = client.chat.completions.create(
-        model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+
+# Concurrent uploads of the same document share one parse
+@singleflight.single_flight("parse_resume", key=lambda llm, text: singleflight.content_key(text[:MAX_RESUME_CHARS]))
+def parse_resume_text(llm: llm_gateway.LLMGateway, text: str) -> dict:
+    extraction = resume_extractor.ResumeExtractor().extract(text[:MAX_RESUME_CHARS])
+    data = _heuristic_profile(extraction)
+    missing = [key for key, (_, name) in RESUME_FIELDS.items() if not extraction.is_confident(name)]
+    metrics.record_fast_path("resume_parser", complete=not missing)
+    if not missing:
+        return data
+
+    names = {RESUME_FIELDS[key][1]: key for key in missing}
+    chunks = extraction.chunks(names, size=CHUNK_CHARS, limit=MAX_RESUME_CHARS)
+    if len(chunks) == 1:
+        parsed = _parse_chunk(llm, missing, chunks[0][1])
+    else:
+        with tracing.span("parse_resume_chunked", **{"resume.chunks": len(chunks)}):
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                futures = [executor.submit(_parse_chunk, llm, [names[name] for name in chunk_names], content)
+                           for chunk_names, content in chunks]
+                parsed = reduce(_merge_parsed, (future.result() for future in futures), {})
+
+    profile = data["json_content"]
+    for key in missing:
+        value = parsed.get(key)
+        if not value:
+            continue
+        if key in TOP_LEVEL_FIELDS:
+            data[key] = value
+        elif key == "locations":
+            profile["contact"]["locations"] = value if isinstance(value, list) else [value]
+        else:
+            profile[key] = value
+    return data
+
+
+def _parse_chunk(llm: llm_gateway.LLMGateway, fields: List[str], content: str) -> dict:
+    """The LLM's JSON for the given fields of one piece of resume text."""
+    response = llm.complete(
+        route="extraction",
         messages=[
-            {"role": "system", "content": RESUME_SYSTEM_PROMPT},
-            {"role": "user", "content": RESUME_USER_TEMPLATE.format(content=text[:120000])},
+            {"role": "system", "content": RESUME_SYSTEM_PROMPT.format(
+                fields="\n".join(f"- {key}: {RESUME_FIELDS[key][0]}" for key in fields))},
+            {"role": "user", "content": RESUME_USER_TEMPLATE.format(content=content)},
         ],
+        operation="parse_resume",
+        priority=llm_gateway.Priority.BULK,
         response_format={"type": "json_object"},
+        timeout=OPENAI_TIMEOUT_SECONDS,
     )
-    data = json.loads(resp.choices[0].message.content)
-    return data
+    return json.loads(response)
 
-def process_resume_file(supabase: Client, openai_client: OpenAI, file_path: Path, user_id: str, jd_id: str) -> dict:
-    text = extract_text(file_path)
+
+def _merge_parsed(first: Any, second: Any) -> Any:
+    """Combine two chunks' values: lists are concatenated without repeats, objects
+    merged key by key, and otherwise the first non-empty value (in document order) wins."""
+    if isinstance(first, list) and isinstance(second, list):
+        merged, seen = [], set()
+        for item in first + second:
+            key = json.dumps(item, sort_keys=True, default=str).lower()
+            if key not in seen:
+                seen.add(key)
+                merged.append(item)
+        return merged
+    if isinstance(first, dict) and isinstance(second, dict):
+        return {key: _merge_parsed(first.get(key), second.get(key)) for key in {**first, **second}}
+    return first if first else second
+
+
+def _parse_upload(llm: llm_gateway.LLMGateway, upload: SpooledUpload) -> dict:
+    text = get_extraction_pool().extract(upload)
     if not text.strip():
-        raise ValueError(f"No text could be extracted from the resume: {file_path.name}")
-
-    parsed_data = parse_resume_text(openai_client, text)
-
-    # Upload the original file to Supabase storage
-    bucket = "resumes"
-    ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-    object_name = f"{user_id}/{ts}_{file_path.name}"
-    
-    with open(file_path, "rb") as f:
-        content_type, _ = mimetypes.guess_type(file_path.name)
-        supabase.storage.from_(bucket).upload(
-            path=object_name, 
-            file=f, 
-            file_options={"contentType": content_type or "application/octet-stream"}
-        )
-
-    # The row now includes all top-level columns from your 'resume' table,
+        raise ValueError(f"No text could be extracted from the resume: {upload.filename}")
+    return parse_resume_text(llm, text)
+
+
+def _resume_row(parsed_data: dict, object_name: str, user_id: str, jd_id: str) -> dict:
+    # The row includes all top-level columns from the 'resume' table,
     # mapping empty strings to None to prevent database errors.
-    row = {
+    return {
         "jd_id": jd_id,
         "user_id": user_id,
         "file_url": object_name,
@@ -100,13 +172,49 @@ def process_resume_file(supabase: Client, openai_client: OpenAI, file_path: Path
         "company": (parsed_data.get("company") or "").strip() or None,
         "profile_url": (parsed_data.get("profile_url") or "").strip() or None,
     }
-    
-    # --- THIS IS THE FIX ---
-    # Changed table name from "resumes" to "resume" to match the database schema.
-    res = supabase.table("resume").insert(row).execute()
-    # --- END OF FIX ---
-    
-    if not res.data:
-        raise RuntimeError(f"Supabase insert error: No data returned after insert.")
-        
-    return res.data[0]
+
+
+async def ingest_resumes(
+    supabase: AsyncClient, llm: llm_gateway.LLMGateway, uploads: List[SpooledUpload], user_id: str, jd_id: str
+) -> Tuple[List[dict], List[dict]]:
+    """
+    Parse, store and insert a batch of resumes for one JD.
+
+    Returns (inserted rows, {filename, error} for the files that failed). Files
+    seen before reuse their stored copy and parse (one lookup for the batch);
+    new ones are parsed in worker threads and uploaded concurrently over the
+    shared async client, and all rows go in with a single bulk insert.
+    """
+    with tracing.span("ingest_resumes", **{"resume.count": len(uploads)}):
+        stored = await find_documents(supabase, "resume", [upload.sha256 for upload in uploads])
+
+        async def prepare(upload: SpooledUpload) -> Tuple[str, dict, bool]:
+            blob = stored.get(upload.sha256)
+            if blob:
+                return blob["file_url"], blob["parsed"], False
+            parsed_data = await asyncio.to_thread(_parse_upload, llm, upload)
+            return await upload_document(supabase, "resumes", upload), parsed_data, True
+
+        outcomes = await asyncio.gather(*(prepare(upload) for upload in uploads), return_exceptions=True)
+
+        rows, new_blobs, errors = [], [], []
+        for upload, outcome in zip(uploads, outcomes):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                errors.append({"filename": upload.filename, "error": str(outcome)})
+                continue
+            object_name, parsed_data, is_new = outcome
+            if is_new:
+                new_blobs.append(blob_row("resume", upload, parsed_data))
+            rows.append(_resume_row(parsed_data, object_name, user_id, jd_id))
+
+        await save_documents(supabase, new_blobs)
+        if not rows:
+            return [], errors
+
+        with metrics.external_call("supabase", "insert_resumes"):
+            res = await supabase.table("resume").insert(rows).execute()
+        if not res.data:
+            raise RuntimeError("Supabase insert error: No data returned after insert.")
+        return res.data, errors
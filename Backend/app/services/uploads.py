@@ -0,0 +1,134 @@
+# backend/app/services/uploads.py
+import hashlib
+import io
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Union
+
+import docx2txt
+from fastapi import UploadFile
+
+from app.pipeline import pdf_text, tracing
+
+# --- Streaming Upload Spooling ---
+# Uploads are read CHUNK_SIZE bytes at a time and hashed as they arrive. Up to
+# SPOOL_MEMORY_BYTES stay in memory; larger files roll over to a temp file. Text
+# extraction and the storage upload both read the spooled copy, so nothing holds
+# a whole large file in memory and the file is received only once.
+CHUNK_SIZE = 256 * 1024
+SPOOL_MEMORY_BYTES = 2 * 1024 * 1024
+SUPPORTED_SUFFIXES = (".txt", ".docx", ".pdf")
+# PDF text kept per document: long CVs are parsed in chunks, and JD parsing cuts its own input
+MAX_TEXT_CHARS = 4 * pdf_text.MAX_CHARS
+
+
+class UploadTooLarge(ValueError):
+    """The upload is bigger than the allowed size."""
+
+
+@dataclass
+class SpooledUpload:
+    """An uploaded file, read once: its name, size, SHA-256 and spooled bytes."""
+    filename: str
+    size: int
+    sha256: str
+    data: Optional[bytes] = None  # the content, while it fits in memory
+    path: Optional[Path] = None  # the temp file it rolled over to otherwise
+    temporary: bool = True  # False for local files (bulk import), which close() keeps
+
+    @property
+    def suffix(self) -> str:
+        return Path(self.filename).suffix.lower()
+
+    def open(self) -> BinaryIO:
+        """A new binary stream over the content."""
+        return open(self.path, "rb") if self.path is not None else io.BytesIO(self.data)
+
+    @contextmanager
+    def storage_body(self) -> Iterator[Union[bytes, BinaryIO]]:
+        """The content as the storage client takes it: bytes, or a file opened for reading."""
+        if self.path is None:
+            yield self.data
+        else:
+            with open(self.path, "rb") as f:
+                yield f
+
+    def close(self) -> None:
+        """Delete the temp file, if the upload rolled over to one."""
+        if self.temporary and self.path is not None and self.path.exists():
+            self.path.unlink()
+
+
+async def spool_upload(file: UploadFile, max_bytes: int) -> SpooledUpload:
+    """Read an upload in chunks, hashing it, and fail as soon as it passes max_bytes."""
+    filename = Path(file.filename or "").name
+    if Path(filename).suffix.lower() not in SUPPORTED_SUFFIXES:
+        raise ValueError(f"Unsupported file type: {Path(filename).suffix or filename}")
+    limit_message = f"{filename} is larger than the {max_bytes // (1024 * 1024)} MB upload limit."
+    if file.size is not None and file.size > max_bytes:
+        raise UploadTooLarge(limit_message)
+
+    digest = hashlib.sha256()
+    buffer = io.BytesIO()
+    spill = None
+    size = 0
+    try:
+        while True:
+            chunk = await file.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLarge(limit_message)
+            digest.update(chunk)
+            if spill is None and size > SPOOL_MEMORY_BYTES:
+                spill = tempfile.NamedTemporaryFile(delete=False, suffix=Path(filename).suffix)
+                spill.write(buffer.getvalue())
+                buffer = None
+            (spill or buffer).write(chunk)
+    except BaseException:
+        if spill is not None:
+            spill.close()
+            os.unlink(spill.name)
+        raise
+
+    if spill is None:
+        return SpooledUpload(filename=filename, size=size, sha256=digest.hexdigest(), data=buffer.getvalue())
+    spill.close()
+    return SpooledUpload(filename=filename, size=size, sha256=digest.hexdigest(), path=Path(spill.name))
+
+
+def local_upload(path: Path, max_bytes: int) -> SpooledUpload:
+    """A file on disk as an upload (bulk import): hashed in chunks, read in place."""
+    path = Path(path)
+    if path.suffix.lower() not in SUPPORTED_SUFFIXES:
+        raise ValueError(f"Unsupported file type: {path.suffix or path.name}")
+    size = path.stat().st_size
+    if size > max_bytes:
+        raise UploadTooLarge(f"{path.name} is larger than the {max_bytes // (1024 * 1024)} MB upload limit.")
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return SpooledUpload(filename=path.name, size=size, sha256=digest.hexdigest(), path=path, temporary=False)
+
+
+# --- Text Extraction Logic (Shared) ---
+# CPU-bound; the API and bulk imports run it in the extraction process pool
+# (app/services/extraction_pool.py) rather than in the serving process.
+@tracing.traced("extract_text")
+def extract_text(upload: SpooledUpload) -> str:
+    ext = upload.suffix
+    if ext == ".pdf":
+        # Opened in place: by path when spooled to disk, else from the bytes in memory
+        return pdf_text.extract_pdf_text(upload.path if upload.path is not None else upload.data,
+                                         max_chars=MAX_TEXT_CHARS).strip()
+    with upload.open() as f:
+        if ext == ".txt":
+            return f.read().decode("utf-8", errors="ignore")
+        elif ext == ".docx":
+            return docx2txt.process(f) or ""
+    raise ValueError(f"Unsupported file type: {ext}")
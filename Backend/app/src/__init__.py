@@ -1,6 +1,7 @@
 from .modules.jd_parser import JobDescriptionParser, PDFProcessor
 from .modules.candidate_retrieval import PDLAPIClient, CandidateConverter, PDLQueryBuilder
 from .modules.candidate_ranking import CandidateRanker
+from .modules.resume_parser import ResumeExtractor
 
 __all__ = [
     'JobDescriptionParser',
@@ -8,6 +9,7 @@ __all__ = [
     'PDLAPIClient',
     'CandidateConverter',
     'PDLQueryBuilder',
-    'CandidateRanker'
+    'CandidateRanker',
+    'ResumeExtractor'
 ]
 
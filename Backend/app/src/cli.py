@@ -7,7 +7,6 @@ import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
-import PyPDF2
 import re
 import logging
 # Handle docx import with proper error handling
@@ -21,10 +20,40 @@ except ImportError:
 from src.config.settings import get_settings, get_logger, validate_config
 from src.workflows.recruitment_workflow import RecruitmentWorkflow, workflow_monitor
 from src.modules.jd_parser.parser import PDFProcessor
+from src.modules.resume_parser import ResumeExtractor
+from src.core import metrics, serialization, tracing
+from src.core.llm_gateway import Priority, get_gateway
 from src.core.models import WorkflowResult, CandidateProfile
+from src.core.pdf_text import extract_pdf_text
+from src.storage.jd_artifacts import JDArtifact
+from src.storage.result_sink import get_result_sink
 
 logger = get_logger()
 
+# Flat resume fields used by the CLI, and the extractor field each is read from
+RESUME_FIELDS = {
+    'full_name': 'full_name',
+    'email': 'emails',
+    'phone': 'phones',
+    'location': 'location',
+    'current_title': 'current_title',
+    'current_company': 'current_company',
+    'linkedin_url': 'linkedin_url',
+    'skills': 'skills',
+    'education': 'education',
+}
+RESUME_FIELD_PROMPTS = {
+    'full_name': '"Full name"',
+    'email': '"Email address"',
+    'phone': '"Phone number"',
+    'location': '"City, State/Country"',
+    'current_title': '"Current job title"',
+    'current_company': '"Current company"',
+    'linkedin_url': '"LinkedIn profile URL with https:// prefix"',
+    'skills': '["skill1", "skill2", "skill3"]',
+    'education': '["degree1", "degree2"]',
+}
+
 
 class OutputFormatter:
     """Handles various output formats for recruitment results."""
@@ -55,6 +84,9 @@ class OutputFormatter:
         print(f"   Total Candidates Found: {metadata.candidates_found}")
         print(f"   Candidates Analyzed: {metadata.candidates_ranked}")
         print(f"   Processing Time: {metadata.processing_time_seconds:.1f} seconds")
+        print(f"   API Calls: {metadata.api_calls_made} ({metadata.llm_tokens_used} LLM tokens, ~${metadata.llm_cost_usd:.2f})")
+        if metadata.fallbacks_used:
+            print(f"   Fallback Results: {metadata.fallbacks_used}")
         
         if not result.rankings:
             print(f"\n NO QUALIFIED CANDIDATES FOUND")
@@ -271,105 +303,28 @@ class OutputFormatter:
             
             data['candidates'].append(candidate_data)
         
-        with open(filepath, 'w', encoding='utf-8') as jsonfile:
-            json.dump(data, jsonfile, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb') as jsonfile:
+            jsonfile.write(serialization.dumps_bytes(data, indent=True))
 
     @staticmethod
-    def save_post_discovery_results(final_rankings, job_data, discovery_data: Optional[Dict] = None) -> None:
-        """Save final results after discovery in both CSV and JSON formats."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create results directory if it doesn't exist
-        results_dir = Path("results")
-        results_dir.mkdir(exist_ok=True)
-        
-        # Save CSV
-        csv_path = results_dir / f"post_discovery_results_{timestamp}.csv"
-        OutputFormatter._save_discovery_csv(final_rankings, job_data, csv_path, discovery_data)
-        
-        # Save JSON
-        json_path = results_dir / f"post_discovery_results_{timestamp}.json"
-        OutputFormatter._save_discovery_json(final_rankings, job_data, json_path, discovery_data)
+    def save_post_discovery_results(final_rankings, job_data, discovery_data: Optional[Dict] = None,
+                                    run_id: Optional[str] = None) -> str:
+        """Stream final results after discovery to the configured result sink."""
+        sink = get_result_sink()
+        batch_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        print(f"\n POST-DISCOVERY RESULTS SAVED:")
-        print(f"    CSV: {csv_path}")
-        print(f"    JSON: {json_path}")
+        source_counts = {'pdl_api': 0, 'uploaded_resume': 0, 'gemini_discovery': 0}
+        records = []
+        for rank, ranking in enumerate(final_rankings, 1):
+            record = OutputFormatter._discovery_record(rank, ranking)
+            record['batch_id'] = batch_id
+            source_counts[record['source']] += 1
+            records.append(record)
+        sink.write_many('post_discovery_rankings', records)
         
-        return str(csv_path), str(json_path)
-    
-    @staticmethod
-    def _save_discovery_csv(final_rankings, job_data, filepath: Path, discovery_data: Optional[Dict] = None) -> None:
-        """Save discovery results to CSV format."""
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'rank', 'candidate_name', 'current_title', 'current_company', 
-                'linkedin_url', 'email', 'phone', 'location', 'overall_score', 
-                'technical_skills', 'experience_relevance', 'seniority_match', 
-                'education_fit', 'industry_experience', 'location_compatibility',
-                'confidence_level', 'strengths', 'concerns', 'recommendations',
-                'match_explanation', 'key_differentiators', 'interview_focus_areas', 
-                'source', 'source_icon', 'discovery_iteration'
-            ]
-            
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for rank, ranking in enumerate(final_rankings, 1):
-                # Determine source and discovery iteration
-                source = "PDL API"
-                source_icon = ""
-                discovery_iteration = 0
-                
-                if ' UPLOADED RESUME CANDIDATE' in ranking.match_explanation:
-                    source = "Uploaded Resume"
-                    source_icon = ""
-                elif ' GEMINI 2.5 PRO DISCOVERED CANDIDATE' in ranking.match_explanation:
-                    source = "Gemini 2.5 Pro Discovery"
-                    source_icon = ""
-                    # Try to extract iteration number from explanation
-                    if 'iteration' in ranking.match_explanation.lower():
-                        import re
-                        match = re.search(r'iteration (\d+)', ranking.match_explanation.lower())
-                        if match:
-                            discovery_iteration = int(match.group(1))
-                
-                # Get location string
-                location_str = ""
-                if hasattr(ranking, 'location') and ranking.location:
-                    location_str = f"{ranking.location.city}, {ranking.location.state}, {ranking.location.country}"
-                
-                writer.writerow({
-                    'rank': rank,
-                    'candidate_name': ranking.candidate_name,
-                    'current_title': ranking.current_title or '',
-                    'current_company': ranking.current_company or '',
-                    'linkedin_url': ranking.linkedin_url or '',
-                    'email': getattr(ranking, 'email', '') or '',
-                    'phone': getattr(ranking, 'phone', '') or '',
-                    'location': location_str,
-                    'overall_score': ranking.overall_score,
-                    'technical_skills': ranking.dimension_scores.technical_skills,
-                    'experience_relevance': ranking.dimension_scores.experience_relevance,
-                    'seniority_match': ranking.dimension_scores.seniority_match,
-                    'education_fit': ranking.dimension_scores.education_fit,
-                    'industry_experience': ranking.dimension_scores.industry_experience,
-                    'location_compatibility': ranking.dimension_scores.location_compatibility,
-                    'confidence_level': ranking.confidence_level.value,
-                    'strengths': '; '.join(ranking.strengths),
-                    'concerns': '; '.join(ranking.concerns),
-                    'recommendations': '; '.join(ranking.recommendations),
-                    'match_explanation': ranking.match_explanation,
-                    'key_differentiators': '; '.join(ranking.key_differentiators),
-                    'interview_focus_areas': '; '.join(ranking.interview_focus_areas),
-                    'source': source,
-                    'source_icon': source_icon,
-                    'discovery_iteration': discovery_iteration
-                })
-    
-    @staticmethod
-    def _save_discovery_json(final_rankings, job_data, filepath: Path, discovery_data: Optional[Dict] = None) -> None:
-        """Save discovery results to JSON format."""
-        data = {
+        sink.write('post_discovery_summary', {
+            'batch_id': batch_id,
+            'timestamp': datetime.now().isoformat(),
             'job_analysis': {
                 'title': job_data.title,
                 'company': job_data.company,
@@ -381,80 +336,57 @@ class OutputFormatter:
                 'required_skills': job_data.required_skills,
                 'experience_level': job_data.experience_level.value if job_data.experience_level else None
             },
-            'discovery_metadata': {
-                'total_candidates': len(final_rankings),
-                'timestamp': datetime.now().isoformat(),
-                'discovery_enabled': discovery_data is not None
-            },
+            'total_candidates': len(final_rankings),
+            'discovery_enabled': discovery_data is not None,
             'discovery_statistics': discovery_data or {},
-            'candidates': []
-        }
+            'source_distribution': source_counts
+        })
         
-        # Count sources
-        source_counts = {'pdl_api': 0, 'uploaded_resume': 0, 'gemini_discovery': 0}
+        print(f"\n POST-DISCOVERY RESULTS RECORDED:")
+        print(f"    Batch: {batch_id}")
+        print(f"    Sink: {sink.describe()}")
         
-        for rank, ranking in enumerate(final_rankings, 1):
-            # Determine source
-            source = "pdl_api"
-            source_icon = ""
-            discovery_iteration = 0
-            
-            if ' UPLOADED RESUME CANDIDATE' in ranking.match_explanation:
-                source = "uploaded_resume"
-                source_icon = ""
-            elif ' GEMINI 2.5 PRO DISCOVERED CANDIDATE' in ranking.match_explanation:
-                source = "gemini_discovery"
-                source_icon = ""
-                # Try to extract iteration number
-                import re
-                match = re.search(r'iteration (\d+)', ranking.match_explanation.lower())
-                if match:
-                    discovery_iteration = int(match.group(1))
-            
-            source_counts[source] += 1
-            
-            candidate_data = {
-                "rank": rank,
-                "candidate_id": ranking.candidate_id,
-                "candidate_name": ranking.candidate_name,
-                "current_title": ranking.current_title,
-                "current_company": ranking.current_company,
-                "linkedin_url": ranking.linkedin_url,
-                "email": getattr(ranking, 'email', None),
-                "phone": getattr(ranking, 'phone', None),
-                "location": {
-                    "city": getattr(ranking, 'location', {}).get('city') if hasattr(ranking, 'location') else None,
-                    "state": getattr(ranking, 'location', {}).get('state') if hasattr(ranking, 'location') else None,
-                    "country": getattr(ranking, 'location', {}).get('country') if hasattr(ranking, 'location') else None
-                },
-                "overall_score": ranking.overall_score,
-                "dimension_scores": {
-                    "technical_skills": ranking.dimension_scores.technical_skills,
-                    "experience_relevance": ranking.dimension_scores.experience_relevance,
-                    "seniority_match": ranking.dimension_scores.seniority_match,
-                    "education_fit": ranking.dimension_scores.education_fit,
-                    "industry_experience": ranking.dimension_scores.industry_experience,
-                    "location_compatibility": ranking.dimension_scores.location_compatibility
-                },
-                "strengths": ranking.strengths,
-                "concerns": ranking.concerns,
-                "recommendations": ranking.recommendations,
-                "confidence_level": ranking.confidence_level.value,
-                "match_explanation": ranking.match_explanation,
-                "key_differentiators": ranking.key_differentiators,
-                "interview_focus_areas": ranking.interview_focus_areas,
-                "source": source,
-                "source_icon": source_icon,
-                "discovery_iteration": discovery_iteration
-            }
-            
-            data['candidates'].append(candidate_data)
+        return batch_id
+    
+    @staticmethod
+    def _discovery_record(rank: int, ranking) -> Dict[str, Any]:
+        """Build a flat result record for one post-discovery ranking."""
+        # Determine source and discovery iteration
+        source = "pdl_api"
+        discovery_iteration = 0
         
-        # Add source distribution
-        data['source_distribution'] = source_counts
+        if ' UPLOADED RESUME CANDIDATE' in ranking.match_explanation:
+            source = "uploaded_resume"
+        elif ' GEMINI 2.5 PRO DISCOVERED CANDIDATE' in ranking.match_explanation:
+            source = "gemini_discovery"
+            match = re.search(r'iteration (\d+)', ranking.match_explanation.lower())
+            if match:
+                discovery_iteration = int(match.group(1))
         
-        with open(filepath, 'w', encoding='utf-8') as jsonfile:
-            json.dump(data, jsonfile, indent=2, ensure_ascii=False)
+        return {
+            "rank": rank,
+            "candidate_id": ranking.candidate_id,
+            "candidate_name": ranking.candidate_name,
+            "current_title": ranking.current_title,
+            "current_company": ranking.current_company,
+            "linkedin_url": ranking.linkedin_url,
+            "overall_score": ranking.overall_score,
+            "technical_skills": ranking.dimension_scores.technical_skills,
+            "experience_relevance": ranking.dimension_scores.experience_relevance,
+            "seniority_match": ranking.dimension_scores.seniority_match,
+            "education_fit": ranking.dimension_scores.education_fit,
+            "industry_experience": ranking.dimension_scores.industry_experience,
+            "location_compatibility": ranking.dimension_scores.location_compatibility,
+            "strengths": ranking.strengths,
+            "concerns": ranking.concerns,
+            "recommendations": ranking.recommendations,
+            "confidence_level": ranking.confidence_level.value,
+            "match_explanation": ranking.match_explanation,
+            "key_differentiators": ranking.key_differentiators,
+            "interview_focus_areas": ranking.interview_focus_areas,
+            "source": source,
+            "discovery_iteration": discovery_iteration
+        }
 
 
 class CLIApplication:
@@ -465,6 +397,8 @@ class CLIApplication:
         self.settings = get_settings()
         self.workflow = RecruitmentWorkflow()
         self.formatter = OutputFormatter()
+        self.resume_extractor = ResumeExtractor()
+        self.jd_artifact: Optional[JDArtifact] = None
     
     def run(self, args: argparse.Namespace) -> int:
         """Run the CLI application with parsed arguments."""
@@ -479,6 +413,9 @@ class CLIApplication:
             if args.performance_metrics:
                 return self._handle_performance_metrics()
             
+            if args.show_run:
+                return self._handle_show_run(args)
+            
             # Validate configuration
             config_validation = validate_config()
             if not config_validation['valid']:
@@ -487,17 +424,26 @@ class CLIApplication:
                     print(f"   • {error}")
                 return 1
             
-            # Get job description
-            job_description_text = self._get_job_description(args)
-            if not job_description_text:
-                print(" Error: No job description provided")
-                return 1
+            # Get job description: a stored JD's artifact, or the text of --jd / --jd-file.
+            # The run fills in what the artifact lacks; discovery reuses its text.
+            if args.jd_id:
+                try:
+                    self.jd_artifact = self.workflow.load_jd_artifact(args.jd_id)
+                except Exception as e:
+                    print(f" Error loading job description {args.jd_id}: {e}")
+                    return 1
+            else:
+                job_description_text = self._get_job_description(args)
+                if not job_description_text:
+                    print(" Error: No job description provided")
+                    return 1
+                self.jd_artifact = JDArtifact(text=job_description_text)
             
             # Run workflow
             print(" Starting recruitment workflow...")
             start_time = datetime.now()
             
-            result = self.workflow.run_workflow(job_description_text, args.max_candidates)
+            result = self.workflow.run_workflow(self.jd_artifact.text, args.max_candidates, jd_artifact=self.jd_artifact)
             
             end_time = datetime.now()
             execution_time = (end_time - start_time).total_seconds()
@@ -556,15 +502,15 @@ class CLIApplication:
                 result.rankings = final_rankings
                 self.formatter.print_executive_summary(result)
                 
-                # Save post-discovery results in both formats
-                csv_path, json_path = self.formatter.save_post_discovery_results(
+                # Record post-discovery results in the configured result sink
+                batch_id = self.formatter.save_post_discovery_results(
                     final_rankings, 
                     result.job_data, 
-                    discovery_data.get('discovery_data', {})
+                    discovery_data.get('discovery_data', {}),
+                    run_id=result.metadata.run_id
                 )
                 
-                logger.info(f"Post-discovery results saved to CSV: {csv_path}")
-                logger.info(f"Post-discovery results saved to JSON: {json_path}")
+                logger.info(f"Post-discovery results recorded as batch {batch_id}")
             
             # Save regular results if requested
             if args.csv or args.json:
@@ -580,6 +526,9 @@ class CLIApplication:
                     source_icon = ""
                 print(f"\n Top Recommendation: {top_candidate.candidate_name} {source_icon} (Score: {top_candidate.overall_score:.3f})")
             
+            if self.workflow.run_store and result.metadata.run_id:
+                print(f" Run saved to history. Re-open it with: --show-run {result.metadata.run_id}")
+            
             print(f"\n Recruitment workflow completed successfully in {execution_time:.1f} seconds!")
             return 0
             
@@ -671,19 +620,24 @@ class CLIApplication:
                 logger.error(f"Could not extract text from file: {file_path}")
                 return None
             
-            logger.info(f"Extracting text from PDF: {file_path}")
-            logger.info(f"Successfully extracted {len(text_content)} characters using PyPDF2")
+            logger.info(f"Extracted {len(text_content)} characters from {file_path}")
             
-            # Parse with AI
-            candidate_data = self._parse_resume_with_ai(text_content, job_data)
-            if not candidate_data:
-                # Fallback parsing
-                candidate_data = self._parse_resume_fallback(text_content)
+            # Heuristic pass first; the LLM only fills the fields it could not
+            extraction = self.resume_extractor.extract(text_content)
+            candidate_data = self._candidate_data_from_extraction(extraction)
+            missing = [key for key, name in RESUME_FIELDS.items() if not extraction.is_confident(name)]
+            if missing:
+                ai_data = self._parse_resume_with_ai(extraction, missing, job_data)
+                if ai_data:
+                    candidate_data.update({key: ai_data[key] for key in missing if ai_data.get(key)})
+            else:
+                logger.info(f"Resume parsed without AI: {file_path}")
+            metrics.record_fast_path('resume_parser', complete=not missing)
             
             # Create candidate profile
             candidate = self._create_candidate_from_resume_data(candidate_data, file_path)
             
-            logger.info(f" AI parsed resume: {candidate.full_name}")
+            logger.info(f" Parsed resume: {candidate.full_name}")
             return candidate
             
         except Exception as e:
@@ -715,12 +669,7 @@ class CLIApplication:
     def _extract_text_from_pdf(self, file_path: str) -> Optional[str]:
         """Extract text from PDF file."""
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
+            return extract_pdf_text(file_path).strip()
         except Exception as e:
             logger.error(f"Error extracting PDF text: {e}")
             return None
@@ -750,57 +699,63 @@ class CLIApplication:
             logger.error(f"Error extracting TXT text: {e}")
             return None
     
-    # In cli.py, REPLACE the existing function with this one:
+    def _candidate_data_from_extraction(self, extraction) -> Dict[str, Any]:
+        """Flat candidate fields from a heuristic resume extraction."""
+        emails = extraction.get('emails') or []
+        phones = extraction.get('phones') or []
+        education = [
+            ', '.join(part for part in (entry['degree'] + (f" in {entry['field']}" if entry['field'] else ''),
+                                        entry['institution'], entry['end_date']) if part)
+            for entry in extraction.get('education') or []
+        ]
+        return {
+            "full_name": extraction.get('full_name') or "Unknown",
+            "email": emails[0] if emails else None,
+            "phone": phones[0] if phones else None,
+            "location": extraction.get('location') or "Not specified",
+            "current_title": extraction.get('current_title') or "Not specified",
+            "current_company": extraction.get('current_company') or "Not specified",
+            "linkedin_url": extraction.get('linkedin_url'),
+            "skills": extraction.get('skills') or [],
+            "education": education
+        }
 
-    def _parse_resume_with_ai(self, text_content: str, job_data) -> Optional[Dict[str, Any]]:
-        """Parse resume using OpenAI."""
+    def _parse_resume_with_ai(self, extraction, fields: List[str], job_data) -> Optional[Dict[str, Any]]:
+        """Ask the LLM for just `fields`, showing it only the resume sections they come from."""
         try:
-            import openai
-            
-            client = openai.OpenAI()
-            
+            schema = ',\n'.join(f'    "{key}": {RESUME_FIELD_PROMPTS[key]}' for key in fields)
+            excerpt = extraction.excerpt([RESUME_FIELDS[key] for key in fields])
             prompt = f"""
-            Parse the following resume and extract structured information in JSON format.
+            Extract the following fields from this resume excerpt in JSON format.
             
             Job Context:
             - Position: {job_data.title}
-            - Company: {job_data.company or 'Not specified'}
             - Required Skills: {', '.join(job_data.required_skills[:5]) if job_data.required_skills else 'Not specified'}
             
-            Resume Text:
-            {text_content[:8000]}  # Limit to prevent token overflow
+            Resume Excerpt:
+            {excerpt}
             
-            Extract the following information in JSON format:
+            Return only these keys:
             {{
-                "full_name": "Full name",
-                "email": "Email address",
-                "phone": "Phone number",
-                "location": "City, State/Country",
-                "current_title": "Current job title",
-                "current_company": "Current company",
-                "linkedin_url": "LinkedIn profile URL with https:// prefix",
-                "skills": ["skill1", "skill2", "skill3"],
-                "education": ["degree1", "degree2"]
+            {schema}
             }}
             
             Important:
-            - Use "full_name" not "name"
             - LinkedIn URL must start with "https://" or "http://"
-            - If LinkedIn URL is incomplete, add "https://" prefix
-            - Only include the fields listed above
+            - Use null for fields that are not in the excerpt
             
             Return only valid JSON, no additional text.
             """
             
-            response = client.chat.completions.create(
-                model="gpt-4o",
+            content = get_gateway().complete(
+                route='extraction',
                 messages=[{"role": "user", "content": prompt}],
+                operation='parse_resume',
+                priority=Priority.BULK,
                 temperature=0.1,
-                max_tokens=4000
+                max_tokens=1000
             )
             
-            content = response.choices[0].message.content.strip()
-            
             # Clean up the response content
             if content.startswith('```json'):
                 content = content[7:]
@@ -840,50 +795,10 @@ class CLIApplication:
                 raise ValueError(f"Invalid JSON response from AI")
                 
         except Exception as e:
-            logger.warning(f"AI resume parsing failed: {e}, using fallback")
+            logger.warning(f"AI resume parsing failed: {e}, keeping heuristic fields")
+            metrics.record_fallback('resume_parser', type(e).__name__)
             return None
     
-    def _parse_resume_fallback(self, text_content: str) -> Dict[str, Any]:
-        """Fallback resume parsing using simple text extraction."""
-        import re
-        
-        # Basic extraction patterns
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        phone_pattern = r'[\+]?[1-9]?[0-9]{7,15}'
-        
-        # Extract basic information
-        candidate_data = {
-            "full_name": "Unknown",
-            "email": None,
-            "phone": None,
-            "location": "Not specified",
-            "current_title": "Not specified",
-            "current_company": "Not specified",
-            "linkedin_url": None,
-            "skills": [],
-            "education": []
-        }
-        
-        # Extract email
-        email_matches = re.findall(email_pattern, text_content)
-        if email_matches:
-            candidate_data["email"] = email_matches[0]
-        
-        # Extract phone
-        phone_matches = re.findall(phone_pattern, text_content)
-        if phone_matches:
-            candidate_data["phone"] = phone_matches[0]
-        
-        # Try to extract name from first few lines
-        lines = text_content.split('\n')[:5]
-        for line in lines:
-            line = line.strip()
-            if len(line) > 2 and len(line) < 50 and not '@' in line and not any(char.isdigit() for char in line):
-                candidate_data["full_name"] = line
-                break
-        
-        return candidate_data
-    
 
     # You will need to import the 're' and 'logging' modules at the top of cli.py
     logger = get_logger()
@@ -1037,7 +952,8 @@ class CLIApplication:
                 result.job_data, 
                 all_candidates,
                 jd_file_path=args.jd_file,
-                prompt_addon=args.discovery_prompt_addon
+                prompt_addon=args.discovery_prompt_addon,
+                jd_text=self.jd_artifact.text if self.jd_artifact else None
             )
             
             # Display discovery report
@@ -1134,6 +1050,31 @@ class CLIApplication:
         
         return 0
     
+    def _handle_show_run(self, args: argparse.Namespace) -> int:
+        """Re-open a stored workflow run from the run store instead of re-running it."""
+        run_store = self.workflow.run_store
+        if not run_store:
+            print(" Run history is not configured. Set DATABASE_URL to enable it.")
+            return 1
+        
+        try:
+            result = run_store.load_run(args.show_run)
+        except ValueError:
+            print(f" Invalid run id: {args.show_run}")
+            return 1
+        
+        if result is None:
+            print(f" No stored run found with id: {args.show_run}")
+            return 1
+        
+        print(f" Loaded stored run {args.show_run} ({result.metadata.timestamp:%Y-%m-%d %H:%M:%S})")
+        self.formatter.print_executive_summary(result)
+        
+        if args.csv or args.json:
+            self._save_results(result, args)
+        
+        return 0
+    
     def _get_job_description(self, args: argparse.Namespace) -> Optional[str]:
         """Get job description from various sources."""
         if args.jd_file:
@@ -1177,6 +1118,8 @@ Examples:
   %(prog)s --jd "Software Engineer position..." --max-candidates 10
   %(prog)s --jd-file job_description.pdf --csv --json
   %(prog)s --jd-file job.pdf --with-discovery --max-candidates 5
+  %(prog)s --jd-id 3f2b9c1a-... --with-discovery
+  %(prog)s --show-run 6f1c2d3e-... --csv
   %(prog)s --config-check
   %(prog)s --workflow-status
         """
@@ -1186,6 +1129,10 @@ Examples:
     jd_group = parser.add_mutually_exclusive_group(required=True)
     jd_group.add_argument("--jd", type=str, help="Job description text")
     jd_group.add_argument("--jd-file", type=str, help="Path to job description file (PDF)")
+    jd_group.add_argument("--jd-id", type=str,
+                         help="ID of a job description uploaded through the API; reuses its stored text, parse and search terms")
+    jd_group.add_argument("--show-run", type=str, metavar="RUN_ID",
+                         help="Re-open a stored workflow run instead of running a new search")
     
     # Search parameters
     parser.add_argument("--max-candidates", type=int, default=10, 
@@ -1215,6 +1162,11 @@ Examples:
     # Logging options
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     parser.add_argument("--quiet", action="store_true", help="Suppress non-essential output")
+    parser.add_argument("--metrics-port", type=int, default=get_settings().metrics_port,
+                       help="Serve Prometheus metrics on this port while running (default: METRICS_PORT)")
+    parser.add_argument("--trace-exporter", choices=["none", "console", "file", "otlp"],
+                       default=get_settings().trace_exporter,
+                       help="Export tracing spans (default: TRACE_EXPORTER; file writes to TRACE_FILE)")
     
     return parser
 
@@ -1232,6 +1184,12 @@ def main() -> int:
         import logging
         logging.getLogger().setLevel(logging.WARNING)
     
+    if args.metrics_port:
+        metrics.start_server(args.metrics_port)
+    
+    settings = get_settings()
+    tracing.configure(args.trace_exporter, settings.trace_service_name, settings.trace_file)
+    
     # Create and run CLI application
     app = CLIApplication()
     return app.run(args)
@@ -0,0 +1,40 @@
+"""
+Clients for the external providers (OpenAI, Gemini, People Data Labs).
+
+Every module that talks to a provider gets its client or endpoint from here,
+so the base URLs come from settings in one place; OpenAI chat completions go
+through src.core.llm_gateway, which builds its client with openai_client().
+Pointing OPENAI_BASE_URL, GEMINI_BASE_URL and PDL_BASE_URL at a local stand-in
+(see benchmarks/mock_server.py) runs the whole pipeline without live keys.
+"""
+
+from typing import Optional
+
+from .settings import get_settings
+
+
+def openai_client(**kwargs):
+    """Create an OpenAI SDK client for the configured key and base URL."""
+    import openai
+
+    settings = get_settings()
+    return openai.OpenAI(api_key=settings.openai_api_key, base_url=settings.openai_base_url, **kwargs)
+
+
+def gemini_client(api_key: Optional[str] = None):
+    """Create a google-genai client, honouring GEMINI_BASE_URL when set."""
+    from google import genai
+
+    settings = get_settings()
+    kwargs = {}
+    if settings.gemini_base_url:
+        kwargs['http_options'] = {'base_url': settings.gemini_base_url}
+    return genai.Client(api_key=api_key, **kwargs)
+
+
+def pdl_base_url() -> str:
+    """People Data Labs API root, without a trailing slash."""
+    return get_settings().pdl_base_url.rstrip('/')
+
+
+__all__ = ['openai_client', 'gemini_client', 'pdl_base_url']
@@ -10,9 +10,11 @@ import os
 import logging
 from pathlib import Path
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from dotenv import load_dotenv
 
+from src.core.tracing import TraceContextFilter
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -29,6 +31,10 @@ class RecruitmentSettings(BaseModel):
     openai_temperature: float = Field(default_factory=lambda: float(os.getenv("OPENAI_TEMPERATURE", "0.1")))
     openai_max_tokens: int = Field(default_factory=lambda: int(os.getenv("OPENAI_MAX_TOKENS", "3000")))
     openai_timeout: int = Field(default_factory=lambda: int(os.getenv("OPENAI_TIMEOUT", "60")))
+    openai_base_url: str = Field(default_factory=lambda: os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"))
+    
+    # Gemini Configuration (unset base URL means the SDK default endpoint)
+    gemini_base_url: Optional[str] = Field(default_factory=lambda: os.getenv("GEMINI_BASE_URL") or None)
     
     # PDL Configuration
     pdl_base_url: str = Field(default_factory=lambda: os.getenv("PDL_BASE_URL", "https://api.peopledatalabs.com/v5/"))
@@ -45,6 +51,11 @@ class RecruitmentSettings(BaseModel):
     enable_csv_export: bool = Field(default_factory=lambda: os.getenv("ENABLE_CSV_EXPORT", "true").lower() == "true")
     enable_json_export: bool = Field(default_factory=lambda: os.getenv("ENABLE_JSON_EXPORT", "true").lower() == "true")
     
+    # Result Sink Configuration (none, jsonl, parquet, database)
+    result_sink: str = Field(default_factory=lambda: os.getenv("RESULT_SINK", "jsonl"))
+    result_sink_max_bytes: int = Field(default_factory=lambda: int(os.getenv("RESULT_SINK_MAX_BYTES", str(50 * 1024 * 1024))))
+    result_sink_max_files: int = Field(default_factory=lambda: int(os.getenv("RESULT_SINK_MAX_FILES", "10")))
+    
     # Logging Configuration
     log_level: str = Field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
     log_file: Optional[str] = Field(default_factory=lambda: os.getenv("LOG_FILE", "recruitment_system.log"))
@@ -56,18 +67,73 @@ class RecruitmentSettings(BaseModel):
     enable_caching: bool = Field(default_factory=lambda: os.getenv("ENABLE_CACHING", "false").lower() == "true")
     cache_ttl_seconds: int = Field(default_factory=lambda: int(os.getenv("CACHE_TTL_SECONDS", "3600")))
     
+    # Run History Configuration
+    database_url: Optional[str] = Field(default_factory=lambda: os.getenv("DATABASE_URL"))
+    persist_workflow_runs: bool = Field(default_factory=lambda: os.getenv("PERSIST_WORKFLOW_RUNS", "true").lower() == "true")
+    
+    # Metrics Configuration (Prometheus endpoint for CLI runs; the API serves /metrics)
+    metrics_port: Optional[int] = Field(default_factory=lambda: int(os.getenv("METRICS_PORT")) if os.getenv("METRICS_PORT") else None)
+    
+    # Tracing Configuration (none, console, file, otlp; the OTLP endpoint comes from OTEL_EXPORTER_OTLP_ENDPOINT)
+    trace_exporter: str = Field(default_factory=lambda: os.getenv("TRACE_EXPORTER", "none"))
+    trace_file: str = Field(default_factory=lambda: os.getenv("TRACE_FILE", "traces.jsonl"))
+    trace_service_name: str = Field(default_factory=lambda: os.getenv("OTEL_SERVICE_NAME", "recruitment-pipeline"))
+    
+    # LLM Gateway Configuration (per-model budgets; defaults are OpenAI's tier-1 gpt-4o limits, 0 disables a limit)
+    llm_requests_per_minute: int = Field(default_factory=lambda: int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500")))
+    llm_tokens_per_minute: int = Field(default_factory=lambda: int(os.getenv("LLM_TOKENS_PER_MINUTE", "30000")))
+    llm_max_retries: int = Field(default_factory=lambda: int(os.getenv("LLM_MAX_RETRIES", "4")))
+    
+    # LLM Routing Configuration (see src/core/llm_backends.py)
+    llm_ranking_model: str = Field(default_factory=lambda: os.getenv("LLM_RANKING_MODEL") or os.getenv("OPENAI_MODEL", "gpt-4o"))
+    llm_extraction_model: str = Field(default_factory=lambda: os.getenv("LLM_EXTRACTION_MODEL", "gpt-4o-mini"))
+    llm_discovery_fallback_model: str = Field(default_factory=lambda: os.getenv("LLM_DISCOVERY_FALLBACK_MODEL", "gpt-4o-search-preview"))
+    
+    # Local Model Configuration (llama.cpp server URL or in-process GGUF file; used for simple extraction)
+    local_llm_base_url: Optional[str] = Field(default_factory=lambda: os.getenv("LOCAL_LLM_BASE_URL") or None)
+    local_llm_model_path: Optional[str] = Field(default_factory=lambda: os.getenv("LOCAL_LLM_MODEL_PATH") or None)
+    local_llm_model: str = Field(default_factory=lambda: os.getenv("LOCAL_LLM_MODEL", "local"))
+    local_llm_context: int = Field(default_factory=lambda: int(os.getenv("LOCAL_LLM_CONTEXT", "8192")))
+    llm_local_extraction: bool = Field(default_factory=lambda: os.getenv("LLM_LOCAL_EXTRACTION", "false").lower() == "true")
+    
+    # OCR Configuration (scanned PDF pages; local tesseract, results cached per page image; 0 workers means one per core, up to 4)
+    ocr_enabled: bool = Field(default_factory=lambda: os.getenv("OCR_ENABLED", "true").lower() == "true")
+    ocr_languages: str = Field(default_factory=lambda: os.getenv("OCR_LANGUAGES", "eng"))
+    ocr_dpi: int = Field(default_factory=lambda: int(os.getenv("OCR_DPI", "200")))
+    ocr_max_pages: int = Field(default_factory=lambda: int(os.getenv("OCR_MAX_PAGES", "10")))
+    ocr_workers: int = Field(default_factory=lambda: int(os.getenv("OCR_WORKERS", "0")))
+    ocr_cache_dir: str = Field(default_factory=lambda: os.getenv("OCR_CACHE_DIR", "./.cache/ocr"))
+
     # Performance Configuration
     concurrent_ranking_limit: int = Field(default_factory=lambda: int(os.getenv("CONCURRENT_RANKING_LIMIT", "5")))
     request_delay_seconds: float = Field(default_factory=lambda: float(os.getenv("REQUEST_DELAY_SECONDS", "0.1")))
     
-    @validator('log_level')
+    @field_validator('log_level')
+    @classmethod
     def validate_log_level(cls, v):
         valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
         if v.upper() not in valid_levels:
             raise ValueError(f'Log level must be one of: {valid_levels}')
         return v.upper()
     
-    @validator('default_output_dir')
+    @field_validator('result_sink')
+    @classmethod
+    def validate_result_sink(cls, v):
+        valid_sinks = ['none', 'jsonl', 'parquet', 'database']
+        if v.lower() not in valid_sinks:
+            raise ValueError(f'Result sink must be one of: {valid_sinks}')
+        return v.lower()
+    
+    @field_validator('trace_exporter')
+    @classmethod
+    def validate_trace_exporter(cls, v):
+        valid_exporters = ['none', 'console', 'file', 'otlp']
+        if v.lower() not in valid_exporters:
+            raise ValueError(f'Trace exporter must be one of: {valid_exporters}')
+        return v.lower()
+    
+    @field_validator('default_output_dir')
+    @classmethod
     def validate_output_dir(cls, v):
         # Create directory if it doesn't exist
         Path(v).mkdir(parents=True, exist_ok=True)
@@ -88,17 +154,19 @@ class LoggingConfig:
         # Clear existing handlers
         logger.handlers.clear()
         
-        # Create formatter
+        # Create formatter; trace_id ties each line to its tracing span ('-' outside a trace)
         formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            '%(asctime)s - %(name)s - %(levelname)s - [trace=%(trace_id)s] - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
+        trace_filter = TraceContextFilter()
         
         # Console handler
         if settings.enable_console_logging:
             console_handler = logging.StreamHandler()
             console_handler.setLevel(getattr(logging, settings.log_level))
             console_handler.setFormatter(formatter)
+            console_handler.addFilter(trace_filter)
             logger.addHandler(console_handler)
         
         # File handler
@@ -107,6 +175,7 @@ class LoggingConfig:
                 file_handler = logging.FileHandler(settings.log_file, encoding='utf-8')
                 file_handler.setLevel(getattr(logging, settings.log_level))
                 file_handler.setFormatter(formatter)
+                file_handler.addFilter(trace_filter)
                 logger.addHandler(file_handler)
             except Exception as e:
                 logger.warning(f"Could not set up file logging: {e}")
@@ -183,7 +252,13 @@ class ConfigurationManager:
             except ImportError:
                 validation_results['warnings'].append("PyPDF2 not installed - PDF support limited")
                 validation_results['settings']['pdf_support'] = False
-            
+
+            if settings.ocr_enabled:
+                from src.core.ocr import OCR_AVAILABLE
+                validation_results['settings']['ocr_support'] = OCR_AVAILABLE
+                if not OCR_AVAILABLE:
+                    validation_results['warnings'].append("pytesseract or the tesseract binary not installed - scanned PDFs yield no text")
+
             # Set overall validity
             validation_results['valid'] = len(validation_results['errors']) == 0
             
@@ -240,10 +315,10 @@ class ConfigurationManager:
     def export_config(self) -> Dict[str, Any]:
         """Export current configuration (excluding sensitive data)."""
         settings = self.settings
-        config_dict = settings.dict()
+        config_dict = settings.model_dump()
         
         # Mask sensitive information
-        sensitive_keys = ['openai_api_key', 'pdl_api_key']
+        sensitive_keys = ['openai_api_key', 'pdl_api_key', 'database_url']
         for key in sensitive_keys:
             if key in config_dict and config_dict[key]:
                 config_dict[key] = f"***{config_dict[key][-4:]}" if len(config_dict[key]) > 4 else "***"
@@ -0,0 +1,222 @@
+"""
+LLM backends and the routing policy that picks one per task.
+
+Callers name a route (what the call is for) instead of a model:
+
+    ranking            strong model; ranking quality drives the product
+    extraction         cheap/fast model for structured extraction (resumes,
+                       JD parsing, search terms, candidates in Gemini text)
+    simple_extraction  a handful of flat fields (JD location, job type,
+                       experience, summary); the local model when one is
+                       configured, else the extraction model
+    discovery          web-grounded search model, used when Gemini discovery
+                       fails or is not configured
+
+Each route resolves to an ordered list of targets (backend + model); the
+gateway tries them in order, so a local model that is down falls through to
+the hosted one. Backends:
+
+    openai   OpenAI, or any OpenAI-compatible server at OPENAI_BASE_URL
+    local    a local CPU model, either a llama.cpp ``llama-server`` (or other
+             OpenAI-compatible server) at LOCAL_LLM_BASE_URL, or a GGUF file
+             loaded in-process with llama-cpp-python (LOCAL_LLM_MODEL_PATH)
+
+Local backends are not rate limited and cost nothing; hosted calls are priced
+from PRICING_PER_MILLION_TOKENS.
+"""
+
+import abc
+import logging
+import threading
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core import metrics
+
+logger = logging.getLogger(__name__)
+
+ROUTES = ('ranking', 'extraction', 'simple_extraction', 'discovery')
+
+# USD per million (input, output) tokens; the longest matching prefix wins
+PRICING_PER_MILLION_TOKENS = {
+    'gpt-4o-mini': (0.15, 0.60),
+    'gpt-4o-search-preview': (2.50, 10.00),
+    'gpt-4o-mini-search-preview': (0.15, 0.60),
+    'gpt-4o': (2.50, 10.00),
+    'gpt-4.1-nano': (0.10, 0.40),
+    'gpt-4.1-mini': (0.40, 1.60),
+    'gpt-4.1': (2.00, 8.00),
+    'gemini-2.5-flash': (0.30, 2.50),
+    'gemini-2.5-pro': (1.25, 10.00),
+}
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """USD cost of a hosted call; 0 for models without a known price."""
+    matches = [name for name in PRICING_PER_MILLION_TOKENS if model.startswith(name)]
+    if not matches:
+        return 0.0
+    input_price, output_price = PRICING_PER_MILLION_TOKENS[max(matches, key=len)]
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+class LLMBackend(abc.ABC):
+    """A chat-completion provider. Responses have the OpenAI SDK shape."""
+
+    name = 'base'
+    rate_limited = True
+
+    @abc.abstractmethod
+    def chat(self, model: str, messages: List[Dict[str, Any]], **params) -> Any:
+        """Run one chat completion on ``model``."""
+
+    def cost(self, model: str, response: Any) -> float:
+        return estimate_cost(model, *metrics.usage_tokens(response))
+
+
+class OpenAIBackend(LLMBackend):
+    """OpenAI or any OpenAI-compatible endpoint (vLLM, llama-server, ...)."""
+
+    def __init__(self, client_factory: Callable[[], Any], name: str = 'openai',
+                 rate_limited: bool = True, priced: bool = True):
+        self._client_factory = client_factory
+        self._client = None
+        self.name = name
+        self.rate_limited = rate_limited
+        self.priced = priced
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = self._client_factory()
+        return self._client
+
+    def chat(self, model: str, messages: List[Dict[str, Any]], **params) -> Any:
+        return self.client.chat.completions.create(model=model, messages=messages, **params)
+
+    def cost(self, model: str, response: Any) -> float:
+        return super().cost(model, response) if self.priced else 0.0
+
+
+class LlamaCppBackend(LLMBackend):
+    """GGUF model run in-process on the CPU with llama-cpp-python."""
+
+    name = 'local'
+    rate_limited = False
+
+    # create_chat_completion() options; others (timeout, ...) are dropped
+    SUPPORTED_PARAMS = ('temperature', 'max_tokens', 'response_format', 'top_p', 'stop', 'seed')
+
+    def __init__(self, model_path: str, n_ctx: int = 8192, n_threads: Optional[int] = None):
+        self.model_path = model_path
+        self.n_ctx = n_ctx
+        self.n_threads = n_threads
+        self._llama = None
+        # A llama.cpp context is not safe for concurrent use
+        self._lock = threading.Lock()
+
+    def _model(self):
+        if self._llama is None:
+            from llama_cpp import Llama
+            logger.info(f"Loading local model {self.model_path}")
+            self._llama = Llama(model_path=self.model_path, n_ctx=self.n_ctx,
+                                n_threads=self.n_threads, verbose=False)
+        return self._llama
+
+    def chat(self, model: str, messages: List[Dict[str, Any]], **params) -> Any:
+        options = {key: value for key, value in params.items() if key in self.SUPPORTED_PARAMS}
+        with self._lock:
+            result = self._model().create_chat_completion(messages=messages, **options)
+        return _as_response(result)
+
+    def cost(self, model: str, response: Any) -> float:
+        return 0.0
+
+
+def _as_response(result: Dict[str, Any]) -> Any:
+    """Wrap an OpenAI-shaped dict so it reads like an SDK response."""
+    usage = result.get('usage') or {}
+    return SimpleNamespace(
+        choices=[
+            SimpleNamespace(message=SimpleNamespace(content=choice.get('message', {}).get('content')))
+            for choice in result.get('choices', [])
+        ],
+        usage=SimpleNamespace(
+            prompt_tokens=usage.get('prompt_tokens', 0),
+            completion_tokens=usage.get('completion_tokens', 0),
+            total_tokens=usage.get('total_tokens', 0),
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class RouteTarget:
+    backend: LLMBackend
+    model: str
+
+
+class LLMRouter:
+    """Maps each route to the targets to try, in order."""
+
+    def __init__(self, routes: Dict[str, List[RouteTarget]]):
+        unknown = set(routes) - set(ROUTES)
+        if unknown:
+            raise ValueError(f"Unknown LLM routes: {sorted(unknown)}")
+        self.routes = routes
+
+    def targets(self, route: str) -> List[RouteTarget]:
+        if route not in self.routes:
+            raise ValueError(f"LLM route must be one of: {list(ROUTES)}")
+        return self.routes[route]
+
+    def model(self, route: str) -> str:
+        """Model of the route's first target."""
+        return self.targets(route)[0].model
+
+    @classmethod
+    def from_settings(cls, settings) -> 'LLMRouter':
+        from src.config import providers
+
+        hosted = OpenAIBackend(lambda: providers.openai_client(max_retries=0))
+        local = _local_backend(settings)
+
+        extraction = [RouteTarget(hosted, settings.llm_extraction_model)]
+        simple = extraction
+        if local is not None:
+            simple = [RouteTarget(local, settings.local_llm_model)] + extraction
+            if settings.llm_local_extraction:
+                extraction = [RouteTarget(local, settings.local_llm_model)] + extraction
+
+        return cls({
+            'ranking': [RouteTarget(hosted, settings.llm_ranking_model)],
+            'extraction': extraction,
+            'simple_extraction': simple,
+            'discovery': [RouteTarget(hosted, settings.llm_discovery_fallback_model)],
+        })
+
+
+def _local_backend(settings) -> Optional[LLMBackend]:
+    if settings.local_llm_base_url:
+        import openai
+
+        base_url = settings.local_llm_base_url
+        return OpenAIBackend(
+            lambda: openai.OpenAI(api_key='local', base_url=base_url, max_retries=0),
+            name='local', rate_limited=False, priced=False,
+        )
+    if settings.local_llm_model_path:
+        return LlamaCppBackend(settings.local_llm_model_path, n_ctx=settings.local_llm_context)
+    return None
+
+
+__all__ = [
+    'ROUTES',
+    'PRICING_PER_MILLION_TOKENS',
+    'estimate_cost',
+    'LLMBackend',
+    'OpenAIBackend',
+    'LlamaCppBackend',
+    'RouteTarget',
+    'LLMRouter',
+]
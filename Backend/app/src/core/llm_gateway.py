@@ -0,0 +1,329 @@
+"""
+Shared gateway for all LLM chat completion calls.
+
+Every module (JD parsing, search-term generation, ranking, discovery
+extraction, resume parsing in the CLI and the API) sends its requests through
+one process-wide ``LLMGateway`` instead of its own client, so that:
+
+- callers name a route (ranking, extraction, ...) and the routing policy in
+  llm_backends.py picks the backend and model, falling through to the next
+  target when one fails; latency and estimated cost are recorded per route;
+
+- requests/min and tokens/min of hosted models are budgeted with per-model
+  token buckets and admission waits for capacity instead of running into 429s;
+- waiting requests are admitted by priority (interactive ranking and parsing
+  before bulk resume ingestion), first-come first-served within a priority;
+- identical requests already in flight are coalesced onto one provider call;
+- retries and backoff live in one place: retryable errors (429, 5xx,
+  timeouts, connection errors) are retried with exponential backoff and
+  jitter, honouring Retry-After, and a 429 pauses admission for that model.
+
+Token cost is estimated up front the way OpenAI's limiter does it (prompt
+characters / 4 plus max_tokens) and reconciled with the reported usage once
+the response arrives.
+"""
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core import metrics
+from src.core.llm_backends import LLMRouter, RouteTarget
+from src.core.singleflight import SingleFlight, content_key
+
+logger = logging.getLogger(__name__)
+
+# Completion budget assumed when a request sets no max_tokens
+DEFAULT_COMPLETION_TOKENS = 1000
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+RETRYABLE_ERRORS = {
+    'APITimeoutError', 'APIConnectionError',            # openai
+    'Timeout', 'ConnectTimeout', 'ReadTimeout', 'ConnectionError',  # requests / httpx
+}
+
+
+class Priority(IntEnum):
+    """Admission order when requests wait for rate-limit capacity (lower goes first)."""
+    INTERACTIVE = 0  # a recruiter is waiting: JD parsing, search terms, ranking
+    STANDARD = 1     # background steps of an interactive run (discovery extraction)
+    BULK = 2         # resume ingestion
+
+
+class TokenBucket:
+    """Refills continuously at capacity per minute. Not thread-safe; the gateway holds the lock.
+
+    The level may go negative when reported usage exceeds the estimate; the
+    debt is paid off by refill before the next admission.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` can be taken (0 if it can be taken now)."""
+        if self.unlimited:
+            return 0.0
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        if not self.unlimited:
+            self.level -= min(amount, self.capacity)
+
+    def adjust(self, delta: float) -> None:
+        """Give back (positive) or charge (negative) tokens after the fact."""
+        if not self.unlimited:
+            self.level = min(self.capacity, self.level + delta)
+
+
+@dataclass
+class _Lane:
+    """Rate-limit state for one model."""
+    requests: TokenBucket
+    tokens: TokenBucket
+    waiting: List[Tuple[int, int]] = field(default_factory=list)  # heap of (priority, ticket)
+    paused_until: float = 0.0
+
+
+class LLMGateway:
+    """Routed, rate-limited, prioritized, coalescing front for chat completions."""
+
+    def __init__(self, router: Optional[LLMRouter] = None,
+                 requests_per_minute: float = 0, tokens_per_minute: float = 0,
+                 max_retries: int = 4, backoff_base: float = 1.0, backoff_max: float = 30.0):
+        self._router = router
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._lock = threading.Lock()
+        self._admission = threading.Condition(self._lock)
+        self._lanes: Dict[str, _Lane] = {}
+        self._tickets = itertools.count()
+        self._in_flight = SingleFlight('llm_request')
+
+    @property
+    def router(self) -> LLMRouter:
+        """The routing policy, built from settings on first use."""
+        if self._router is None:
+            from src.config.settings import get_settings
+            self._router = LLMRouter.from_settings(get_settings())
+        return self._router
+
+    def model(self, route: str) -> str:
+        """Primary model of a route (e.g. for prompt sizing)."""
+        return self.router.model(route)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def chat_completion(self, *, route: str, messages: List[Dict[str, Any]], operation: str,
+                        priority: Priority = Priority.STANDARD, **params) -> Any:
+        """Run a chat completion on the route's backend and return an SDK-shaped response.
+
+        ``params`` are passed to ``chat.completions.create`` (temperature,
+        max_tokens, response_format, timeout, ...). Identical concurrent
+        requests share one call and its response. Raises the last error once
+        every target of the route has failed.
+        """
+        key = content_key(route, messages, params)
+        return self._in_flight.do(key, self._route_call, route, messages, operation, priority, params)
+
+    def complete(self, *, route: str, messages: List[Dict[str, Any]], operation: str,
+                 priority: Priority = Priority.STANDARD, **params) -> str:
+        """chat_completion() returning just the stripped message text."""
+        response = self.chat_completion(route=route, messages=messages, operation=operation,
+                                        priority=priority, **params)
+        return (response.choices[0].message.content or '').strip()
+
+    def _route_call(self, route: str, messages: List[Dict[str, Any]], operation: str,
+                    priority: Priority, params: Dict[str, Any]) -> Any:
+        targets = self.router.targets(route)
+        for index, target in enumerate(targets):
+            start = time.perf_counter()
+            try:
+                response = self._call_with_retries(target, messages, operation, priority, params)
+            except Exception as e:
+                if index == len(targets) - 1:
+                    raise
+                following = targets[index + 1]
+                logger.warning(
+                    f"LLM route {route}: {target.backend.name}/{target.model} failed ({type(e).__name__}); "
+                    f"falling back to {following.backend.name}/{following.model}"
+                )
+                metrics.record_fallback('llm_route', route)
+                continue
+            metrics.record_llm_call(route, target.backend.name, target.model,
+                                    time.perf_counter() - start, target.backend.cost(target.model, response))
+            return response
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+
+    def _lane(self, model: str) -> _Lane:
+        lane = self._lanes.get(model)
+        if lane is None:
+            lane = _Lane(TokenBucket(self.requests_per_minute), TokenBucket(self.tokens_per_minute))
+            self._lanes[model] = lane
+        return lane
+
+    def _admit(self, model: str, estimated_tokens: int, priority: Priority) -> None:
+        """Block until this request is first in line for its model and both buckets have room."""
+        with self._admission:
+            lane = self._lane(model)
+            entry = (int(priority), next(self._tickets))
+            heapq.heappush(lane.waiting, entry)
+            waited = False
+            try:
+                while True:
+                    now = time.monotonic()
+                    if lane.waiting[0] == entry:
+                        delay = max(
+                            lane.paused_until - now,
+                            lane.requests.wait_time(1, now),
+                            lane.tokens.wait_time(estimated_tokens, now),
+                        )
+                        if delay <= 0:
+                            lane.requests.take(1)
+                            lane.tokens.take(estimated_tokens)
+                            break
+                    else:
+                        delay = None  # woken when the head is admitted
+                    waited = True
+                    self._admission.wait(delay)
+            finally:
+                lane.waiting.remove(entry)
+                heapq.heapify(lane.waiting)
+                self._admission.notify_all()
+            if waited:
+                logger.debug(f"LLM request for {model} (priority {priority.name}) waited for rate-limit capacity")
+
+    def _settle(self, model: str, estimated_tokens: int, used_tokens: int) -> None:
+        """Replace the admission estimate with the tokens actually used."""
+        with self._lock:
+            self._lane(model).tokens.adjust(estimated_tokens - used_tokens)
+
+    def _pause(self, model: str, seconds: float) -> None:
+        """Hold admission for a model after the provider reported a rate limit."""
+        with self._lock:
+            lane = self._lane(model)
+            lane.paused_until = max(lane.paused_until, time.monotonic() + seconds)
+
+    # ------------------------------------------------------------------
+    # Calling and retrying
+    # ------------------------------------------------------------------
+
+    def _call_with_retries(self, target: RouteTarget, messages: List[Dict[str, Any]], operation: str,
+                           priority: Priority, params: Dict[str, Any]) -> Any:
+        """Call one target. Hosted targets are budgeted and retried; local ones fail fast to the next target."""
+        backend, model = target.backend, target.model
+        budgeted = backend.rate_limited
+        retries = self.max_retries if budgeted else 0
+        estimated = _estimate_tokens(messages, params.get('max_tokens'))
+        for attempt in range(retries + 1):
+            if budgeted:
+                self._admit(model, estimated, priority)
+            try:
+                with metrics.external_call(backend.name, operation, model) as call:
+                    response = backend.chat(model, messages, **params)
+                    call.record_usage(response)
+            except Exception as e:
+                if budgeted:
+                    self._settle(model, estimated, 0)
+                delay = self._retry_delay(e, attempt)
+                if delay is None or attempt == retries:
+                    raise
+                if _status_code(e) == 429:
+                    self._pause(model, delay)
+                logger.warning(f"{backend.name} {operation} failed ({type(e).__name__}); retry {attempt + 1}/{retries} in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            usage = getattr(response, 'usage', None)
+            if budgeted and usage is not None and getattr(usage, 'total_tokens', None) is not None:
+                self._settle(model, estimated, usage.total_tokens)
+            return response
+
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None if the error is not retryable."""
+        status = _status_code(error)
+        if status is not None and status not in RETRYABLE_STATUS:
+            return None
+        if status is None and type(error).__name__ not in RETRYABLE_ERRORS:
+            return None
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        # Exponential backoff with full jitter
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+def _estimate_tokens(messages: List[Dict[str, Any]], max_tokens: Optional[int]) -> int:
+    prompt_chars = sum(len(str(m.get('content') or '')) for m in messages)
+    return prompt_chars // 4 + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    status = getattr(error, 'status_code', None)  # openai.APIStatusError
+    if status is None:
+        response = getattr(error, 'response', None)  # requests.HTTPError
+        status = getattr(response, 'status_code', None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        value = headers.get('retry-after-ms')
+        if value is not None:
+            return float(value) / 1000.0
+        value = headers.get('retry-after')
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_gateway() -> LLMGateway:
+    """The process-wide gateway, configured from settings on first use."""
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                from src.config.settings import get_settings
+                settings = get_settings()
+                _gateway = LLMGateway(
+                    router=LLMRouter.from_settings(settings),
+                    requests_per_minute=settings.llm_requests_per_minute,
+                    tokens_per_minute=settings.llm_tokens_per_minute,
+                    max_retries=settings.llm_max_retries,
+                )
+    return _gateway
+
+
+__all__ = ['Priority', 'TokenBucket', 'LLMGateway', 'get_gateway']
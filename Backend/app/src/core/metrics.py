@@ -0,0 +1,342 @@
+"""
+Instrumentation for external calls, workflow steps, fallbacks and caches.
+
+Every call to OpenAI, Gemini, People Data Labs or Supabase goes through
+``external_call()``, which times it, records the outcome and token usage, and
+wraps it in a tracing span (see tracing.py).
+Metrics are exported in the Prometheus format when prometheus_client is
+installed (``exposition()`` for the API's /metrics route, ``start_server()``
+for the CLI); without it every metric is a no-op. The API imports this module
+through app.pipeline, so there is a single registry per process.
+
+Independently of Prometheus, ``track_run()`` collects per-run totals (calls,
+tokens, LLM cost, fallbacks, search queries, step timings) for SearchMetadata. The
+current run is held in a context variable, so only code running in the
+caller's context is attributed to the run.
+"""
+
+import contextvars
+import logging
+import time
+from collections import Counter as TallyCounter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import prometheus_client
+    from prometheus_client import Counter, Histogram, REGISTRY
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+from src.core import tracing
+
+logger = logging.getLogger(__name__)
+
+# Provider calls range from ~50 ms (Supabase) to tens of seconds (grounded Gemini search)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+
+class _NoopMetric:
+    """Stand-in for a Prometheus metric when prometheus_client is not installed."""
+
+    def labels(self, *args, **kwargs) -> '_NoopMetric':
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def observe(self, amount: float) -> None:
+        pass
+
+
+def _metric(kind: str, name: str, documentation: str, labelnames: Tuple[str, ...] = (), **kwargs):
+    """Create a Prometheus metric, or a no-op one when prometheus_client is missing."""
+    if not PROMETHEUS_AVAILABLE:
+        return _NoopMetric()
+    cls = Counter if kind == 'counter' else Histogram
+    return cls(name, documentation, labelnames, **kwargs)
+
+
+EXTERNAL_CALL_SECONDS = _metric(
+    'histogram', 'recruitment_external_call_seconds',
+    'Latency of calls to external providers',
+    ('provider', 'operation', 'outcome'), buckets=LATENCY_BUCKETS
+)
+EXTERNAL_CALLS = _metric(
+    'counter', 'recruitment_external_calls_total',
+    'Calls to external providers',
+    ('provider', 'operation', 'outcome')
+)
+EXTERNAL_ERRORS = _metric(
+    'counter', 'recruitment_external_errors_total',
+    'Failed calls to external providers, by error type',
+    ('provider', 'operation', 'error')
+)
+LLM_TOKENS = _metric(
+    'counter', 'recruitment_llm_tokens_total',
+    'LLM tokens consumed',
+    ('provider', 'model', 'kind')
+)
+WORKFLOW_STEP_SECONDS = _metric(
+    'histogram', 'recruitment_workflow_step_seconds',
+    'Duration of recruitment workflow steps',
+    ('step', 'outcome'), buckets=LATENCY_BUCKETS
+)
+CANDIDATES_RANKED = _metric(
+    'counter', 'recruitment_candidates_ranked_total',
+    'Candidates ranked, including fallback rankings'
+)
+FALLBACKS = _metric(
+    'counter', 'recruitment_fallbacks_total',
+    'Results produced by a fallback path instead of the primary provider',
+    ('component', 'reason')
+)
+LLM_ROUTE_SECONDS = _metric(
+    'histogram', 'recruitment_llm_route_seconds',
+    'End-to-end latency of LLM calls by route, including rate-limit waits and retries',
+    ('route', 'backend', 'model'), buckets=LATENCY_BUCKETS
+)
+LLM_COST_USD = _metric(
+    'counter', 'recruitment_llm_cost_usd_total',
+    'Estimated LLM spend in USD',
+    ('route', 'backend', 'model')
+)
+FAST_PATH = _metric(
+    'counter', 'recruitment_fast_path_total',
+    'Documents handled by a heuristic fast path: complete (no LLM call) or partial (LLM for the remaining fields)',
+    ('component', 'outcome')
+)
+CACHE_REQUESTS = _metric(
+    'counter', 'recruitment_cache_requests_total',
+    'Cache lookups',
+    ('cache', 'result')
+)
+
+
+# ----------------------------------------------------------------------
+# Per-run accounting
+# ----------------------------------------------------------------------
+
+@dataclass
+class RunStats:
+    """Totals for one workflow run, used to fill SearchMetadata."""
+    api_calls: TallyCounter = field(default_factory=TallyCounter)
+    failed_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    fallbacks: int = 0
+    cost_usd: float = 0.0
+    search_queries: List[str] = field(default_factory=list)
+    step_seconds: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def api_calls_made(self) -> int:
+        return sum(self.api_calls.values())
+
+    @property
+    def tokens_used(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+_current_run: contextvars.ContextVar[Optional[RunStats]] = contextvars.ContextVar('recruitment_run_stats', default=None)
+
+
+@contextmanager
+def track_run() -> Iterator[RunStats]:
+    """Collect per-run totals for everything recorded inside the block."""
+    stats = RunStats()
+    token = _current_run.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_run.reset(token)
+
+
+def current_run() -> Optional[RunStats]:
+    """The RunStats of the enclosing track_run() block, if any."""
+    return _current_run.get()
+
+
+# ----------------------------------------------------------------------
+# Recording
+# ----------------------------------------------------------------------
+
+class ExternalCall:
+    """Handle yielded by external_call() for reporting usage and soft failures."""
+
+    __slots__ = ('provider', 'operation', 'model', 'outcome', 'error', 'span')
+
+    def __init__(self, provider: str, operation: str, model: Optional[str], span: Any):
+        self.provider = provider
+        self.operation = operation
+        self.model = model
+        self.outcome = 'success'
+        self.error: Optional[str] = None
+        self.span = span
+
+    def fail(self, error: str) -> None:
+        """Mark the call failed without raising (e.g. a non-2xx HTTP response)."""
+        self.outcome = 'error'
+        self.error = error
+        self.span.set_error(error)
+
+    def record_usage(self, response: Any) -> None:
+        """Record token usage from an OpenAI/Gemini SDK response or an OpenAI REST payload."""
+        prompt_tokens, completion_tokens = usage_tokens(response)
+        if not prompt_tokens and not completion_tokens:
+            return
+        model = self.model or 'unknown'
+        LLM_TOKENS.labels(self.provider, model, 'prompt').inc(prompt_tokens)
+        LLM_TOKENS.labels(self.provider, model, 'completion').inc(completion_tokens)
+        self.span.set_attribute('llm.prompt_tokens', prompt_tokens)
+        self.span.set_attribute('llm.completion_tokens', completion_tokens)
+        stats = _current_run.get()
+        if stats is not None:
+            stats.prompt_tokens += prompt_tokens
+            stats.completion_tokens += completion_tokens
+
+
+def usage_tokens(response: Any) -> Tuple[int, int]:
+    """(prompt, completion) tokens from an SDK response or an OpenAI REST payload."""
+    if isinstance(response, dict):
+        usage = response.get('usage') or {}
+        return int(usage.get('prompt_tokens') or 0), int(usage.get('completion_tokens') or 0)
+    usage = getattr(response, 'usage', None)
+    if usage is not None:
+        return int(getattr(usage, 'prompt_tokens', 0) or 0), int(getattr(usage, 'completion_tokens', 0) or 0)
+    usage = getattr(response, 'usage_metadata', None)  # google-genai
+    if usage is not None:
+        return int(getattr(usage, 'prompt_token_count', 0) or 0), int(getattr(usage, 'candidates_token_count', 0) or 0)
+    return 0, 0
+
+
+@contextmanager
+def external_call(provider: str, operation: str, model: Optional[str] = None) -> Iterator[ExternalCall]:
+    """Time and trace a call to an external provider and record its outcome.
+
+    An exception escaping the block marks the call failed and is re-raised.
+    """
+    with tracing.span(f"{provider}.{operation}", **{'peer.service': provider, 'llm.model': model}) as call_span:
+        call = ExternalCall(provider, operation, model, call_span)
+        start = time.perf_counter()
+        try:
+            yield call
+        except BaseException as e:
+            call.fail(type(e).__name__)
+            raise
+        finally:
+            _finish_call(call, time.perf_counter() - start)
+
+
+def _finish_call(call: ExternalCall, elapsed: float) -> None:
+    provider, operation = call.provider, call.operation
+    EXTERNAL_CALL_SECONDS.labels(provider, operation, call.outcome).observe(elapsed)
+    EXTERNAL_CALLS.labels(provider, operation, call.outcome).inc()
+    if call.error:
+        EXTERNAL_ERRORS.labels(provider, operation, call.error).inc()
+    stats = _current_run.get()
+    if stats is not None:
+        stats.api_calls[provider] += 1
+        if call.error:
+            stats.failed_calls += 1
+
+
+@contextmanager
+def workflow_step(name: str) -> Iterator[None]:
+    """Time and trace a workflow step. An exception escaping the block marks it failed."""
+    outcome = 'success'
+    start = time.perf_counter()
+    with tracing.span(f"workflow.{name}"):
+        try:
+            yield
+        except BaseException:
+            outcome = 'error'
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            WORKFLOW_STEP_SECONDS.labels(name, outcome).observe(elapsed)
+            stats = _current_run.get()
+            if stats is not None:
+                stats.step_seconds[name] = round(elapsed, 3)
+
+
+def record_ranked(count: int) -> None:
+    """Count candidates that received a ranking, by any path."""
+    CANDIDATES_RANKED.inc(count)
+
+
+def record_fallback(component: str, reason: str, count: int = 1) -> None:
+    """Count results produced by a fallback path (e.g. heuristic rankings)."""
+    FALLBACKS.labels(component, reason).inc(count)
+    stats = _current_run.get()
+    if stats is not None:
+        stats.fallbacks += count
+
+
+def record_llm_call(route: str, backend: str, model: str, seconds: float, cost_usd: float) -> None:
+    """Record latency and estimated cost of one routed LLM call."""
+    LLM_ROUTE_SECONDS.labels(route, backend, model).observe(seconds)
+    LLM_COST_USD.labels(route, backend, model).inc(cost_usd)
+    stats = _current_run.get()
+    if stats is not None:
+        stats.cost_usd += cost_usd
+
+
+def record_fast_path(component: str, complete: bool) -> None:
+    """Count a document parsed heuristically, fully or with a partial LLM call."""
+    FAST_PATH.labels(component, 'complete' if complete else 'partial').inc()
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count a cache lookup."""
+    CACHE_REQUESTS.labels(cache, 'hit' if hit else 'miss').inc()
+
+
+def record_search_query(query: str) -> None:
+    """Attribute a provider search query to the current run."""
+    stats = _current_run.get()
+    if stats is not None:
+        stats.search_queries.append(query)
+
+
+# ----------------------------------------------------------------------
+# Export
+# ----------------------------------------------------------------------
+
+def exposition() -> Tuple[bytes, str]:
+    """Current metrics in the Prometheus text format, with its content type."""
+    if not PROMETHEUS_AVAILABLE:
+        return b"# prometheus_client is not installed\n", "text/plain; charset=utf-8"
+    return prometheus_client.generate_latest(REGISTRY), prometheus_client.CONTENT_TYPE_LATEST
+
+
+def start_server(port: int) -> bool:
+    """Serve /metrics on a port from a background thread (for the CLI)."""
+    if not PROMETHEUS_AVAILABLE:
+        logger.warning("prometheus_client is not installed; metrics server not started")
+        return False
+    prometheus_client.start_http_server(port)
+    logger.info(f"Serving Prometheus metrics on port {port}")
+    return True
+
+
+__all__ = [
+    'PROMETHEUS_AVAILABLE',
+    'RunStats',
+    'ExternalCall',
+    'track_run',
+    'current_run',
+    'external_call',
+    'workflow_step',
+    'record_ranked',
+    'record_fallback',
+    'record_llm_call',
+    'record_fast_path',
+    'usage_tokens',
+    'record_cache',
+    'record_search_query',
+    'exposition',
+    'start_server',
+]
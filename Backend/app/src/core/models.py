@@ -8,7 +8,7 @@ workflow.
 
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 from enum import Enum
 
 
@@ -55,8 +55,7 @@ class Location(BaseModel):
     country: Optional[str] = None
     remote_allowed: bool = False
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class ExperienceYears(BaseModel):
@@ -64,15 +63,15 @@ class ExperienceYears(BaseModel):
     minimum: Optional[int] = Field(None, ge=0, le=50)
     maximum: Optional[int] = Field(None, ge=0, le=50)
     
-    @validator('maximum')
-    def validate_max_greater_than_min(cls, v, values):
-        if v is not None and values.get('minimum') is not None:
-            if v < values['minimum']:
+    @field_validator('maximum')
+    @classmethod
+    def validate_max_greater_than_min(cls, v, info: ValidationInfo):
+        if v is not None and info.data.get('minimum') is not None:
+            if v < info.data['minimum']:
                 raise ValueError('Maximum years must be greater than or equal to minimum years')
         return v
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class JobDescription(BaseModel):
@@ -82,25 +81,26 @@ class JobDescription(BaseModel):
     location: Optional[Location] = None
     experience_level: Optional[ExperienceLevel] = None
     experience_years: Optional[ExperienceYears] = None
-    required_skills: List[str] = Field(default_factory=list, max_items=50)
-    preferred_skills: List[str] = Field(default_factory=list, max_items=30)
-    responsibilities: List[str] = Field(default_factory=list, max_items=20)
-    requirements: List[str] = Field(default_factory=list, max_items=20)
-    benefits: List[str] = Field(default_factory=list, max_items=15)
+    required_skills: List[str] = Field(default_factory=list, max_length=50)
+    preferred_skills: List[str] = Field(default_factory=list, max_length=30)
+    responsibilities: List[str] = Field(default_factory=list, max_length=20)
+    requirements: List[str] = Field(default_factory=list, max_length=20)
+    benefits: List[str] = Field(default_factory=list, max_length=15)
     salary_range: Optional[str] = Field(None, max_length=100)
     employment_type: Optional[EmploymentType] = None
     industry: Optional[str] = Field(None, max_length=50)
     company_size: Optional[CompanySize] = None
-    education_requirements: List[str] = Field(default_factory=list, max_items=10)
-    certifications: List[str] = Field(default_factory=list, max_items=10)
+    education_requirements: List[str] = Field(default_factory=list, max_length=10)
+    certifications: List[str] = Field(default_factory=list, max_length=10)
     
-    @validator('required_skills', 'preferred_skills')
+    @field_validator('required_skills', 'preferred_skills')
+    @classmethod
     def validate_skills_not_empty(cls, v):
         return [skill.strip() for skill in v if skill.strip()]
     
-    class Config:
-        extra = "forbid"
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "title": "Senior Python Developer",
                 "company": "TechCorp Inc.",
@@ -117,6 +117,7 @@ class JobDescription(BaseModel):
                 "employment_type": "full_time"
             }
         }
+    )
 
 
 class CandidateProfile(BaseModel):
@@ -129,16 +130,16 @@ class CandidateProfile(BaseModel):
     linkedin_url: Optional[str] = Field(None, pattern=r'^https?://.*linkedin\.com.*')
     email: Optional[str] = Field(None, pattern=r'^[^@]+@[^@]+\.[^@]+$')
     phone: Optional[str] = Field(None, max_length=20)
-    skills: List[str] = Field(default_factory=list, max_items=100)
+    skills: List[str] = Field(default_factory=list, max_length=100)
     experience_years: Optional[int] = Field(None, ge=0, le=50)
-    education: List[str] = Field(default_factory=list, max_items=10)
-    previous_companies: List[str] = Field(default_factory=list, max_items=20)
-    industries: List[str] = Field(default_factory=list, max_items=10)
+    education: List[str] = Field(default_factory=list, max_length=10)
+    previous_companies: List[str] = Field(default_factory=list, max_length=20)
+    industries: List[str] = Field(default_factory=list, max_length=10)
     candidate_description: Optional[str] = None
     
-    class Config:
-        extra = "forbid"
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "candidate_id": "pdl_12345",
                 "full_name": "John Doe",
@@ -155,6 +156,7 @@ class CandidateProfile(BaseModel):
                 "experience_years": 7
             }
         }
+    )
 
 
 class DimensionScores(BaseModel):
@@ -166,8 +168,7 @@ class DimensionScores(BaseModel):
     industry_experience: float = Field(..., ge=0.0, le=1.0)
     location_compatibility: float = Field(..., ge=0.0, le=1.0)
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class CandidateRanking(BaseModel):
@@ -179,17 +180,18 @@ class CandidateRanking(BaseModel):
     linkedin_url: Optional[str] = None
     overall_score: float = Field(..., ge=0.0, le=1.0)
     dimension_scores: DimensionScores
-    strengths: List[str] = Field(default_factory=list, max_items=10)
-    concerns: List[str] = Field(default_factory=list, max_items=10)
-    recommendations: List[str] = Field(default_factory=list, max_items=10)
+    strengths: List[str] = Field(default_factory=list, max_length=10)
+    concerns: List[str] = Field(default_factory=list, max_length=10)
+    recommendations: List[str] = Field(default_factory=list, max_length=10)
     confidence_level: ConfidenceLevel
     match_explanation: str = Field(..., min_length=10, max_length=1000)
-    key_differentiators: List[str] = Field(default_factory=list, max_items=10)
-    interview_focus_areas: List[str] = Field(default_factory=list, max_items=10)
+    key_differentiators: List[str] = Field(default_factory=list, max_length=10)
+    interview_focus_areas: List[str] = Field(default_factory=list, max_length=10)
     candidate_description: Optional[str] = None
+    # Set on heuristic rankings made when the AI ranking failed (fallback/emergency paths)
+    is_fallback: bool = False
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class SearchMetadata(BaseModel):
@@ -201,9 +203,13 @@ class SearchMetadata(BaseModel):
     workflow_version: str = Field(default="2.0.0")
     search_queries_used: List[str] = Field(default_factory=list)
     api_calls_made: int = Field(default=0, ge=0)
+    llm_tokens_used: int = Field(default=0, ge=0)
+    llm_cost_usd: float = Field(default=0.0, ge=0.0)
+    fallbacks_used: int = Field(default=0, ge=0)
+    step_timings_seconds: Dict[str, float] = Field(default_factory=dict)
+    run_id: Optional[str] = None
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class WorkflowResult(BaseModel):
@@ -213,7 +219,8 @@ class WorkflowResult(BaseModel):
     rankings: List[CandidateRanking]
     metadata: SearchMetadata
     
-    @validator('rankings')
+    @field_validator('rankings')
+    @classmethod
     def validate_rankings_sorted(cls, v):
         """Ensure rankings are sorted by overall_score in descending order."""
         if len(v) > 1:
@@ -222,8 +229,7 @@ class WorkflowResult(BaseModel):
                 raise ValueError('Rankings must be sorted by overall_score in descending order')
         return v
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class PDLSearchQuery(BaseModel):
@@ -232,8 +238,7 @@ class PDLSearchQuery(BaseModel):
     elasticsearch_query: Optional[Dict[str, Any]] = None
     max_results: int = Field(default=10, ge=1, le=100)
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class APIResponse(BaseModel):
@@ -243,8 +248,7 @@ class APIResponse(BaseModel):
     error_message: Optional[str] = None
     status_code: Optional[int] = None
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class SystemConfiguration(BaseModel):
@@ -255,8 +259,7 @@ class SystemConfiguration(BaseModel):
     max_candidates_default: int = Field(default=10, ge=1, le=100)
     output_directory: str = Field(default="./results")
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 # Export all models for easy importing
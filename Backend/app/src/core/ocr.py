@@ -0,0 +1,133 @@
+"""
+OCR for scanned PDF pages.
+
+A scanned resume has no text layer, so text extraction returns nothing for it.
+pdf_text passes such image-only pages here:
+
+- each page is rasterized with PyMuPDF to a grayscale image, one at a time in
+  the calling thread (MuPDF is not thread-safe);
+- the images are read by the local tesseract binary, several at once. Every
+  pytesseract call runs tesseract as its own process, so a small thread pool
+  spreads OCR across cores. Nothing leaves the machine;
+- results are cached on disk, keyed by a hash of the rendered image and the
+  languages. Re-processing a document, or the same scanned page in another
+  file, costs one render and no OCR.
+
+Requires ``pytesseract`` and the ``tesseract`` binary (with its language data).
+Without them OCR_AVAILABLE is False and scanned pages stay empty.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+try:
+    import fitz
+    import pytesseract
+    from PIL import Image
+    OCR_AVAILABLE = shutil.which(pytesseract.pytesseract.tesseract_cmd) is not None
+except ImportError:
+    OCR_AVAILABLE = False
+
+from src.core import metrics, tracing
+
+logger = logging.getLogger(__name__)
+
+# Tesseract's own OpenMP threads would compete with the pool's processes
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+
+class PageCache:
+    """OCR text on disk, one file per page-image hash; safe to share between processes."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return self._path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, text: str) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Written aside and renamed, so a reader never sees a partial file
+            partial = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            partial.write_text(text, encoding="utf-8")
+            os.replace(partial, path)
+        except OSError as e:
+            logger.warning(f"Could not cache OCR text in {path}: {e}")
+
+
+def page_key(width: int, height: int, samples: bytes, languages: str) -> str:
+    """Cache key of a rendered page: its pixels, size and the OCR languages."""
+    digest = hashlib.sha256(f"{width}x{height}:{languages}:".encode())
+    digest.update(samples)
+    return digest.hexdigest()
+
+
+def is_image_only(page, text: str, min_chars: int = 25) -> bool:
+    """Whether a PDF page is a scan: (almost) no text layer, but images."""
+    return len(text) < min_chars and bool(page.get_images())
+
+
+def ocr_pages(doc, page_numbers: Sequence[int], workers: Optional[int] = None) -> Dict[int, str]:
+    """OCR text of the given pages of an open PyMuPDF document, by page number.
+
+    Pages tesseract fails on are logged and left out (and not cached).
+    """
+    if not OCR_AVAILABLE or not page_numbers:
+        return {}
+    from src.config.settings import get_settings
+    settings = get_settings()
+    languages = settings.ocr_languages
+    cache = PageCache(settings.ocr_cache_dir)
+    workers = max(1, workers or settings.ocr_workers or min(os.cpu_count() or 1, 4))
+
+    results: Dict[int, str] = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr") as executor:
+        # Rendered in batches of `workers`, so only that many page images are held at once
+        for start in range(0, len(page_numbers), workers):
+            pending = []
+            for page_number in page_numbers[start:start + workers]:
+                try:
+                    pixmap = doc.load_page(page_number).get_pixmap(dpi=settings.ocr_dpi, colorspace=fitz.csGRAY)
+                except Exception as e:
+                    logger.warning(f"Could not render PDF page {page_number} for OCR: {e}")
+                    continue
+                key = page_key(pixmap.width, pixmap.height, pixmap.samples, languages)
+                cached = cache.get(key)
+                metrics.record_cache("ocr_page", cached is not None)
+                if cached is not None:
+                    results[page_number] = cached
+                    continue
+                image = Image.frombytes("L", (pixmap.width, pixmap.height), pixmap.samples)
+                pending.append((page_number, key, executor.submit(_recognize, image, languages)))
+
+            for page_number, key, future in pending:
+                try:
+                    text = future.result().strip()
+                except Exception as e:
+                    logger.warning(f"OCR failed on PDF page {page_number}: {e}")
+                    continue
+                cache.put(key, text)
+                results[page_number] = text
+    return results
+
+
+def _recognize(image, languages: str) -> str:
+    with tracing.span("ocr_page", **{"ocr.languages": languages}):
+        return pytesseract.image_to_string(image, lang=languages)
+
+
+__all__ = ['OCR_AVAILABLE', 'PageCache', 'page_key', 'is_image_only', 'ocr_pages']
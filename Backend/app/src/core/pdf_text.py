@@ -0,0 +1,163 @@
+"""
+PDF text extraction.
+
+One engine for every PDF the system reads (uploaded JDs and resumes, the CLI's
+JD and resume files, the discovery prompt's JD). Built for large documents:
+
+- PyMuPDF opens a file by path and reads it on demand, so a 300-page
+  portfolio is never loaded whole; in-memory uploads are opened from their
+  bytes without a copy.
+- Page and character caps are applied while extracting: nothing past
+  ``max_pages`` is opened, and extraction stops once ``max_chars`` (the LLM
+  only ever sees 120k) are collected.
+- Page texts are collected in a list and joined once, in linear time.
+- Long documents can be split into page ranges extracted in parallel
+  processes (PyMuPDF is not thread-safe); each range stops at the cap too.
+- Image-only pages (scans) are OCR'd locally when tesseract is installed
+  (src/core/ocr.py), up to the ``ocr_max_pages`` setting, and their text is
+  put back in page order. Otherwise a PDF with no text layer yields an empty
+  string. There is no fallback to decoding the binary file as text.
+
+pypdf is used when PyMuPDF is not installed, with the same caps.
+"""
+
+import io
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    import fitz
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+from src.core import ocr
+
+logger = logging.getLogger(__name__)
+
+MAX_PAGES = 500
+MAX_CHARS = 120_000
+# Below this many pages, starting worker processes costs more than it saves
+PARALLEL_MIN_PAGES = 40
+
+PDFSource = Union[str, Path, bytes]
+PageText = Tuple[int, str]
+
+
+def extract_pdf_text(source: PDFSource, max_pages: int = MAX_PAGES, max_chars: int = MAX_CHARS,
+                     workers: int = 1, use_ocr: Optional[bool] = None) -> str:
+    """Text of a PDF (path or bytes), capped at max_pages pages and max_chars characters.
+
+    With ``workers`` > 1, documents of PARALLEL_MIN_PAGES pages or more are
+    split into that many page ranges, each extracted in its own process.
+    ``use_ocr`` overrides the ``ocr_enabled`` setting for image-only pages.
+    """
+    if not PYMUPDF_AVAILABLE:
+        return _extract_with_pypdf(source, max_pages, max_chars)[:max_chars]
+
+    ocr_limit = _ocr_page_limit(use_ocr)
+    with _open(source) as doc:
+        page_count = min(doc.page_count, max_pages)
+        if workers > 1 and page_count >= PARALLEL_MIN_PAGES:
+            pages, scanned = _extract_parallel(source, page_count, max_chars, workers)
+        else:
+            pages, scanned = _extract_pages(doc, 0, page_count, max_chars)
+        if scanned[:ocr_limit]:
+            recognized = _ocr(doc, scanned[:ocr_limit])
+            # OCR text replaces whatever stray text layer a scanned page had
+            pages = sorted([page for page in pages if page[0] not in recognized] + list(recognized.items()))
+    return "\n".join(text for _, text in pages)[:max_chars]
+
+
+def _ocr_page_limit(use_ocr: Optional[bool]) -> int:
+    from src.config.settings import get_settings
+    settings = get_settings()
+    if not (settings.ocr_enabled if use_ocr is None else use_ocr):
+        return 0
+    return settings.ocr_max_pages if ocr.OCR_AVAILABLE else 0
+
+
+def _ocr(doc, page_numbers: List[int]) -> Dict[int, str]:
+    logger.info(f"OCR on {len(page_numbers)} image-only PDF page(s)")
+    return {page_number: text for page_number, text in ocr.ocr_pages(doc, page_numbers).items() if text}
+
+
+def _open(source: PDFSource):
+    if isinstance(source, (bytes, bytearray)):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(str(source))
+
+
+def _extract_pages(doc, start: int, stop: int, max_chars: int) -> Tuple[List[PageText], List[int]]:
+    """Texts of the pages that have any, and the numbers of the image-only pages."""
+    pages, scanned, total = [], [], 0
+    for page_number in range(start, stop):
+        try:
+            page = doc.load_page(page_number)
+            text = page.get_text().strip()
+            if ocr.is_image_only(page, text):
+                scanned.append(page_number)
+        except Exception as e:
+            logger.warning(f"Could not extract PDF page {page_number}: {e}")
+            continue
+        if text:
+            pages.append((page_number, text))
+            total += len(text) + 1
+            if total >= max_chars:
+                break
+    return pages, scanned
+
+
+def _extract_range(source: PDFSource, start: int, stop: int, max_chars: int) -> Tuple[List[PageText], List[int]]:
+    with _open(source) as doc:
+        return _extract_pages(doc, start, stop, max_chars)
+
+
+def _extract_parallel(source: PDFSource, page_count: int, max_chars: int,
+                      workers: int) -> Tuple[List[PageText], List[int]]:
+    step = -(-page_count // workers)
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    pages: List[PageText] = []
+    scanned: List[int] = []
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [executor.submit(_extract_range, source, start, stop, max_chars) for start, stop in ranges]
+        total = 0
+        for future in futures:
+            # Ranges come back in page order; later ones are dropped once the cap is reached
+            if total >= max_chars:
+                future.cancel()
+                continue
+            range_pages, range_scanned = future.result()
+            pages.extend(range_pages)
+            scanned.extend(range_scanned)
+            total += sum(len(text) + 1 for _, text in range_pages)
+    return pages, scanned
+
+
+def _extract_with_pypdf(source: PDFSource, max_pages: int, max_chars: int) -> str:
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        from PyPDF2 import PdfReader
+
+    reader = PdfReader(io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else str(source))
+    parts, total = [], 0
+    for page in reader.pages[:max_pages]:
+        text = (page.extract_text() or "").strip()
+        if text:
+            parts.append(text)
+            total += len(text) + 1
+            if total >= max_chars:
+                break
+    return "\n".join(parts)
+
+
+def default_workers() -> int:
+    """Processes to use for one large document outside a worker pool."""
+    return min(os.cpu_count() or 1, 8)
+
+
+__all__ = ['PYMUPDF_AVAILABLE', 'MAX_PAGES', 'MAX_CHARS', 'extract_pdf_text', 'default_workers']
@@ -0,0 +1,262 @@
+"""
+Columnar candidate pool.
+
+Discovery grows the candidate pool by several seeds x several iterations and
+re-ranks it each round. A plain list of CandidateProfile objects makes every
+lookup, dedup check and top-k selection a linear scan. CandidatePool keeps the
+profiles in insertion order and indexes them:
+
+- candidate_id -> row and dedup signature -> row hash maps
+- NumPy columns for overall score and the six dimension scores
+- interned skill vocabulary, with per-row skill ids stored CSR-style
+- lightweight ``__slots__`` row views instead of copied dicts
+"""
+
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from src.core.models import CandidateProfile, CandidateRanking
+
+DIMENSIONS = (
+    'technical_skills',
+    'experience_relevance',
+    'seniority_match',
+    'education_fit',
+    'industry_experience',
+    'location_compatibility',
+)
+
+_INITIAL_CAPACITY = 64
+
+
+class CandidateRow:
+    """View of one row of a CandidatePool. Holds no data of its own."""
+
+    __slots__ = ('_pool', 'index')
+
+    def __init__(self, pool: 'CandidatePool', index: int):
+        self._pool = pool
+        self.index = index
+
+    @property
+    def candidate_id(self) -> str:
+        return self._pool._profiles[self.index].candidate_id
+
+    @property
+    def profile(self) -> CandidateProfile:
+        return self._pool._profiles[self.index]
+
+    @property
+    def ranking(self) -> Optional[CandidateRanking]:
+        return self._pool._rankings[self.index]
+
+    @property
+    def score(self) -> float:
+        return float(self._pool._scores[self.index])
+
+    @property
+    def dimension_scores(self) -> np.ndarray:
+        return self._pool._dimensions[self.index]
+
+    @property
+    def skills(self) -> List[str]:
+        return [self._pool._skill_names[i] for i in self._pool._row_skill_ids(self.index)]
+
+    def __repr__(self) -> str:
+        return f"CandidateRow({self.index}, {self.candidate_id!r}, score={self.score:.3f})"
+
+
+class CandidatePool:
+    """Indexed, columnar collection of candidate profiles and their scores."""
+
+    def __init__(self, candidates: Iterable[CandidateProfile] = (), dedup: bool = True):
+        self._profiles: List[CandidateProfile] = []
+        self._rankings: List[Optional[CandidateRanking]] = []
+        self._index: Dict[str, int] = {}
+        self._signatures: Dict[str, int] = {}
+
+        # Skill vocabulary: name -> id, plus CSR offsets into a flat id array
+        self._skill_vocab: Dict[str, int] = {}
+        self._skill_names: List[str] = []
+        self._skill_ids = np.empty(_INITIAL_CAPACITY * 8, dtype=np.int32)
+        self._skill_count = 0
+        self._skill_offsets = np.zeros(_INITIAL_CAPACITY + 1, dtype=np.int64)
+
+        # Score columns; NaN until the row has been ranked
+        self._scores = np.full(_INITIAL_CAPACITY, np.nan, dtype=np.float32)
+        self._dimensions = np.full((_INITIAL_CAPACITY, len(DIMENSIONS)), np.nan, dtype=np.float32)
+
+        self.extend(candidates, dedup=dedup)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def signature(candidate: CandidateProfile) -> str:
+        """Dedup key: lower-cased name and current company."""
+        company = candidate.current_company.lower() if candidate.current_company else 'unknown'
+        return f"{candidate.full_name.lower()}_{company}"
+
+    def add(self, candidate: CandidateProfile, dedup: bool = True) -> bool:
+        """Add a candidate unless its id or name/company signature is already present.
+
+        With ``dedup=False`` the candidate is always added; later candidates
+        are still checked against its id and signature.
+        """
+        signature = self.signature(candidate)
+        if dedup and (candidate.candidate_id in self._index or signature in self._signatures):
+            return False
+
+        row = len(self._profiles)
+        self._ensure_capacity(row + 1)
+        self._profiles.append(candidate)
+        self._rankings.append(None)
+        self._index.setdefault(candidate.candidate_id, row)
+        self._signatures.setdefault(signature, row)
+
+        skill_ids = self._intern_skills(candidate.skills)
+        end = self._skill_count + len(skill_ids)
+        if end > len(self._skill_ids):
+            self._skill_ids = np.resize(self._skill_ids, max(end, len(self._skill_ids) * 2))
+        self._skill_ids[self._skill_count:end] = skill_ids
+        self._skill_count = end
+        self._skill_offsets[row + 1] = end
+        return True
+
+    def extend(self, candidates: Iterable[CandidateProfile], dedup: bool = True) -> List[CandidateProfile]:
+        """Add candidates, skipping duplicates unless dedup is False. Returns the candidates actually added."""
+        return [candidate for candidate in candidates if self.add(candidate, dedup=dedup)]
+
+    def _ensure_capacity(self, size: int) -> None:
+        capacity = len(self._scores)
+        if size <= capacity:
+            return
+        new_capacity = max(size, capacity * 2)
+        self._scores = np.concatenate([self._scores, np.full(new_capacity - capacity, np.nan, dtype=np.float32)])
+        self._dimensions = np.concatenate([
+            self._dimensions,
+            np.full((new_capacity - capacity, len(DIMENSIONS)), np.nan, dtype=np.float32)
+        ])
+        self._skill_offsets = np.resize(self._skill_offsets, new_capacity + 1)
+
+    def _intern_skills(self, skills: Iterable[str]) -> List[int]:
+        ids = []
+        for skill in skills:
+            key = skill.strip().lower()
+            if not key:
+                continue
+            skill_id = self._skill_vocab.get(key)
+            if skill_id is None:
+                skill_id = len(self._skill_names)
+                key = sys.intern(key)
+                self._skill_vocab[key] = skill_id
+                self._skill_names.append(key)
+            ids.append(skill_id)
+        return ids
+
+    def _row_skill_ids(self, row: int) -> np.ndarray:
+        return self._skill_ids[self._skill_offsets[row]:self._skill_offsets[row + 1]]
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return candidate_id in self._index
+
+    def __iter__(self) -> Iterator[CandidateProfile]:
+        return iter(self._profiles)
+
+    @property
+    def profiles(self) -> List[CandidateProfile]:
+        """Profiles in insertion order. Do not mutate the returned list."""
+        return self._profiles
+
+    def get(self, candidate_id: str) -> Optional[CandidateProfile]:
+        """Get a profile by candidate id."""
+        row = self._index.get(candidate_id)
+        return self._profiles[row] if row is not None else None
+
+    def row(self, index: int) -> CandidateRow:
+        return CandidateRow(self, index)
+
+    def rows(self, indices: Iterable[int]) -> List[CandidateRow]:
+        return [CandidateRow(self, int(i)) for i in indices]
+
+    # ------------------------------------------------------------------
+    # Scores
+    # ------------------------------------------------------------------
+
+    def set_rankings(self, rankings: Iterable[CandidateRanking]) -> None:
+        """Replace the stored rankings. Rankings for unknown candidates are ignored."""
+        size = len(self._profiles)
+        self._rankings = [None] * size
+        self._scores[:size] = np.nan
+        self._dimensions[:size] = np.nan
+
+        rows, scores, dimensions = [], [], []
+        for ranking in rankings:
+            row = self._index.get(ranking.candidate_id)
+            if row is None:
+                continue
+            self._rankings[row] = ranking
+            rows.append(row)
+            scores.append(ranking.overall_score)
+            dims = ranking.dimension_scores
+            dimensions.append([getattr(dims, name) for name in DIMENSIONS])
+        if rows:
+            self._scores[rows] = scores
+            self._dimensions[rows] = dimensions
+
+    @property
+    def scores(self) -> np.ndarray:
+        """Overall score per row (NaN for unranked rows)."""
+        return self._scores[:len(self._profiles)]
+
+    @property
+    def dimensions(self) -> np.ndarray:
+        """(rows, 6) matrix of dimension scores, columns ordered as DIMENSIONS."""
+        return self._dimensions[:len(self._profiles)]
+
+    def top(self, k: int, mask: Optional[np.ndarray] = None) -> List[CandidateRow]:
+        """The k highest-scoring ranked rows, best first."""
+        scores = self.scores
+        candidates = ~np.isnan(scores)
+        if mask is not None:
+            candidates &= mask
+        indices = np.flatnonzero(candidates)
+        if k <= 0 or len(indices) == 0:
+            return []
+        if len(indices) > k:
+            indices = indices[np.argpartition(-scores[indices], k - 1)[:k]]
+        # Stable sort keeps insertion order among equal scores
+        return self.rows(indices[np.argsort(-scores[indices], kind='stable')])
+
+    def filter(self, min_score: Optional[float] = None, min_dimensions: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """Boolean row mask for score thresholds."""
+        mask = np.ones(len(self._profiles), dtype=bool)
+        if min_score is not None:
+            mask &= self.scores >= min_score
+        for name, threshold in (min_dimensions or {}).items():
+            mask &= self.dimensions[:, DIMENSIONS.index(name)] >= threshold
+        return mask
+
+    def skill_overlap(self, skills: Iterable[str]) -> np.ndarray:
+        """Number of the given skills each row has (case-insensitive)."""
+        wanted = [self._skill_vocab[key] for key in {s.strip().lower() for s in skills} if key in self._skill_vocab]
+        counts = np.zeros(len(self._profiles), dtype=np.int32)
+        if not wanted or self._skill_count == 0:
+            return counts
+        hits = np.isin(self._skill_ids[:self._skill_count], wanted).astype(np.int32)
+        cumulative = np.concatenate([[0], np.cumsum(hits)])
+        offsets = self._skill_offsets[:len(self._profiles) + 1]
+        return (cumulative[offsets[1:]] - cumulative[offsets[:-1]]).astype(np.int32)
+
+
+__all__ = ['CandidatePool', 'CandidateRow', 'DIMENSIONS']
@@ -0,0 +1,68 @@
+"""
+JSON serialization helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. orjson serializes datetimes, enums, UUIDs, dataclasses and NumPy
+arrays natively; Pydantic models are handed over as ``model_dump()`` dicts so
+nested rankings and dimension scores never round-trip through
+``model_dump(mode="json")``.
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """Fallback encoder for types the JSON backend does not know about."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, 'tolist'):  # NumPy arrays and scalars
+        return obj.tolist()
+    return str(obj)
+
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes, optionally indented by two spaces."""
+        options = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, default=_default, option=options)
+
+    def dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize to a JSON string, optionally indented by two spaces."""
+        return dumps_bytes(obj, indent).decode('utf-8')
+
+    loads = orjson.loads
+else:
+    def dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize to a JSON string, optionally indented by two spaces."""
+        return json.dumps(obj, default=_default, ensure_ascii=False, indent=2 if indent else None)
+
+    def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes, optionally indented by two spaces."""
+        return dumps(obj, indent).encode('utf-8')
+
+    loads = json.loads
+
+
+__all__ = ['dumps', 'dumps_bytes', 'loads', 'ORJSON_AVAILABLE']
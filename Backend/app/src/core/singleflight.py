@@ -0,0 +1,87 @@
+"""
+Single-flight deduplication of concurrent identical work.
+
+When several callers ask for the same result at the same time (two recruiters
+uploading the same JD, the same shortlist ranked twice), only the first runs
+the computation; the others wait for it and share its result or its
+exception. Nothing is cached: once the call finishes the key is forgotten, so
+a later identical request runs again.
+
+Keys are content hashes (``content_key()``) so identical inputs collapse no
+matter which request, user or object they came from. Deduplication is per
+process; workers in separate processes do not share in-flight calls.
+"""
+
+import functools
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+from src.core import metrics, serialization
+
+
+def content_key(*parts: Any) -> str:
+    """SHA-256 of the JSON serialization of `parts` (Pydantic models included)."""
+    return hashlib.sha256(serialization.dumps_bytes(parts)).hexdigest()
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+
+    def do(self, key: str, fn: Callable, *args, **kwargs) -> Any:
+        """Return fn(*args, **kwargs), or the result of an identical call already running."""
+        with self._lock:
+            leader = self._calls.get(key)
+            if leader is None:
+                future: Future = Future()
+                self._calls[key] = future
+        metrics.record_cache(self.name, hit=leader is not None)
+        if leader is not None:
+            return leader.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        with self._lock:
+            return len(self._calls)
+
+
+def single_flight(name: str, key: Callable[..., Optional[str]]) -> Callable:
+    """Decorator: deduplicate concurrent calls whose ``key(*args, **kwargs)`` match.
+
+    A key of None runs the call without deduplication. The wrapped function's
+    SingleFlight is exposed as ``.flight``.
+    """
+    def decorator(func: Callable) -> Callable:
+        flight = SingleFlight(name)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            call_key = key(*args, **kwargs)
+            if call_key is None:
+                return func(*args, **kwargs)
+            return flight.do(call_key, func, *args, **kwargs)
+
+        wrapper.flight = flight
+        return wrapper
+    return decorator
+
+
+__all__ = ['content_key', 'SingleFlight', 'single_flight']
@@ -0,0 +1,324 @@
+"""
+Skill taxonomy: canonical skills, their aliases, and fast matching.
+
+Every skill has a canonical integer ID and display name. Its aliases
+("k8s", "kubernetes"; "postgres", "postgresql") all map to that ID, so the JD
+parser, the resume extractor and the ranker agree on what counts as the same
+skill, and skill overlap is integer set intersection.
+
+``SkillTaxonomy.extract()`` finds every alias in a text in one linear pass
+with an Aho-Corasick automaton built once per process when pyahocorasick is
+installed, or a trie walked from each token start otherwise. Matches must
+sit on token boundaries, so 'go' does not match inside 'google' and 'java'
+not inside 'javascript'; overlapping matches resolve to the longest ('spring
+boot' over 'spring'). Aliases that are also ordinary English words ('Go',
+'R', 'Swift', 'Excel', 'REST') only match with the capitalization listed in
+``cased``.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+@dataclass(frozen=True)
+class Skill:
+    """A canonical skill. ``aliases`` match in any case, ``cased`` only as written."""
+    name: str
+    category: str
+    aliases: Tuple[str, ...] = ()
+    cased: Tuple[str, ...] = ()
+
+
+SKILLS: Tuple[Skill, ...] = (
+    # Programming languages
+    Skill('Python', 'language', ('python', 'python3')),
+    Skill('Java', 'language', ('java',)),
+    Skill('JavaScript', 'language', ('javascript', 'js', 'es6', 'ecmascript')),
+    Skill('TypeScript', 'language', ('typescript',)),
+    Skill('C++', 'language', ('c++', 'cpp')),
+    Skill('C#', 'language', ('c#', 'csharp')),
+    Skill('Go', 'language', ('golang',), ('Go', 'GO')),
+    Skill('Rust', 'language', ('rust',)),
+    Skill('PHP', 'language', ('php',)),
+    Skill('Ruby', 'language', ('ruby',)),
+    Skill('Swift', 'language', (), ('Swift',)),
+    Skill('Kotlin', 'language', ('kotlin',)),
+    Skill('Scala', 'language', ('scala',)),
+    Skill('R', 'language', (), ('R',)),
+    Skill('MATLAB', 'language', ('matlab',)),
+    Skill('SQL', 'language', ('sql',)),
+    Skill('HTML', 'language', ('html', 'html5')),
+    Skill('CSS', 'language', ('css', 'css3')),
+    Skill('Bash', 'language', ('bash', 'shell scripting')),
+    # Frameworks and libraries
+    Skill('React', 'framework', ('react.js', 'reactjs', 'react native'), ('React',)),
+    Skill('Angular', 'framework', ('angular', 'angularjs')),
+    Skill('Vue', 'framework', ('vue', 'vue.js', 'vuejs')),
+    Skill('Node.js', 'framework', ('node.js', 'nodejs', 'node js')),
+    Skill('Express', 'framework', ('express.js', 'expressjs'), ('Express',)),
+    Skill('Django', 'framework', ('django',)),
+    Skill('Flask', 'framework', ('flask',)),
+    Skill('FastAPI', 'framework', ('fastapi',)),
+    Skill('Spring', 'framework', (), ('Spring',)),
+    Skill('Spring Boot', 'framework', ('spring boot', 'springboot')),
+    Skill('Laravel', 'framework', ('laravel',)),
+    Skill('Rails', 'framework', ('rails', 'ruby on rails')),
+    Skill('ASP.NET', 'framework', ('asp.net',)),
+    Skill('.NET', 'framework', ('.net', 'dotnet', '.net core')),
+    Skill('jQuery', 'framework', ('jquery',)),
+    Skill('Bootstrap', 'framework', (), ('Bootstrap',)),
+    Skill('TensorFlow', 'framework', ('tensorflow',)),
+    Skill('PyTorch', 'framework', ('pytorch', 'torch')),
+    Skill('scikit-learn', 'framework', ('scikit-learn', 'sklearn', 'scikit learn')),
+    Skill('Pandas', 'framework', ('pandas',)),
+    Skill('NumPy', 'framework', ('numpy',)),
+    # Data platforms and databases
+    Skill('Spark', 'data', ('apache spark', 'pyspark'), ('Spark',)),
+    Skill('Hadoop', 'data', ('hadoop',)),
+    Skill('Kafka', 'data', ('kafka', 'apache kafka')),
+    Skill('Airflow', 'data', ('airflow', 'apache airflow')),
+    Skill('MySQL', 'database', ('mysql',)),
+    Skill('PostgreSQL', 'database', ('postgresql', 'postgres')),
+    Skill('MongoDB', 'database', ('mongodb', 'mongo')),
+    Skill('Redis', 'database', ('redis',)),
+    Skill('Elasticsearch', 'database', ('elasticsearch', 'elastic search')),
+    Skill('Cassandra', 'database', ('cassandra',)),
+    Skill('Oracle', 'database', ('oracle', 'oracle db')),
+    Skill('SQLite', 'database', ('sqlite',)),
+    Skill('DynamoDB', 'database', ('dynamodb',)),
+    Skill('Snowflake', 'database', ('snowflake',)),
+    # Cloud and DevOps
+    Skill('AWS', 'cloud', ('aws', 'amazon web services')),
+    Skill('Azure', 'cloud', ('azure', 'microsoft azure')),
+    Skill('GCP', 'cloud', ('gcp', 'google cloud', 'google cloud platform')),
+    Skill('Docker', 'devops', ('docker',)),
+    Skill('Kubernetes', 'devops', ('kubernetes', 'k8s')),
+    Skill('Jenkins', 'devops', ('jenkins',)),
+    Skill('CI/CD', 'devops', ('ci/cd', 'cicd', 'continuous integration')),
+    Skill('Terraform', 'devops', ('terraform',)),
+    Skill('Ansible', 'devops', ('ansible',)),
+    Skill('Chef', 'devops', (), ('Chef',)),
+    Skill('Puppet', 'devops', (), ('Puppet',)),
+    Skill('Git', 'devops', ('git',)),
+    Skill('GitHub', 'devops', ('github',)),
+    Skill('GitLab', 'devops', ('gitlab',)),
+    Skill('Bitbucket', 'devops', ('bitbucket',)),
+    Skill('Linux', 'platform', ('linux',)),
+    Skill('Unix', 'platform', ('unix',)),
+    Skill('Windows', 'platform', (), ('Windows',)),
+    # Architecture
+    Skill('API', 'architecture', ('api', 'apis')),
+    Skill('REST', 'architecture', ('rest api', 'rest apis', 'restful'), ('REST',)),
+    Skill('GraphQL', 'architecture', ('graphql',)),
+    Skill('Microservices', 'architecture', ('microservices', 'microservice')),
+    # Data science and AI
+    Skill('AI', 'data_science', ('artificial intelligence',), ('AI',)),
+    Skill('Machine Learning', 'data_science', ('machine learning',), ('ML',)),
+    Skill('Deep Learning', 'data_science', ('deep learning',)),
+    Skill('NLP', 'data_science', ('nlp', 'natural language processing')),
+    Skill('Computer Vision', 'data_science', ('computer vision',)),
+    Skill('Data Science', 'data_science', ('data science',)),
+    Skill('Data Analysis', 'data_science', ('data analysis',)),
+    Skill('Analytics', 'data_science', ('analytics',)),
+    Skill('Tableau', 'data_science', ('tableau',)),
+    Skill('Power BI', 'data_science', ('power bi', 'powerbi')),
+    Skill('Excel', 'tool', ('ms excel', 'microsoft excel'), ('Excel',)),
+    Skill('Figma', 'tool', ('figma',)),
+    Skill('Jira', 'tool', ('jira',)),
+    # Practices and soft skills
+    Skill('Agile', 'practice', ('agile',)),
+    Skill('Scrum', 'practice', ('scrum',)),
+    Skill('Project Management', 'practice', ('project management',)),
+    Skill('Leadership', 'soft', ('leadership',)),
+    Skill('Communication', 'soft', ('communication', 'communication skills')),
+)
+
+# Characters that continue a token: a match next to one is inside a longer word
+_WORD_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_+#&')
+_DOTTED = frozenset('.' + char for char in 'abcdefghijklmnopqrstuvwxyz0123456789')
+_WHITESPACE = str.maketrans('\t\n\r\f\v', '     ')
+_SPACES = re.compile(r'\s+')
+# Where an alias can start: any punctuation ('.net'), or a word character not preceded by one
+_TOKEN_START = re.compile(r'[^a-z0-9_+#&\s]|(?<![a-z0-9_+#&])\S')
+_TERMINAL = ''  # trie key holding a node's value; never a character of the text
+
+
+def normalize_skill(term: str) -> str:
+    """Lowercase and collapse whitespace; the key aliases are looked up by."""
+    return _SPACES.sub(' ', term).strip().lower()
+
+
+class _TokenTrie:
+    """Pure-Python stand-in for pyahocorasick's automaton, with the same
+    add_word / make_automaton / iter interface.
+
+    Aliases only count when they start on a token boundary, so instead of
+    stepping a goto/fail automaton through every character (slow in Python),
+    the trie is walked from each token start found by one C-level regex scan;
+    most walks end after a character or two.
+    """
+
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+
+    def add_word(self, word: str, value: Any) -> None:
+        node = self._root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_TERMINAL] = value
+
+    def make_automaton(self) -> None:
+        pass
+
+    def iter(self, text: str):
+        root = self._root
+        for start in _TOKEN_START.finditer(text):
+            node = root
+            for index in range(start.start(), len(text)):
+                node = node.get(text[index])
+                if node is None:
+                    break
+                if _TERMINAL in node:
+                    yield index, node[_TERMINAL]
+
+
+class SkillTaxonomy:
+    """Canonical skills with an alias automaton built once; safe to share between threads."""
+
+    def __init__(self, skills: Iterable[Skill] = SKILLS):
+        self.skills: Tuple[Skill, ...] = tuple(skills)
+        self._by_alias: Dict[str, int] = {}
+        # Automaton key (lowercase) -> (alias as written, skill ID, must match case)
+        entries: Dict[str, List[Tuple[str, int, bool]]] = {}
+        for skill_id, skill in enumerate(self.skills):
+            aliases = {normalize_skill(alias) for alias in skill.aliases}
+            if skill.name not in skill.cased:
+                aliases.add(normalize_skill(skill.name))
+            for alias in aliases:
+                self._by_alias.setdefault(alias, skill_id)
+                entries.setdefault(alias, []).append((alias, skill_id, False))
+            for alias in skill.cased:
+                entries.setdefault(alias.lower(), []).append((alias, skill_id, True))
+        for skill_id, skill in enumerate(self.skills):
+            # A cased alias standing alone as a skill entry ('go' in a skills list) is unambiguous
+            for alias in skill.cased:
+                self._by_alias.setdefault(alias.lower(), skill_id)
+
+        automaton = ahocorasick.Automaton() if AHOCORASICK_AVAILABLE else _TokenTrie()
+        for key, values in entries.items():
+            automaton.add_word(key, tuple(values))
+        automaton.make_automaton()
+        self._automaton = automaton
+        # Free-form skills outside the taxonomy get IDs past the canonical range
+        self._interned: Dict[str, int] = {}
+        self._intern_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def name(self, skill_id: int) -> Optional[str]:
+        """Display name of a canonical skill ID (None for interned free-form skills)."""
+        return self.skills[skill_id].name if 0 <= skill_id < len(self.skills) else None
+
+    def find(self, text: str) -> List[Tuple[int, int, int]]:
+        """Non-overlapping (start, end, skill_id) matches on token boundaries, longest first."""
+        if not text:
+            return []
+        lowered = text.translate(_WHITESPACE).lower()
+        matches = []
+        for end_index, values in self._automaton.iter(lowered):
+            end = end_index + 1
+            for alias, skill_id, cased in values:
+                start = end - len(alias)
+                if start > 0 and lowered[start - 1] in _WORD_CHARS and alias[0] in _WORD_CHARS:
+                    continue
+                if end < len(lowered) and alias[-1] in _WORD_CHARS and (
+                        lowered[end] in _WORD_CHARS or lowered[end:end + 2] in _DOTTED):
+                    continue  # inside a longer word, or a domain like github.com
+                if cased and text[start:end] != alias:
+                    continue
+                matches.append((start, end, skill_id))
+        matches.sort(key=lambda match: (match[0], match[0] - match[1]))
+        selected, covered = [], 0
+        for start, end, skill_id in matches:
+            if start >= covered:
+                selected.append((start, end, skill_id))
+                covered = end
+        return selected
+
+    def extract_ids(self, text: str) -> List[int]:
+        """Canonical IDs of the skills mentioned in ``text``, in order of first mention."""
+        return list(dict.fromkeys(skill_id for _, _, skill_id in self.find(text)))
+
+    def extract(self, text: str) -> List[str]:
+        """Display names of the skills mentioned in ``text``, in order of first mention."""
+        return [self.skills[skill_id].name for skill_id in self.extract_ids(text)]
+
+    def canonical_id(self, term: str) -> Optional[int]:
+        """Canonical ID of a skill name or alias ('k8s' -> Kubernetes), None if unknown."""
+        return self._by_alias.get(normalize_skill(term))
+
+    def canonical_name(self, term: str) -> str:
+        """Display name for a skill term; unknown terms are returned trimmed."""
+        skill_id = self.canonical_id(term)
+        return self.skills[skill_id].name if skill_id is not None else term.strip()
+
+    def ids(self, terms: Iterable[str]) -> FrozenSet[int]:
+        """IDs for a list of skill strings, for overlap by set intersection.
+
+        Known aliases map to canonical IDs; a compound entry ('Python/Django')
+        contributes every skill it mentions; anything else is interned so
+        identical free-form skills still match each other.
+        """
+        ids = set()
+        for term in terms:
+            if not term:
+                continue
+            skill_id = self.canonical_id(term)
+            if skill_id is None:
+                found = self.extract_ids(term)
+                if found:
+                    ids.update(found)
+                    continue
+                skill_id = self._intern(normalize_skill(term))
+            ids.add(skill_id)
+        return frozenset(ids)
+
+    def _intern(self, key: str) -> int:
+        skill_id = self._interned.get(key)
+        if skill_id is None:
+            with self._intern_lock:
+                skill_id = self._interned.setdefault(key, len(self.skills) + len(self._interned))
+        return skill_id
+
+
+_taxonomy: Optional[SkillTaxonomy] = None
+_taxonomy_lock = threading.Lock()
+
+
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """The process-wide taxonomy; its automaton is built on first use."""
+    global _taxonomy
+    if _taxonomy is None:
+        with _taxonomy_lock:
+            if _taxonomy is None:
+                _taxonomy = SkillTaxonomy()
+    return _taxonomy
+
+
+__all__ = [
+    'AHOCORASICK_AVAILABLE',
+    'Skill',
+    'SKILLS',
+    'SkillTaxonomy',
+    'normalize_skill',
+    'get_skill_taxonomy',
+]
@@ -0,0 +1,214 @@
+"""
+Distributed tracing for the recruitment pipeline and the API.
+
+Spans cover API requests, workflow runs and steps, ranking batches, discovery
+seeds and every external call (the latter through metrics.external_call), so
+one recruiter action can be followed from the router down to each OpenAI,
+Gemini, PDL or Supabase request. Spans are exported with OpenTelemetry when
+opentelemetry-sdk is installed; without it ``span()`` is a no-op.
+
+Exporters (``configure()``):
+    none      spans are created but not exported (default)
+    console   one JSON span per line on stdout
+    file      one JSON span per line appended to a file
+    otlp      OTLP/HTTP to a collector (OTEL_EXPORTER_OTLP_ENDPOINT,
+              default http://localhost:4318)
+
+Log records get ``trace_id`` and ``span_id`` attributes through
+``TraceContextFilter`` so log lines can be joined to their trace.
+"""
+
+import functools
+import logging
+import sys
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    from opentelemetry.trace import Status, StatusCode
+    OTEL_AVAILABLE = True
+except ImportError:
+    OTEL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+EXPORTERS = ('none', 'console', 'file', 'otlp')
+
+_configured = False
+
+
+class _NoopSpan:
+    """Stand-in for an OpenTelemetry span when opentelemetry is not installed."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, description: str) -> None:
+        pass
+
+    def update_name(self, name: str) -> None:
+        pass
+
+
+class _Span:
+    """Thin wrapper so callers don't depend on the OpenTelemetry API directly."""
+
+    __slots__ = ('_span',)
+
+    def __init__(self, otel_span):
+        self._span = otel_span
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self._span.set_attribute(key, value)
+
+    def set_error(self, description: str) -> None:
+        """Mark the span failed without an exception (e.g. a non-2xx HTTP response)."""
+        self._span.set_status(Status(StatusCode.ERROR, description))
+
+    def update_name(self, name: str) -> None:
+        self._span.update_name(name)
+
+
+if OTEL_AVAILABLE:
+    class _FileSpanExporter(ConsoleSpanExporter):
+        """JSON-lines span exporter that closes its file when the provider shuts down.
+
+        TracerProvider shuts down at interpreter exit, after flushing its batch
+        processor, so the last spans are written before the file is closed.
+        """
+
+        def shutdown(self) -> None:
+            super().shutdown()
+            self.out.close()
+
+
+def configure(exporter: str = 'none', service_name: str = 'recruitment-pipeline',
+              trace_file: Optional[str] = None) -> bool:
+    """Install the global tracer provider. Returns False if tracing stays disabled."""
+    global _configured
+    exporter = (exporter or 'none').lower()
+    if exporter not in EXPORTERS:
+        raise ValueError(f"Trace exporter must be one of: {list(EXPORTERS)}")
+    if exporter == 'none' or _configured:
+        return _configured
+    if not OTEL_AVAILABLE:
+        logger.warning("opentelemetry-sdk is not installed; tracing disabled")
+        return False
+
+    if exporter == 'otlp':
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError:
+            logger.warning("opentelemetry-exporter-otlp-proto-http is not installed; tracing disabled")
+            return False
+        span_exporter = OTLPSpanExporter()
+    elif exporter == 'file':
+        out = open(trace_file or 'traces.jsonl', 'a', encoding='utf-8')
+        span_exporter = _FileSpanExporter(out=out, formatter=lambda s: s.to_json(indent=None) + "\n")
+    else:
+        span_exporter = ConsoleSpanExporter(out=sys.stdout, formatter=lambda s: s.to_json(indent=None) + "\n")
+
+    provider = TracerProvider(resource=Resource.create({'service.name': service_name}))
+    provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    trace.set_tracer_provider(provider)
+    _configured = True
+    logger.info(f"Tracing enabled ({exporter} exporter, service {service_name})")
+    return True
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """Run the block in a child span of the current one.
+
+    An exception escaping the block is recorded on the span and re-raised.
+    Attributes that are None are dropped.
+    """
+    if not OTEL_AVAILABLE:
+        yield _NoopSpan()
+        return
+    attrs = {key: value for key, value in attributes.items() if value is not None}
+    with trace.get_tracer(__name__).start_as_current_span(name, attributes=attrs) as otel_span:
+        yield _Span(otel_span)
+
+
+def traced(name: str) -> Callable:
+    """Decorator form of span() for whole functions."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def current_trace_id() -> Optional[str]:
+    """Hex id of the active trace, or None outside a recorded span."""
+    if not OTEL_AVAILABLE:
+        return None
+    context = trace.get_current_span().get_span_context()
+    return format(context.trace_id, '032x') if context.is_valid else None
+
+
+class TraceContextFilter(logging.Filter):
+    """Adds trace_id and span_id ('-' when there is none) to every log record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.trace_id = '-'
+        record.span_id = '-'
+        if OTEL_AVAILABLE:
+            context = trace.get_current_span().get_span_context()
+            if context.is_valid:
+                record.trace_id = format(context.trace_id, '032x')
+                record.span_id = format(context.span_id, '016x')
+        return True
+
+
+def instrument_fastapi(app) -> None:
+    """Open a server span per API request.
+
+    Uses opentelemetry-instrumentation-fastapi when installed (which also
+    continues incoming traceparent headers); otherwise a middleware that
+    names spans after the matched route.
+    """
+    if not OTEL_AVAILABLE:
+        return
+    try:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    except ImportError:
+        pass
+    else:
+        FastAPIInstrumentor.instrument_app(app, excluded_urls="metrics,health")
+        return
+
+    @app.middleware("http")
+    async def trace_requests(request, call_next):
+        if request.url.path in ("/metrics", "/health"):
+            return await call_next(request)
+        with span(f"HTTP {request.method}", **{'http.method': request.method, 'http.target': request.url.path}) as request_span:
+            response = await call_next(request)
+            route = request.scope.get('route')
+            if route is not None:
+                request_span.update_name(f"{request.method} {route.path}")
+                request_span.set_attribute('http.route', route.path)
+            request_span.set_attribute('http.status_code', response.status_code)
+            if response.status_code >= 500:
+                request_span.set_error(f"HTTP {response.status_code}")
+            return response
+
+
+__all__ = [
+    'OTEL_AVAILABLE',
+    'EXPORTERS',
+    'configure',
+    'span',
+    'traced',
+    'current_trace_id',
+    'TraceContextFilter',
+    'instrument_fastapi',
+]
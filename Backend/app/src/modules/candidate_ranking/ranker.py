@@ -1380,13 +1380,21 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional, Union
 import requests
 from datetime import datetime
-import fitz
 
+from src.config import providers
 from src.config.settings import get_settings
 from src.core.models import (
     CandidateProfile, CandidateRanking, JobDescription, 
     ConfidenceLevel, DimensionScores
 )
+from src.core import metrics, serialization, tracing
+from src.core.llm_backends import estimate_cost
+from src.core.llm_gateway import Priority, get_gateway
+from src.core.singleflight import content_key, single_flight
+from src.core.skills import get_skill_taxonomy
+from src.core.pool import CandidatePool
+from src.core.pdf_text import extract_pdf_text
+from src.storage.result_sink import get_result_sink
 
 logger = logging.getLogger(__name__)
 
@@ -1397,11 +1405,11 @@ class CandidateRanker:
     def __init__(self):
         """Initialize the ranker with settings and configur ations."""
         self.settings = get_settings()
-        self.openai_client = None
+        self.llm = get_gateway()
         self.gemini_client = None
         
-        # OpenAI configuration with token management
-        self.openai_model = getattr(self.settings, 'openai_model', 'gpt-4o')
+        # OpenAI configuration with token management; the model is the ranking route's
+        self.openai_model = self.llm.model('ranking')
         self.openai_temperature = getattr(self.settings, 'openai_temperature', 0.1)
         self.openai_max_tokens = getattr(self.settings, 'openai_max_tokens', 8000)
         self.openai_timeout = getattr(self.settings, 'openai_timeout', 60)
@@ -1490,22 +1498,30 @@ class CandidateRanker:
                 
                 logger.info(f"Processing batch {batch_num}/{total_batches}")
                 
-                batch_rankings = self._rank_batch_with_ai(job_data, batch)
+                with tracing.span('ranker.batch', batch=batch_num, total_batches=total_batches, batch_size=len(batch)):
+                    batch_rankings = self._rank_batch_with_ai(job_data, batch)
                 all_rankings.extend(batch_rankings)
             
             # Sort by overall score (descending)
             all_rankings.sort(key=lambda x: x.overall_score, reverse=True)
             
+            metrics.record_ranked(len(all_rankings))
             logger.info(f"Successfully ranked {len(all_rankings)} candidates")
             return all_rankings
             
         except Exception as e:
             logger.error(f"Error in candidate ranking: {e}")
             # Return emergency rankings
+            metrics.record_fallback('ranking', 'emergency', len(validated_candidates))
+            metrics.record_ranked(len(validated_candidates))
             return self._create_emergency_rankings(validated_candidates, job_data)
     
-    def rank_candidates_with_discovery(self, job_data: JobDescription, candidates: List[CandidateProfile], jd_file_path: Optional[str] = None, prompt_addon: Optional[str] = None) -> Dict[str, Any]:
-        """Rank candidates with iterative discovery using Gemini 2.5 Pro."""
+    def rank_candidates_with_discovery(self, job_data: JobDescription, candidates: List[CandidateProfile], jd_file_path: Optional[str] = None, prompt_addon: Optional[str] = None, jd_text: Optional[str] = None) -> Dict[str, Any]:
+        """Rank candidates with iterative discovery using Gemini 2.5 Pro.
+
+        The discovery prompts quote the JD: ``jd_text`` (the JD artifact's) when
+        given, else the text of ``jd_file_path``, extracted once for all seeds.
+        """
         logger.info(" Starting iterative candidate discovery process...")
         
         # Initial ranking
@@ -1531,8 +1547,12 @@ class CandidateRanker:
                 'discovery_data': {}
             }
         
-        # Iterative discovery
-        all_candidates = list(candidates)  # Start with original candidates
+        if jd_text is None:
+            jd_text = self._read_jd_text(jd_file_path)
+
+        # Iterative discovery; the pool indexes candidates by id and dedup signature.
+        # Initial candidates are all kept; only discovered ones are deduplicated against them.
+        pool = CandidatePool(self._validate_and_flatten_candidates(candidates), dedup=False)
         discovery_stats = {
             'iterations': 0,
             'candidates_discovered': 0,
@@ -1549,31 +1569,25 @@ class CandidateRanker:
             logger.info(f"\n Discovery Iteration {iteration}/{self.discovery_max_iterations}")
             
             # Get top candidates as seeds
-            current_rankings = self.rank_candidates(job_data, all_candidates)
-            top_seeds = current_rankings[:self.discovery_top_seeds]
+            pool.set_rankings(self.rank_candidates(job_data, pool.profiles))
+            top_seeds = pool.top(self.discovery_top_seeds)
             
             logger.info(f" Using top {len(top_seeds)} candidates as seeds")
             
             iteration_candidates = []
             
-            for seed_idx, seed_ranking in enumerate(top_seeds, 1):
+            for seed_idx, seed_row in enumerate(top_seeds, 1):
+                seed_candidate = seed_row.profile
+                seed_ranking = seed_row.ranking
                 logger.info(f" Processing seed {seed_idx}/{len(top_seeds)}: {seed_ranking.candidate_name}")
                 
-                # Find the original candidate profile for this ranking
-                seed_candidate = None
-                for candidate in all_candidates:
-                    if candidate.candidate_id == seed_ranking.candidate_id:
-                        seed_candidate = candidate
-                        break
-                
-                if not seed_candidate:
-                    logger.warning(f"Could not find original candidate profile for {seed_ranking.candidate_name}")
-                    continue
-                
                 # Discover similar candidates
-                discovered = self._discover_similar_candidates(
-                    job_data, seed_candidate, seed_ranking, iteration, jd_file_path, prompt_addon=prompt_addon
-                )
+                with tracing.span('discovery.seed', iteration=iteration, seed=seed_idx,
+                                  candidate_id=seed_candidate.candidate_id) as seed_span:
+                    discovered = self._discover_similar_candidates(
+                        job_data, seed_candidate, seed_ranking, iteration, jd_text, prompt_addon=prompt_addon
+                    )
+                    seed_span.set_attribute('discovered', len(discovered or []))
                 
                 discovery_stats['total_api_calls'] += 1
                 if discovered:
@@ -1584,9 +1598,9 @@ class CandidateRanker:
                     discovery_stats['failed_calls'] += 1
                     logger.info(f"    No valid candidates found from seed")
             
-            # Deduplicate candidates
+            # Add to candidate pool, dropping duplicates of known candidates
             before_dedup = len(iteration_candidates)
-            iteration_candidates = self._deduplicate_candidates(iteration_candidates, all_candidates)
+            iteration_candidates = pool.extend(iteration_candidates)
             after_dedup = len(iteration_candidates)
             
             logger.info(f" Deduplicated: {before_dedup} → {after_dedup} candidates")
@@ -1595,17 +1609,15 @@ class CandidateRanker:
                 logger.warning(f"No new candidates discovered in iteration {iteration}")
                 continue
             
-            # Add to candidate pool
-            all_candidates.extend(iteration_candidates)
             discovery_stats['candidates_discovered'] += len(iteration_candidates)
             discovery_stats['iterations'] = iteration
             
             logger.info(f" Added {len(iteration_candidates)} new candidates to pool")
-            logger.info(f" Total candidates now: {len(all_candidates)}")
+            logger.info(f" Total candidates now: {len(pool)}")
         
         # Final ranking with all candidates
         logger.info(" Performing final ranking with all discovered candidates...")
-        final_rankings = self.rank_candidates(job_data, all_candidates)
+        final_rankings = self.rank_candidates(job_data, pool.profiles)
         
         # Update discovery statistics
         discovery_stats['final_count'] = len(final_rankings)
@@ -1688,14 +1700,11 @@ class CandidateRanker:
         return validated
 
     
+    # Concurrent runs ranking the same shortlist for the same job share one batch ranking
+    @single_flight('ranking_batch', key=lambda self, job_data, candidates: content_key(self.openai_model, job_data, candidates))
     def _rank_batch_with_ai(self, job_data: JobDescription, candidates: List[CandidateProfile]) -> List[CandidateRanking]:
         """Rank a batch of candidates using AI analysis."""
         try:
-            # Initialize OpenAI client if needed
-            if not self.openai_client:
-                import openai
-                self.openai_client = openai.OpenAI()
-            
             # Create ranking prompt
             prompt = self._create_ranking_prompt(job_data, candidates)
             
@@ -1707,6 +1716,7 @@ class CandidateRanker:
             
             if not response:
                 logger.warning("OpenAI request failed, using fallback rankings")
+                metrics.record_fallback('ranking', 'request_failed', len(candidates))
                 return self._create_fallback_rankings(candidates, job_data)
             
             # Parse response
@@ -1714,12 +1724,14 @@ class CandidateRanker:
             
             if not rankings:
                 logger.warning("Failed to parse AI response, using fallback rankings")
+                metrics.record_fallback('ranking', 'unparseable_response', len(candidates))
                 return self._create_fallback_rankings(candidates, job_data)
             
             return rankings
             
         except Exception as e:
             logger.error(f"Error in AI ranking: {e}")
+            metrics.record_fallback('ranking', 'exception', len(candidates))
             return self._create_fallback_rankings(candidates, job_data)
     
     def _create_ranking_prompt(self, job_data: JobDescription, candidates: List[CandidateProfile]) -> str:
@@ -1833,15 +1845,15 @@ Return only valid JSON, no additional text.
         try:
             logger.debug(f"OpenAI Request: Model={self.openai_model}, Tokens={self.openai_max_tokens}, Prompt={len(prompt)} chars")
             
-            response = self.openai_client.chat.completions.create(
-                model=self.openai_model,
+            content = self.llm.complete(
+                route='ranking',
                 messages=[{"role": "user", "content": prompt}],
+                operation='rank_candidates',
+                priority=Priority.INTERACTIVE,
                 temperature=self.openai_temperature,
                 max_tokens=self.openai_max_tokens,
                 timeout=self.openai_timeout
             )
-            
-            content = response.choices[0].message.content.strip()
             logger.debug(" OpenAI request successful")
             return content
             
@@ -1853,14 +1865,15 @@ Return only valid JSON, no additional text.
                 # Aggressively reduce prompt size
                 reduced_prompt = prompt[:len(prompt)//2]
                 try:
-                    response = self.openai_client.chat.completions.create(
-                        model=self.openai_model,
+                    return self.llm.complete(
+                        route='ranking',
                         messages=[{"role": "user", "content": reduced_prompt}],
+                        operation='rank_candidates',
+                        priority=Priority.INTERACTIVE,
                         temperature=self.openai_temperature,
                         max_tokens=min(self.openai_max_tokens, 2000),
                         timeout=30
                     )
-                    return response.choices[0].message.content.strip()
                 except Exception as retry_error:
                     logger.error(f"Retry failed: {retry_error}")
                     return None
@@ -1981,6 +1994,8 @@ Return only valid JSON, no additional text.
         logger.info("Creating fallback rankings...")
         
         rankings = []
+        taxonomy = get_skill_taxonomy()
+        required_skill_ids = taxonomy.ids(job_data.required_skills or [])
         
         for candidate in candidates:
             # Simple scoring based on available data
@@ -1990,9 +2005,9 @@ Return only valid JSON, no additional text.
             if hasattr(candidate, 'source') and getattr(candidate, 'source') == 'uploaded_resume':
                 score += 0.1
             
-            # Simple skill matching
-            if candidate.skills and job_data.required_skills:
-                skill_overlap = len(set(candidate.skills) & set(job_data.required_skills))
+            # Skill matching on canonical skill IDs ('k8s' matches 'Kubernetes')
+            if candidate.skills and required_skill_ids:
+                skill_overlap = len(taxonomy.ids(candidate.skills) & required_skill_ids)
                 score += min(skill_overlap * 0.05, 0.2)
             
             # Location matching
@@ -2003,8 +2018,9 @@ Return only valid JSON, no additional text.
             # Cap score
             score = min(score, 1.0)
             
-            # Create basic dimension scores
-            dimension_scores = DimensionScores(
+            # Create basic dimension scores. Fallback values are computed here and
+            # already in range, so skip validation.
+            dimension_scores = DimensionScores.model_construct(
                 technical_skills=score,
                 experience_relevance=score,
                 seniority_match=score,
@@ -2017,7 +2033,7 @@ Return only valid JSON, no additional text.
             is_resume_candidate = hasattr(candidate, 'source') and getattr(candidate, 'source') == 'uploaded_resume'
             match_explanation = " UPLOADED RESUME CANDIDATE: Fallback analysis applied due to AI processing limitations." if is_resume_candidate else "Fallback analysis applied due to AI processing limitations."
             
-            ranking = CandidateRanking(
+            ranking = CandidateRanking.model_construct(
                 candidate_id=candidate.candidate_id,
                 candidate_name=candidate.full_name,
                 current_title=candidate.current_title,
@@ -2031,7 +2047,8 @@ Return only valid JSON, no additional text.
                 confidence_level=ConfidenceLevel.LOW,
                 match_explanation=match_explanation,
                 key_differentiators=[],
-                interview_focus_areas=["General background review"]
+                interview_focus_areas=["General background review"],
+                is_fallback=True
             )
             
             rankings.append(ranking)
@@ -2049,9 +2066,9 @@ Return only valid JSON, no additional text.
         
         for i, candidate in enumerate(candidates):
             # Very basic ranking
-            score = 0.4 + (i * 0.01)  # Slight variation
+            score = max(0.4 - (i * 0.001), 0.0)  # Slight variation, kept in range
             
-            dimension_scores = DimensionScores(
+            dimension_scores = DimensionScores.model_construct(
                 technical_skills=score,
                 experience_relevance=score,
                 seniority_match=score,
@@ -2060,7 +2077,7 @@ Return only valid JSON, no additional text.
                 location_compatibility=score
             )
             
-            ranking = CandidateRanking(
+            ranking = CandidateRanking.model_construct(
                 candidate_id=getattr(candidate, 'candidate_id', f'emergency_{i}'),
                 candidate_name=getattr(candidate, 'full_name', f'Candidate {i+1}'),
                 current_title=getattr(candidate, 'current_title', 'Unknown'),
@@ -2074,22 +2091,27 @@ Return only valid JSON, no additional text.
                 confidence_level=ConfidenceLevel.LOW,
                 match_explanation="Emergency ranking applied due to system limitations.",
                 key_differentiators=[],
-                interview_focus_areas=["Complete profile review"]
+                interview_focus_areas=["Complete profile review"],
+                is_fallback=True
             )
             
             rankings.append(ranking)
         
         return rankings
     
-    def _discover_similar_candidates(self, job_data: JobDescription, seed_candidate: CandidateProfile, seed_ranking: CandidateRanking, iteration: int = 1, jd_file_path: Optional[str] = None, prompt_addon: Optional[str] = None) -> List[CandidateProfile]:
+    def _discover_similar_candidates(self, job_data: JobDescription, seed_candidate: CandidateProfile, seed_ranking: CandidateRanking, iteration: int = 1, jd_text: Optional[str] = None, prompt_addon: Optional[str] = None) -> List[CandidateProfile]:
         """Discover similar candidates using Gemini 2.5 Pro with Google Search grounding."""
         try:
             # Create discovery prompt
-            prompt = self._create_discovery_prompt(job_data, seed_candidate, seed_ranking, iteration, jd_file_path, prompt_addon=prompt_addon)
+            prompt = self._create_discovery_prompt(job_data, seed_candidate, seed_ranking, iteration, jd_text, prompt_addon=prompt_addon)
             
             # Make Gemini API call with web search grounding
             response = self._make_gemini_request(prompt)
             
+            if not response:
+                # Gemini failed or is unavailable: fall back to the gateway's web-grounded discovery route
+                response = self._make_discovery_fallback_request(prompt)
+            
             if not response:
                 return []
             
@@ -2102,13 +2124,19 @@ Return only valid JSON, no additional text.
             logger.error(f"Error in candidate discovery: {e}")
             return []
         
-    def extract_text_from_pdf(pdf_path):
-        doc = fitz.open(pdf_path)
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        doc.close()
-        return text
+    @staticmethod
+    def _read_jd_text(pdf_path: Optional[str]) -> str:
+        """The JD text quoted in discovery prompts, from its PDF; empty if unavailable."""
+        if not pdf_path or not os.path.exists(pdf_path):
+            logger.warning(f"JD PDF path not provided or does not exist: {pdf_path}. Falling back to model data.")
+            return ""
+        try:
+            text = extract_pdf_text(pdf_path)
+            logger.info(f"Successfully extracted JD text from: {pdf_path}")
+            return text
+        except Exception as e:
+            logger.error(f"Failed to extract text from PDF {pdf_path}: {e}")
+            return ""
 
     def _create_discovery_prompt(
         self,
@@ -2116,30 +2144,11 @@ Return only valid JSON, no additional text.
         seed_candidate: CandidateProfile,
         seed_ranking: CandidateRanking,
         iteration: int = 1,
-        jd_file_path: Optional[str] = None,
+        jd_text: Optional[str] = None,
         prompt_addon: Optional[str] = None
     ) -> str:
         """Create prompt for Gemini candidate discovery with user's exact format."""
 
-        # Helper function to extract text using fitz
-        def extract_text_from_pdf(pdf_path):
-            if not pdf_path or not os.path.exists(pdf_path):
-                logger.warning(f"JD PDF path not provided or does not exist: {pdf_path}. Falling back to model data.")
-                return ""
-            try:
-                doc = fitz.open(pdf_path)
-                text = ""
-                for page in doc:
-                    text += page.get_text()
-                doc.close()
-                logger.info(f"Successfully extracted JD text from: {pdf_path}")
-                return text
-            except Exception as e:
-                logger.error(f"Failed to extract text from PDF {pdf_path}: {e}")
-                return ""
-            
-        jd_text = extract_text_from_pdf(jd_file_path)
-
         # Fallback if PDF text extraction fails
         if not jd_text:
             jd_text = f"Title: {job_description_model.title}\nRequired Skills: {', '.join(job_description_model.required_skills)}"
@@ -2194,7 +2203,7 @@ Return only valid JSON, no additional text.
 Please provide 5 candidates for a similar position and location (default to India if not mentioned), keeping the strengths of the attached candidate and removing the concerns.
 
 Here is the seed candidate's profile for reference:
-{json.dumps(candidate_json, indent=2)}
+{serialization.dumps(candidate_json, indent=True)}
 
 ---
 Here is the complete job description to match against:
@@ -2217,27 +2226,34 @@ CRITICAL INSTRUCTIONS:
         """Make Gemini API request with retry logic for transient errors."""
         max_retries = 3
         initial_delay = 5  # Start with a 5-second delay
+        start = time.perf_counter()
 
         for attempt in range(max_retries):
             try:
-                import google.generativeai as genai
                 from google.genai import types
 
                 # --- Your existing API call logic ---
-                client = genai.Client(api_key=self.gemini_api_key)
+                client = providers.gemini_client(self.gemini_api_key)
                 google_search_tool = types.Tool(google_search=types.GoogleSearch())
                 config = types.GenerateContentConfig(
                     tools=[google_search_tool],
                     temperature=1.0,
                     max_output_tokens=4000
                 )
-                response = client.models.generate_content(
-                    model=self.gemini_model,
-                    contents=prompt,
-                    config=config
-                )
+                with metrics.external_call('gemini', 'discover_candidates', self.gemini_model) as call:
+                    response = client.models.generate_content(
+                        model=self.gemini_model,
+                        contents=prompt,
+                        config=config
+                    )
+                    call.record_usage(response)
                 # --- End of your existing logic ---
 
+                metrics.record_llm_call(
+                    'discovery', 'gemini', self.gemini_model, time.perf_counter() - start,
+                    estimate_cost(self.gemini_model, *metrics.usage_tokens(response))
+                )
+
                 # If the request succeeds, check for empty text and return
                 if response and response.text:
                     # You can add your grounding metadata checks here
@@ -2269,56 +2285,53 @@ CRITICAL INSTRUCTIONS:
                     return None
         return None
 
+    def _make_discovery_fallback_request(self, prompt: str) -> Optional[str]:
+        """Run the discovery prompt on the gateway's web-search model (the 'discovery' route)."""
+        metrics.record_fallback('discovery', 'gemini_unavailable')
+        try:
+            logger.info(f"Gemini discovery unavailable; using {self.llm.model('discovery')}")
+            return self.llm.complete(
+                route='discovery',
+                messages=[{"role": "user", "content": prompt}],
+                operation='discover_candidates',
+                priority=Priority.STANDARD,
+                web_search_options={},
+                max_tokens=4000
+            ) or None
+        except Exception as e:
+            logger.error(f"Discovery fallback failed: {e}")
+            return None
     
     def _parse_gemini_candidates(self, response: str, iteration: int = 1) -> List[CandidateProfile]:
-        """Parse candidates from Gemini response with OpenAI 4o assistance and save to JSON/CSV."""
-        import json
-        import csv
-        import os
-        import time
+        """Parse candidates from Gemini response with OpenAI 4o assistance and record them in the result sink."""
         import re
         from datetime import datetime
         from typing import List, Dict, Any, Optional
         
         try:
-            # Create results directory
-            results_dir = "results"
-            os.makedirs(results_dir, exist_ok=True)
-            
-            # Generate timestamp for unique filenames
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = datetime.now().isoformat()
             
             logger.info(f" Parsing Gemini response with OpenAI 4o assistance (length: {len(response)} chars)")
             
             # Step 1: Use OpenAI 4o to extract structured candidate data
             candidates_data = self._extract_candidates_with_openai(response)
             
-            # Step 2: Save raw response and parsed data to JSON
-            json_filename = f"gemini_candidates_iter{iteration}_{timestamp}.json"
-            json_path = os.path.join(results_dir, json_filename)
-            
-            json_data = {
+            # Step 2: Record the raw response and the parsed candidates (buffered, written off-thread)
+            sink = get_result_sink()
+            sink.write('gemini_responses', {
                 "iteration": iteration,
                 "timestamp": timestamp,
                 "raw_gemini_response": response,
                 "candidates_count": len(candidates_data),
-                "parsing_method": "openai_4o_assisted",
-                "candidates": candidates_data
-            }
-            
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
-            
-            logger.info(f" Gemini response saved to JSON: {json_path}")
-            
-            # Step 3: Save candidates to CSV
-            csv_filename = f"gemini_candidates_iter{iteration}_{timestamp}.csv"
-            csv_path = os.path.join(results_dir, csv_filename)
-            
-            self._save_candidates_to_csv(candidates_data, csv_path)
-            logger.info(f" Gemini candidates saved to CSV: {csv_path}")
-            
-            # Step 4: Convert to CandidateProfile objects with proper validation handling
+                "parsing_method": "openai_4o_assisted"
+            })
+            sink.write_many('gemini_candidates', (
+                {"iteration": iteration, "timestamp": timestamp, **candidate_data}
+                for candidate_data in candidates_data
+            ))
+            logger.info(f" Recorded {len(candidates_data)} Gemini candidates to {sink.describe()}")
+            
+            # Step 3: Convert to CandidateProfile objects with proper validation handling
             candidates = []
             
             for i, candidate_data in enumerate(candidates_data, 1):
@@ -2391,7 +2404,6 @@ CRITICAL INSTRUCTIONS:
                     continue
             
             logger.info(f" Successfully parsed {len(candidates)} candidates from Gemini response")
-            logger.info(f" Files saved - JSON: {json_path}, CSV: {csv_path}")
             
             return candidates
             
@@ -2402,11 +2414,6 @@ CRITICAL INSTRUCTIONS:
     def _extract_candidates_with_openai(self, gemini_response: str) -> List[Dict[str, Any]]:
         """Use OpenAI 4o to extract structured candidate data from Gemini response."""
         try:
-            # Initialize OpenAI client if needed
-            if not self.openai_client:
-                import openai
-                self.openai_client = openai.OpenAI()
-            
             # Create extraction prompt for OpenAI
             extraction_prompt = f"""
     Extract candidate information from the following Gemini response text and return as a JSON array.
@@ -2453,16 +2460,16 @@ CRITICAL INSTRUCTIONS:
     """
             
             # Make OpenAI request with reduced token limit to avoid truncation
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",
+            content = self.llm.complete(
+                route='extraction',
                 messages=[{"role": "user", "content": extraction_prompt}],
+                operation='extract_candidates',
+                priority=Priority.STANDARD,
                 temperature=0.1,
                 max_tokens=3000,  # Reduced to fit within limits
                 timeout=60
             )
             
-            content = response.choices[0].message.content.strip()
-            
             # Clean and parse JSON response
             if content.startswith('```json'):
                 content = content[7:]
@@ -2536,73 +2543,6 @@ CRITICAL INSTRUCTIONS:
         pattern = r'^[^@]+@[^@]+\.[^@]+$'
         return bool(re.match(pattern, email))
 
-    def _save_candidates_to_csv(self, candidates_data: List[Dict[str, Any]], csv_path: str):
-        """Save candidates data to CSV file."""
-        try:
-            if not candidates_data:
-                logger.warning("No candidates data to save to CSV")
-                return
-            
-            # Define CSV headers
-            headers = [
-                'full_name', 
-                'current_title',
-                'current_company',
-                'location',
-                'linkedin_url',
-                'email',
-                'phone',
-                'skills',
-                'strengths',
-                'experience_summary'
-            ]
-            import csv
-            with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=headers)
-                writer.writeheader()
-                
-                for candidate in candidates_data:
-                    # Convert lists to strings for CSV
-                    row = candidate.copy()
-                    if 'skills' in row and isinstance(row['skills'], list):
-                        row['skills'] = ', '.join(row['skills'])
-                    if 'strengths' in row and isinstance(row['strengths'], list):
-                        row['strengths'] = ' | '.join(row['strengths'])
-                    
-                    # Handle None values
-                    for key in headers:
-                        if row.get(key) is None:
-                            row[key] = ''
-                    
-                    # Only include headers that exist in the data
-                    filtered_row = {k: v for k, v in row.items() if k in headers}
-                    writer.writerow(filtered_row)
-            
-            logger.info(f" Saved {len(candidates_data)} candidates to CSV")
-            
-        except Exception as e:
-            logger.error(f"Error saving candidates to CSV: {e}")
-
-    
-    def _deduplicate_candidates(self, new_candidates: List[CandidateProfile], existing_candidates: List[CandidateProfile]) -> List[CandidateProfile]:
-        """Remove duplicate candidates based on name and company."""
-        
-        # Create set of existing candidate signatures
-        existing_signatures = set()
-        for candidate in existing_candidates:
-            signature = f"{candidate.full_name.lower()}_{candidate.current_company.lower() if candidate.current_company else 'unknown'}"
-            existing_signatures.add(signature)
-        
-        # Filter new candidates
-        unique_candidates = []
-        for candidate in new_candidates:
-            signature = f"{candidate.full_name.lower()}_{candidate.current_company.lower() if candidate.current_company else 'unknown'}"
-            if signature not in existing_signatures:
-                unique_candidates.append(candidate)
-                existing_signatures.add(signature)
-        
-        return unique_candidates
-    
     def _filter_candidates_by_criteria(self, candidates: List[CandidateProfile], job_data: JobDescription) -> List[CandidateProfile]:
         """Filter candidates based on job criteria."""
         
@@ -2687,18 +2627,15 @@ CRITICAL INSTRUCTIONS:
         
         return report
     
-    def enhance_rankings_with_discovery_metadata(self, rankings: List[CandidateRanking], all_candidates: List[CandidateProfile]) -> List[CandidateRanking]:
+    def enhance_rankings_with_discovery_metadata(self, rankings: List[CandidateRanking], all_candidates: Union[CandidatePool, List[CandidateProfile]]) -> List[CandidateRanking]:
         """Enhance rankings with discovery metadata for better tracking."""
         
+        pool = all_candidates if isinstance(all_candidates, CandidatePool) else CandidatePool(all_candidates, dedup=False)
         enhanced_rankings = []
         
         for ranking in rankings:
             # Find the original candidate to get discovery metadata
-            original_candidate = None
-            for candidate in all_candidates:
-                if candidate.candidate_id == ranking.candidate_id:
-                    original_candidate = candidate
-                    break
+            original_candidate = pool.get(ranking.candidate_id)
             
             # Check if this is a discovered candidate
             if original_candidate and hasattr(original_candidate, '_discovery_iteration'):
@@ -2709,23 +2646,8 @@ CRITICAL INSTRUCTIONS:
                 if ' GEMINI 2.5 PRO DISCOVERED CANDIDATE' not in ranking.match_explanation:
                     enhanced_explanation = f" GEMINI 2.5 PRO DISCOVERED CANDIDATE (Iteration {iteration}): {ranking.match_explanation}"
                     
-                    # Create a new ranking with enhanced explanation
-                    enhanced_ranking = CandidateRanking(
-                        candidate_id=ranking.candidate_id,
-                        candidate_name=ranking.candidate_name,
-                        current_title=ranking.current_title,
-                        current_company=ranking.current_company,
-                        linkedin_url=ranking.linkedin_url,
-                        overall_score=ranking.overall_score,
-                        dimension_scores=ranking.dimension_scores,
-                        strengths=ranking.strengths,
-                        concerns=ranking.concerns,
-                        recommendations=ranking.recommendations,
-                        confidence_level=ranking.confidence_level,
-                        match_explanation=enhanced_explanation,
-                        key_differentiators=ranking.key_differentiators,
-                        interview_focus_areas=ranking.interview_focus_areas
-                    )
+                    # The ranking was validated when it was created; copy it without revalidating
+                    enhanced_ranking = ranking.model_copy(update={'match_explanation': enhanced_explanation[:1000]})
                     enhanced_rankings.append(enhanced_ranking)
                 else:
                     enhanced_rankings.append(ranking)
@@ -1,14 +1,51 @@
 import logging
 import json
+import re
 import time
 from typing import List, Dict, Any, Optional, Union
 import requests
 
 # Import models
-from src.core.models import CandidateProfile
+from src.config import providers
+from src.core import metrics
+from src.core.llm_gateway import Priority, get_gateway
+from src.core.singleflight import content_key, single_flight
+from src.core.models import CandidateProfile, JobDescription
 
 logger = logging.getLogger(__name__)
 
+# PDL's coarser experience buckets for the parser's levels
+_SEARCH_EXPERIENCE_LEVELS = {
+    'entry': 'entry', 'junior': 'entry', 'mid': 'mid',
+    'senior': 'senior', 'lead': 'senior', 'principal': 'senior', 'executive': 'executive',
+}
+_SENIORITY_PREFIX = re.compile(r'^(?:senior|sr\.?|junior|jr\.?|lead|principal|staff)\s+', re.IGNORECASE)
+
+
+def search_terms_from_job(job: JobDescription) -> Optional[Dict[str, Any]]:
+    """Search terms in generate_search_terms' shape, read off an already parsed JD.
+
+    Returns None when the JD has no skills to search on.
+    """
+    skills = list(dict.fromkeys(skill.lower().strip() for skill in job.required_skills + job.preferred_skills
+                                if 1 < len(skill.strip()) <= 50))[:10]
+    title = job.title.lower().strip()
+    if not skills or len(title) <= 2:
+        return None
+    titles = list(dict.fromkeys([title, _SENIORITY_PREFIX.sub('', title)]))
+    location = job.location
+    return {
+        'job_titles': titles,
+        'skills': skills,
+        'location_country': (location.country.lower() if location and location.country else 'india'),
+        'experience_level': _SEARCH_EXPERIENCE_LEVELS.get(job.experience_level.value) if job.experience_level else None,
+        'industry': job.industry.lower() if job.industry else None,
+        'work_arrangement': 'remote' if location and location.remote_allowed else None,
+        'company_size': job.company_size.value if job.company_size else None,
+        'team_role': None,
+    }
+
+
 class PDLAPIClient:
     """People Data Labs API client with 100% AI-powered search term generation"""
     
@@ -16,35 +53,34 @@ class PDLAPIClient:
         from src.config.settings import get_settings
         self.settings = get_settings()
         self.api_key = self.settings.pdl_api_key
-        self.base_url = "https://api.peopledatalabs.com/v5"
+        self.base_url = providers.pdl_base_url()
         
         # Initialize OpenAI if available
         try:
             if hasattr(self.settings, 'openai_api_key') and self.settings.openai_api_key and self.settings.openai_api_key != "your_openai_api_key_here":
-                try:
-                    from openai import OpenAI
-                    self.openai_client = OpenAI(api_key=self.settings.openai_api_key)
-                    logger.info(" OpenAI client initialized for 100% AI-powered query generation")
-                except ImportError:
-                    self.openai_client = None
-                    logger.error(" OpenAI not installed - this client requires OpenAI for operation")
-                    raise ImportError("OpenAI package is required for PureAIPDLClient")
+                self.llm = get_gateway()
+                logger.info(" OpenAI gateway ready for 100% AI-powered query generation")
             else:
-                self.openai_client = None
+                self.llm = None
                 logger.error(" OpenAI API key not provided - this client requires OpenAI for operation")
                 raise ValueError("OpenAI API key is required for PureAIPDLClient")
         except Exception as e:
-            self.openai_client = None
+            self.llm = None
             logger.error(f" OpenAI initialization failed: {e} - this client requires OpenAI for operation")
             raise
     
-    def search_candidates(self, job_description: str, max_candidates: int = 10) -> List[Dict[str, Any]]:
-        """Search for candidates using PDL API with 100% AI-generated terms."""
+    def search_candidates(self, job_description: str, max_candidates: int = 10,
+                          search_terms: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Search for candidates using PDL API with 100% AI-generated terms.
+
+        ``search_terms`` computed earlier (the JD artifact's) are used as given.
+        """
         logger.info(f" Starting AI-powered candidate search for: {job_description[:100]}...")
         logger.info(f" Target: {max_candidates} candidates")
         
         # Generate search terms using ONLY AI
-        search_terms = self.generate_search_terms(job_description)
+        if search_terms is None:
+            search_terms = self.generate_search_terms(job_description)
         
         all_candidates = []
         
@@ -83,10 +119,19 @@ class PDLAPIClient:
         logger.info(f"🎯 Total unique candidates found: {len(all_candidates)}")
         return all_candidates[:max_candidates]
     
+    def search_terms_for(self, job: JobDescription, job_description: str) -> Dict[str, Any]:
+        """Search terms for a parsed JD: read off its fields, asking the LLM only when it has no skills."""
+        terms = search_terms_from_job(job)
+        if terms is not None:
+            logger.info(f" Search terms from the parsed job description: {json.dumps(terms)}")
+            return terms
+        return self.generate_search_terms(job_description)
+
+    @single_flight('search_terms', key=lambda self, job_description: content_key(job_description))
     def generate_search_terms(self, job_description: str) -> Dict[str, Any]:
         """Generate search terms using ONLY AI - no fallback, no hardcoded elements."""
         
-        if not self.openai_client:
+        if not self.llm:
             raise ValueError("OpenAI client is required for pure AI term generation")
         
         # Try AI generation with multiple attempts for reliability
@@ -178,15 +223,15 @@ class PDLAPIClient:
             }}
             """
             
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",
+            content = self.llm.complete(
+                route='extraction',
                 messages=[{"role": "user", "content": prompt}],
+                operation='search_terms',
+                priority=Priority.INTERACTIVE,
                 temperature=0.1,  # Very low temperature for consistent, focused results
                 max_tokens=500,
                 response_format={"type": "json_object"}
             )
-            
-            content = response.choices[0].message.content.strip()
             terms = json.loads(content)
             
             # Validate the AI response structure and content
@@ -361,6 +406,7 @@ class PDLAPIClient:
         
         if not self.api_key or self.api_key == "your_pdl_api_key_here":
             logger.warning("⚠️ PDL API key not configured, returning mock data")
+            metrics.record_fallback('candidate_search', 'mock_data')
             return self._get_mock_candidates()
         
         headers = {
@@ -368,13 +414,18 @@ class PDLAPIClient:
             "Content-Type": "application/json"
         }
         
+        metrics.record_search_query(json.dumps(query, separators=(',', ':')))
+        
         try:
-            response = requests.post(
-                f"{self.base_url}/person/search",
-                headers=headers,
-                json=query,
-                timeout=30
-            )
+            with metrics.external_call('pdl', 'person_search') as call:
+                response = requests.post(
+                    f"{self.base_url}/person/search",
+                    headers=headers,
+                    json=query,
+                    timeout=30
+                )
+                if response.status_code != 200:
+                    call.fail(f"http_{response.status_code}")
             
             if response.status_code == 200:
                 data = response.json()
@@ -3,10 +3,10 @@ PDL Query Builder
 
 """
 
-import json
 import logging
 from typing import Dict, List, Optional, Any, Union
 
+from src.core import serialization
 from src.core.models import JobDescription, ExperienceLevel, EmploymentType
 from src.config.settings import get_logger
 
@@ -202,7 +202,7 @@ class PDLQueryBuilder:
             ]
         }
         
-        self.logger.info(f"Built Elasticsearch query: {json.dumps(query, indent=2)}")
+        self.logger.info(f"Built Elasticsearch query: {serialization.dumps(query)}")
         return query
     
     def build_simple_query(self, keywords: List[str], location: str = "india", size: int = 50) -> Dict[str, Any]:
@@ -242,7 +242,7 @@ class PDLQueryBuilder:
             "size": size
         }
         
-        self.logger.info(f"Built simple query: {json.dumps(query, indent=2)}")
+        self.logger.info(f"Built simple query: {serialization.dumps(query)}")
         return query
     
     def build_ultra_simple_query(self, size: int = 50) -> Dict[str, Any]:
@@ -268,7 +268,7 @@ class PDLQueryBuilder:
             "size": size
         }
         
-        self.logger.info(f"Built ultra-simple query: {json.dumps(query, indent=2)}")
+        self.logger.info(f"Built ultra-simple query: {serialization.dumps(query)}")
         return query
     
     def validate_query(self, query: Dict[str, Any]) -> bool:
@@ -283,7 +283,7 @@ class PDLQueryBuilder:
         """
         try:
             # Check for forbidden boost parameters
-            query_str = json.dumps(query)
+            query_str = serialization.dumps(query)
             if '"boost"' in query_str:
                 self.logger.warning("Query contains forbidden 'boost' parameters")
                 return False
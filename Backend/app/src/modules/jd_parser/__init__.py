@@ -1,7 +1,9 @@
 from .parser import JobDescriptionParser, PDFProcessor
+from .fallback import JDFallbackParser
 
 __all__ = [
     'JobDescriptionParser',
-    'PDFProcessor'
+    'PDFProcessor',
+    'JDFallbackParser'
 ]
 
@@ -0,0 +1,259 @@
+"""
+Job Description Fallback Parser
+
+Rule-based parsing used when the LLM parse fails. When OpenAI is down this
+is the hot path for every JD, so it walks the text once: each line is
+classified (section heading, labelled field, list item) and scanned with one
+precompiled signal pattern that picks up experience years, seniority,
+employment type, salary, education and remote work in the same pass. Skills
+come from the skill taxonomy's single automaton pass.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from src.core.models import JobDescription, Location, ExperienceYears, ExperienceLevel, EmploymentType
+from src.core.skills import get_skill_taxonomy
+
+# Section headings, normalized (lowercase, '&' -> 'and', no trailing colon)
+SECTION_HEADINGS = {
+    'responsibilities': ('responsibilities', 'key responsibilities', 'duties', 'the role', 'your role', 'role',
+                         'what you will do', "what you'll do", 'job responsibilities', 'day to day'),
+    'requirements': ('requirements', 'qualifications', 'must have', 'must haves', 'minimum qualifications',
+                     'basic qualifications', 'who you are', 'what we are looking for',
+                     "what we're looking for", 'skills and experience', 'required skills'),
+    'preferred': ('nice to have', 'nice to haves', 'preferred qualifications', 'preferred', 'good to have',
+                  'bonus points', 'bonus'),
+    'benefits': ('benefits', 'perks', 'perks and benefits', 'we offer', 'what we offer', 'compensation and benefits'),
+    'about': ('about the role', 'about us', 'about the company', 'about the team', 'who we are', 'overview'),
+}
+_HEADING_SECTION = {alias: section for section, aliases in SECTION_HEADINGS.items() for alias in aliases}
+
+# "Label: value" lines near the top of a JD
+LABEL_RE = re.compile(
+    r'^\s*(?P<label>job title|title|position|role|company|organization|employer|location|based in|office|'
+    r'job type|employment type)\s*[:\-–]\s*(?P<value>\S.*)$',
+    re.IGNORECASE,
+)
+BULLET_RE = re.compile(r'^\s*(?:[•●▪◦‣∙·*\-–]|\d+[.)])\s+')
+AT_COMPANY_RE = re.compile(r'\bat\s+([A-Z][\w&.\'-]*(?:\s+[A-Z][\w&.\'-]*){0,4})')
+CITY_RE = re.compile(
+    r'\b([A-Z][a-zA-Z]+(?:\s[A-Z][a-zA-Z]+)*),\s*([A-Z][a-zA-Z]+(?:\s[A-Z][a-zA-Z]+)*)'
+    r'(?:,\s*([A-Z][a-zA-Z]+(?:\s[A-Z][a-zA-Z]+)*))?'
+)
+
+_CURRENCY = r'(?:\$|₹|€|£|inr|usd|eur|gbp|rs\.?)'
+_AMOUNT = r'\d[\d,]*(?:\.\d+)?\s*[km]?'
+# Every per-line signal in one alternation, matched against the lowercased line
+# from word starts only; the group that matched says which
+SIGNAL_RE = re.compile(
+    r'(?<!\w)(?:(?P<experience>(?:(?:minimum(?:\s+of)?|at\s+least|min\.?)\s+)?(?P<exp_min>\d{1,2})\s*'
+    r'(?:(?:-|–|to)\s*(?P<exp_max>\d{1,2})\s*)?\+?\s*(?:years?|yrs?)\b)'
+    rf'|(?P<salary>{_CURRENCY}\s*{_AMOUNT}(?:\s*(?:-|–|to)\s*{_CURRENCY}?\s*{_AMOUNT})?'
+    r'(?:\s*(?:lpa|lakhs?|per\s+annum|p\.a\.|/\s*(?:year|yr|annum)|per\s+year))?'
+    rf'|\d+(?:\.\d+)?\s*(?:-|–|to)\s*\d+(?:\.\d+)?\s*(?:lpa|lakhs))'
+    r'|(?P<employment>full[\s-]time|part[\s-]time|contract|freelance|internship)'
+    r'|(?P<level>entry[\s-]level|junior|mid[\s-]level|senior|lead|principal|executive)'
+    r"|(?P<education>bachelor's degree|master's degree|phd|doctorate|computer science|engineering|mathematics|mba)"
+    r'|(?P<remote>remote|work from home))'
+)
+_SIGNAL_BOUNDARY = re.compile(r'\w')
+
+EMPLOYMENT_TYPES = {
+    'full time': EmploymentType.FULL_TIME,
+    'part time': EmploymentType.PART_TIME,
+    'contract': EmploymentType.CONTRACT,
+    'freelance': EmploymentType.FREELANCE,
+    'internship': EmploymentType.INTERNSHIP,
+}
+EXPERIENCE_LEVELS = {
+    'entry level': ExperienceLevel.ENTRY,
+    'junior': ExperienceLevel.JUNIOR,
+    'mid level': ExperienceLevel.MID,
+    'senior': ExperienceLevel.SENIOR,
+    'lead': ExperienceLevel.LEAD,
+    'principal': ExperienceLevel.PRINCIPAL,
+    'executive': ExperienceLevel.EXECUTIVE,
+}
+TITLE_SKIP_PREFIXES = ('job', 'position', 'role', 'we are', 'about')
+
+MAX_LIST_ITEMS = 10
+MAX_ITEM_LENGTH = 200
+
+
+@dataclass
+class _Scan:
+    """Fields accumulated while walking the lines."""
+    title: Optional[str] = None
+    labelled_title: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    city: Optional[tuple] = None
+    remote: bool = False
+    experience: Optional[tuple] = None
+    levels: List[str] = field(default_factory=list)
+    employment: Optional[str] = None
+    salary: Optional[str] = None
+    education: Dict[str, None] = field(default_factory=dict)
+    sections: Dict[str, Dict[str, None]] = field(default_factory=dict)
+
+
+class JDFallbackParser:
+    """Single-pass rule-based JD parser; stateless and thread-safe."""
+
+    def parse(self, text: str) -> JobDescription:
+        """Parse JD text into a JobDescription without any LLM call."""
+        return JobDescription(**self.extract_fields(text))
+
+    def extract_fields(self, text: str) -> Dict[str, Any]:
+        """JobDescription fields found in ``text``, from one walk over its lines."""
+        scan = _Scan()
+        section = None
+        position = 0
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
+            if not line:
+                continue
+            position += 1
+
+            label = LABEL_RE.match(line) if position <= 15 else None
+            heading = None if label else _heading(line)
+            if label:
+                _apply_label(scan, label.group('label').lower(), label.group('value').strip())
+            elif heading:
+                section, line = heading
+                if not line:
+                    continue
+            elif position <= 10 and scan.title is None and len(line) > 5 \
+                    and not line.lower().startswith(TITLE_SKIP_PREFIXES):
+                scan.title = line
+            if position <= 15:
+                if scan.company is None:
+                    at_company = AT_COMPANY_RE.search(line)
+                    if at_company:
+                        scan.company = at_company.group(1)
+                if scan.city is None and scan.location is None:
+                    city = CITY_RE.search(line)
+                    if city:
+                        scan.city = tuple(part for part in city.groups() if part)
+
+            _scan_signals(scan, line)
+
+            if section in ('responsibilities', 'requirements', 'preferred', 'benefits'):
+                item = BULLET_RE.sub('', line).strip()
+                if len(item) > 10:
+                    scan.sections.setdefault(section, {})[item[:MAX_ITEM_LENGTH]] = None
+
+        return _fields(scan, text)
+
+
+def _heading(line: str):
+    """(section, rest of line) for a heading line such as 'Requirements:' or 'Benefits: ...'."""
+    head, colon, rest = line.partition(':')
+    candidate = head if colon else line
+    if len(candidate) > 50:
+        return None
+    key = ' '.join(candidate.strip().strip('-_=*#').lower().replace('&', 'and').split())
+    section = _HEADING_SECTION.get(key)
+    if section is None:
+        return None
+    return section, rest.strip()
+
+
+def _apply_label(scan: _Scan, label: str, value: str) -> None:
+    if label in ('job title', 'title', 'position', 'role'):
+        scan.labelled_title = scan.labelled_title or value
+    elif label in ('company', 'organization', 'employer'):
+        scan.company = scan.company or value
+    elif label in ('location', 'based in', 'office'):
+        scan.location = scan.location or value
+    elif label in ('job type', 'employment type'):
+        employment = next((matched for kind, _, matched in _signals(value) if kind == 'employment'), None)
+        if employment:
+            scan.employment = scan.employment or _key(employment)
+
+
+def _signals(line: str):
+    """(kind, match, matched text) for each whole-word signal in a line."""
+    lowered = line.lower()
+    # lower() keeps offsets for all but a few non-ASCII characters
+    original = line if len(lowered) == len(line) else lowered
+    for match in SIGNAL_RE.finditer(lowered):
+        end = match.end()
+        # Whole words only ('lead' not in 'leading', 'contract' not in 'contractual')
+        if end < len(lowered) and _SIGNAL_BOUNDARY.match(lowered[end]) and not match.group('salary'):
+            continue
+        yield match.lastgroup, match, original[match.start():end]
+
+
+def _scan_signals(scan: _Scan, line: str) -> None:
+    for kind, match, matched in _signals(line):
+        if kind == 'experience':
+            if scan.experience is None:
+                minimum, maximum = int(match.group('exp_min')), match.group('exp_max')
+                maximum = int(maximum) if maximum is not None else None
+                if minimum <= 50 and (maximum is None or minimum <= maximum <= 50):
+                    scan.experience = (minimum, maximum)
+        elif kind == 'salary':
+            scan.salary = scan.salary or matched.strip()
+        elif kind == 'employment':
+            scan.employment = scan.employment or _key(matched)
+        elif kind == 'level':
+            scan.levels.append(_key(matched))
+        elif kind == 'education':
+            scan.education[matched.lower()] = None
+        elif kind == 'remote':
+            scan.remote = True
+
+
+def _key(value: str) -> str:
+    return ' '.join(value.lower().replace('-', ' ').split())
+
+
+def _fields(scan: _Scan, text: str) -> Dict[str, Any]:
+    title = (scan.labelled_title or scan.title or "Unknown Position")[:200]
+
+    if scan.location:
+        parts = [part.strip() for part in scan.location.split(',')]
+    else:
+        parts = list(scan.city or ())
+    location = Location(
+        city=parts[0] if len(parts) > 0 else None,
+        state=parts[1] if len(parts) > 1 else None,
+        country=parts[-1] if len(parts) > 2 else None,
+        remote_allowed=scan.remote,
+    )
+
+    experience_years = None
+    if scan.experience:
+        experience_years = ExperienceYears(minimum=scan.experience[0], maximum=scan.experience[1])
+
+    # A level named in the title wins over one mentioned in the body ("mentor junior engineers")
+    title_level = next((_key(matched) for kind, _, matched in _signals(title) if kind == 'level'), None)
+    level = title_level or (scan.levels[0] if scan.levels else None)
+
+    def items(section: str) -> List[str]:
+        return list(scan.sections.get(section, {}))[:MAX_LIST_ITEMS]
+
+    return dict(
+        title=title,
+        company=scan.company[:100] if scan.company else None,
+        location=location,
+        experience_level=EXPERIENCE_LEVELS.get(level) if level else None,
+        experience_years=experience_years,
+        required_skills=get_skill_taxonomy().extract(text)[:15],
+        preferred_skills=[],
+        responsibilities=items('responsibilities'),
+        requirements=items('requirements'),
+        benefits=items('benefits'),
+        salary_range=scan.salary,
+        employment_type=EMPLOYMENT_TYPES.get(scan.employment) if scan.employment else None,
+        industry=None,
+        company_size=None,
+        education_requirements=[keyword.title() for keyword in scan.education],
+        certifications=[],
+    )
+
+
+__all__ = ['JDFallbackParser', 'SECTION_HEADINGS']
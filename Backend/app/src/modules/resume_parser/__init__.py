@@ -0,0 +1,6 @@
+from .extractor import ResumeExtractor, ResumeExtraction
+
+__all__ = [
+    'ResumeExtractor',
+    'ResumeExtraction'
+]
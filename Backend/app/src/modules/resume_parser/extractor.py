@@ -0,0 +1,557 @@
+"""
+Heuristic Resume Extractor
+
+Deterministic first pass over resume text, run before any LLM call. It
+segments the text into sections and fills what regular expressions and the
+skill taxonomy (src/core/skills.py) can fill reliably: contact details,
+links, name, location, skills, dated experience and education entries,
+summary. Every field gets a confidence in [0, 1]; callers send only the fields below CONFIDENCE_THRESHOLD
+to the LLM, together with just the sections those fields live in
+(``ResumeExtraction.excerpt()``).
+
+Fields that regexes find exhaustively (emails, phones, links) are confident
+even when empty: if the text has no email address, an LLM will not find one
+either. Sections the extractor does not parse (projects, certifications,
+publications, awards) are confident only when the resume has no such section.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.core.skills import get_skill_taxonomy
+
+logger = logging.getLogger(__name__)
+
+# Fields at or above this confidence are not sent to the LLM
+CONFIDENCE_THRESHOLD = 0.7
+
+# Characters of resume text an excerpt may hold
+EXCERPT_LIMIT = 8000
+
+FIELDS = (
+    'full_name', 'emails', 'phones', 'location', 'links', 'linkedin_url',
+    'current_title', 'current_company', 'summary', 'skills', 'education',
+    'experience', 'projects', 'certifications', 'publications', 'awards', 'extras',
+)
+
+# Sections each field is read from, in order of preference
+FIELD_SECTIONS = {
+    'full_name': ('header',),
+    'emails': ('header',),
+    'phones': ('header',),
+    'location': ('header',),
+    'links': ('header',),
+    'linkedin_url': ('header',),
+    'current_title': ('header', 'summary', 'experience'),
+    'current_company': ('header', 'experience'),
+    'summary': ('header', 'summary'),
+    'skills': ('skills', 'experience', 'projects'),
+    'education': ('education',),
+    'experience': ('experience',),
+    'projects': ('projects',),
+    'certifications': ('certifications',),
+    'publications': ('publications',),
+    'awards': ('awards',),
+    'extras': ('volunteer', 'interests'),
+}
+
+SECTION_HEADINGS = {
+    'summary': ('summary', 'professional summary', 'career summary', 'profile', 'professional profile',
+                'about', 'about me', 'objective', 'career objective', 'overview'),
+    'experience': ('experience', 'work experience', 'professional experience', 'employment',
+                   'employment history', 'work history', 'career history', 'relevant experience',
+                   'experience summary', 'internships', 'internship experience'),
+    'education': ('education', 'academic background', 'academics', 'academic qualifications',
+                  'educational qualifications', 'qualifications', 'education and training'),
+    'skills': ('skills', 'technical skills', 'key skills', 'core skills', 'core competencies',
+               'competencies', 'skills and tools', 'tools and technologies', 'technologies',
+               'tech stack', 'areas of expertise', 'expertise', 'technical proficiency'),
+    'projects': ('projects', 'personal projects', 'academic projects', 'key projects', 'selected projects'),
+    'certifications': ('certifications', 'certificates', 'licenses and certifications',
+                       'certifications and licenses', 'courses', 'training'),
+    'publications': ('publications', 'papers', 'research'),
+    'awards': ('awards', 'honors', 'honours', 'achievements', 'awards and honors', 'accomplishments'),
+    'volunteer': ('volunteer', 'volunteering', 'volunteer experience', 'community service'),
+    'interests': ('interests', 'hobbies', 'hobbies and interests'),
+}
+_HEADING_SECTION = {alias: section for section, aliases in SECTION_HEADINGS.items() for alias in aliases}
+
+# Words that mark a phrase as a job title rather than a company or a name
+TITLE_WORDS = frozenset((
+    'engineer', 'developer', 'programmer', 'architect', 'manager', 'analyst', 'scientist',
+    'designer', 'consultant', 'intern', 'lead', 'head', 'director', 'specialist', 'administrator',
+    'officer', 'associate', 'executive', 'president', 'vp', 'founder', 'co-founder', 'cto', 'ceo',
+    'researcher', 'assistant', 'coordinator', 'technician', 'tester', 'sde', 'devops', 'trainee',
+    'owner', 'strategist', 'recruiter', 'accountant', 'teacher', 'professor', 'fellow',
+))
+
+_MONTH = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?'
+_DATE = rf'(?:{_MONTH}\s*,?\s*(?:19|20)\d{{2}}|\d{{1,2}}[/.-](?:19|20)\d{{2}}|(?:19|20)\d{{2}})'
+DATE_RANGE_RE = re.compile(
+    rf'(?P<start>{_DATE})\s*(?:-|–|—|to|till|until)\s*(?P<end>{_DATE}|present|current|now|today|ongoing|date)',
+    re.IGNORECASE,
+)
+YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_MONTH_NUMBERS = {name: index for index, name in enumerate(
+    ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), start=1)}
+
+EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+PHONE_RE = re.compile(r'(?<![\w/])\+?\d[\d\s().-]{7,}\d(?![\w/])')
+URL_RE = re.compile(
+    r'(?:https?://|www\.)[^\s,;|<>()]+'
+    r'|\b(?:[a-z]{2,3}\.)?(?:linkedin\.com|github\.com|gitlab\.com|behance\.net|dribbble\.com)/[^\s,;|<>()]+',
+    re.IGNORECASE,
+)
+LINKEDIN_RE = re.compile(r'(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/in/[A-Za-z0-9_%.-]+', re.IGNORECASE)
+LOCATION_RE = re.compile(r"^(?:location\s*:\s*)?([A-Z][A-Za-z.' -]{1,30}),\s*([A-Z][A-Za-z.' -]{1,30})(?:,\s*([A-Z][A-Za-z.' -]{1,30}))?$")
+DEGREE_RE = re.compile(
+    r"\b(?:bachelor'?s?|master'?s?|ph\.?\s?d|doctorate|mba|diploma|associate'?s? degree|"
+    r"b\.?\s?tech|m\.?\s?tech|b\.?\s?e\b|m\.?\s?e\b|b\.?\s?sc?|m\.?\s?sc?|b\.?\s?a\b|m\.?\s?a\b|"
+    r"b\.?\s?com|m\.?\s?com|bca|mca|high school|secondary school)\b",
+    re.IGNORECASE,
+)
+INSTITUTION_RE = re.compile(r'\b(?:university|college|institute|school|academy|polytechnic|iit|nit|iiit)\b', re.IGNORECASE)
+GPA_RE = re.compile(r'\b(?:c?gpa|grade)\s*[:\-]?\s*(\d+(?:\.\d+)?(?:\s*/\s*\d+(?:\.\d+)?)?)', re.IGNORECASE)
+FIELD_OF_STUDY_RE = re.compile(r'\b(?:in|of)\s+([A-Z][A-Za-z&/ ]{2,60})')
+BULLET_RE = re.compile(r'^\s*(?:[•●▪◦‣∙·*\-–]|\d+[.)])\s+')
+SEPARATOR_RE = re.compile(r'\s+(?:\||•|·|–|—|-|@|at)\s+|\t|\s{3,}')
+EDUCATION_SPLIT_RE = re.compile(r'\s*,\s*|' + SEPARATOR_RE.pattern)
+SKILL_SPLIT_RE = re.compile(r'\s*(?:,|;|\||•|·|/(?!\w*\.)|\band\b)\s*')
+
+
+@dataclass
+class ResumeExtraction:
+    """Fields found by the heuristic pass, with a confidence per field."""
+    text: str
+    fields: Dict[str, Any] = field(default_factory=dict)
+    confidence: Dict[str, float] = field(default_factory=dict)
+    sections: Dict[str, str] = field(default_factory=dict)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.fields.get(name, default)
+
+    def is_confident(self, name: str, threshold: float = CONFIDENCE_THRESHOLD) -> bool:
+        return self.confidence.get(name, 0.0) >= threshold
+
+    def missing(self, names: Iterable[str], threshold: float = CONFIDENCE_THRESHOLD) -> List[str]:
+        """The given fields that still need the LLM, in the given order."""
+        return [name for name in names if not self.is_confident(name, threshold)]
+
+    def excerpt(self, names: Iterable[str], limit: int = EXCERPT_LIMIT) -> str:
+        """Resume text the given fields are read from: their sections in document
+        order, or the whole text when none of those sections was found."""
+        wanted = {section for name in names for section in FIELD_SECTIONS.get(name, ())}
+        parts = [
+            body if section == 'header' else f"{section.upper()}\n{body}"
+            for section, body in self.sections.items() if section in wanted and body
+        ]
+        return ('\n\n'.join(parts) if parts else self.text)[:limit]
+
+    def chunks(self, names: Iterable[str], size: int, limit: int) -> List[Tuple[List[str], str]]:
+        """The excerpt for the given fields in pieces of at most ``size`` characters,
+        each with the fields it can answer.
+
+        Pieces break at section boundaries where possible, else at paragraph
+        and line breaks; a section split across pieces has its heading
+        repeated. At most ``limit`` characters of sections are used.
+        """
+        names = list(names)
+        wanted = {section for name in names for section in FIELD_SECTIONS.get(name, ())}
+        parts = [(section, body) for section, body in self.sections.items() if section in wanted and body]
+        if not parts:
+            parts = [('', self.text)]
+
+        chunks: List[Tuple[List[str], str]] = []
+        blocks: List[str] = []
+        sections = set()
+        length = 0
+
+        def flush() -> None:
+            chunk_names = [name for name in names if sections & set(FIELD_SECTIONS.get(name, ()))]
+            chunks.append((chunk_names if '' not in sections else names, '\n\n'.join(blocks)))
+
+        for section, body in parts:
+            body = body[:limit]
+            limit -= len(body)
+            heading = '' if section in ('', 'header') else f"{section.upper()}\n"
+            for piece in _pieces(body, size - len(heading)):
+                block = heading + piece
+                if blocks and length + len(block) + 2 > size:
+                    flush()
+                    blocks, sections, length = [], set(), 0
+                blocks.append(block)
+                sections.add(section)
+                length += len(block) + 2
+            if limit <= 0:
+                break
+        if blocks:
+            flush()
+        return chunks
+
+
+class ResumeExtractor:
+    """Regex and vocabulary based resume extraction; stateless and thread-safe."""
+
+    def extract(self, text: str) -> ResumeExtraction:
+        """Run every heuristic over ``text`` in one pass over its sections."""
+        sections = split_sections(text)
+        result = ResumeExtraction(text=text, sections=sections)
+        header = sections.get('header', '')
+
+        def put(name: str, value: Any, confidence: float) -> None:
+            result.fields[name] = value
+            result.confidence[name] = confidence
+
+        emails = _unique(EMAIL_RE.findall(text))
+        put('emails', emails, 0.95)
+        put('phones', _phones(text), 0.9)
+        links = _unique(_clean_url(url) for url in URL_RE.findall(text) if '@' not in url)
+        put('links', links, 0.9)
+        linkedin = LINKEDIN_RE.search(text)
+        put('linkedin_url', _normalize_linkedin(linkedin.group(0)) if linkedin else None, 0.95)
+
+        name, name_confidence = _name(header, emails)
+        put('full_name', name, name_confidence)
+        location = _location(header)
+        put('location', location, 0.8 if location else 0.3)
+
+        experience = _experience_entries(sections.get('experience', ''))
+        put('experience', experience, _experience_confidence(experience, 'experience' in sections))
+        title, company, role_confidence = _current_role(experience, header)
+        put('current_title', title, role_confidence if title else 0.2)
+        put('current_company', company, role_confidence if company else 0.2)
+
+        education = _education_entries(sections.get('education', ''))
+        put('education', education, _education_confidence(education, sections, text))
+
+        skills, skills_confidence = _skills(sections.get('skills'), text)
+        put('skills', skills, skills_confidence)
+
+        summary = ' '.join(sections.get('summary', '').split())
+        put('summary', summary, 0.9 if summary else 0.8)
+
+        for name in ('projects', 'certifications', 'publications', 'awards'):
+            # Not parsed here; confidently empty only when the section is absent
+            put(name, [], 0.0 if sections.get(name) else 1.0)
+        extras = {
+            'volunteer': _lines(sections.get('volunteer', '')),
+            'interests': _items(sections.get('interests', '')),
+        }
+        put('extras', extras, 0.8)
+
+        return result
+
+
+def split_sections(text: str) -> Dict[str, str]:
+    """Split resume text into sections keyed by canonical section name.
+
+    Lines before the first recognised heading form the ``header`` section.
+    A repeated section (two "Experience" headings) is concatenated.
+    """
+    sections: Dict[str, List[str]] = {'header': []}
+    current = 'header'
+    for line in text.splitlines():
+        section = _heading(line)
+        if section:
+            current = section
+            sections.setdefault(current, [])
+            continue
+        sections[current].append(line.rstrip())
+    return {name: '\n'.join(lines).strip() for name, lines in sections.items()}
+
+
+def _pieces(body: str, size: int) -> List[str]:
+    """``body`` cut into pieces of at most ``size`` characters, at paragraph
+    breaks where possible, else at line breaks (a longer line is cut anywhere)."""
+    units: List[Tuple[str, str]] = []  # (separator before it, text)
+    for paragraph in re.split(r'\n\s*\n', body):
+        if len(paragraph) <= size:
+            units.append(('\n\n', paragraph))
+            continue
+        separator = '\n\n'
+        for line in paragraph.splitlines():
+            for start in range(0, len(line), size):
+                units.append((separator, line[start:start + size]))
+                separator = '\n'
+    pieces: List[str] = []
+    current = ''
+    for separator, text in units:
+        if current and len(current) + len(separator) + len(text) > size:
+            pieces.append(current)
+            current = text
+        else:
+            current = current + separator + text if current else text
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def normalize_date(value: str) -> str:
+    """'Jan 2021' -> '2021-01', '03/2020' -> '2020-03', '2019' -> '2019'; 'Present' stays as is."""
+    value = value.strip()
+    year = YEAR_RE.search(value)
+    if not year:
+        return value
+    month = _MONTH_NUMBERS.get(value[:3].lower())
+    if month is None:
+        numeric = re.match(r'(\d{1,2})[/.-]', value)
+        month = int(numeric.group(1)) if numeric and 1 <= int(numeric.group(1)) <= 12 else None
+    return f"{year.group(0)}-{month:02d}" if month else year.group(0)
+
+
+def _heading(line: str) -> Optional[str]:
+    stripped = line.strip().strip(':').strip('-_=*#').strip()
+    if not stripped or len(stripped) > 40:
+        return None
+    key = ' '.join(stripped.lower().replace('&', 'and').split())
+    return _HEADING_SECTION.get(key)
+
+
+def _unique(values: Iterable[str]) -> List[str]:
+    seen: Dict[str, str] = {}
+    for value in values:
+        seen.setdefault(value.lower(), value)
+    return list(seen.values())
+
+
+def _lines(body: str) -> List[str]:
+    return [BULLET_RE.sub('', line).strip() for line in body.splitlines() if line.strip()]
+
+
+def _items(body: str) -> List[str]:
+    return [item for line in _lines(body) for item in SKILL_SPLIT_RE.split(line) if item]
+
+
+def _phones(text: str) -> List[str]:
+    phones = []
+    for match in PHONE_RE.findall(text):
+        digits = re.findall(r'\d+', match)
+        count = sum(len(group) for group in digits)
+        # Skip date ranges ("2019 - 2021") and other year runs
+        if not 10 <= count <= 15 or all(len(group) == 4 and group[:2] in ('19', '20') for group in digits):
+            continue
+        phones.append(' '.join(match.split()))
+    return _unique(phones)
+
+
+def _clean_url(url: str) -> str:
+    return url.rstrip('.,/)')
+
+
+def _normalize_linkedin(url: str) -> str:
+    url = _clean_url(url).lower()
+    return url if url.startswith(('http://', 'https://')) else f"https://{url}"
+
+
+def _segments(line: str) -> List[str]:
+    return [part.strip() for part in SEPARATOR_RE.split(line) if part and part.strip()]
+
+
+def _is_title(phrase: str) -> bool:
+    return any(word.strip('.,()') in TITLE_WORDS for word in phrase.lower().split())
+
+
+def _is_location(phrase: str) -> bool:
+    """'Austin, TX' but not 'Senior Engineer, Acme' or 'Stanford University, CA'."""
+    return bool(LOCATION_RE.match(phrase)) and not _is_title(phrase) and not INSTITUTION_RE.search(phrase)
+
+
+def _name(header: str, emails: List[str]) -> Tuple[Optional[str], float]:
+    lines = [line.strip() for line in header.splitlines() if line.strip()][:6]
+    for index, line in enumerate(lines):
+        segments = _segments(line)
+        candidate = segments[0] if segments else ''
+        words = candidate.split()
+        if not 2 <= len(words) <= 4 or any(char.isdigit() for char in candidate):
+            continue
+        if '@' in candidate or '/' in candidate or ',' in candidate or _is_title(candidate):
+            continue
+        if not all(re.fullmatch(r"[A-Za-z][A-Za-z.'-]*", word) and word[0].isupper() for word in words):
+            continue
+        name = candidate.title() if candidate.isupper() else candidate
+        confidence = 0.9 if index == 0 else 0.75
+        # An email built from the name confirms it
+        locals_ = ' '.join(email.split('@')[0].lower() for email in emails)
+        if any(word.lower().strip('.') in locals_ for word in words if len(word) > 2):
+            confidence = round(min(1.0, confidence + 0.05), 2)
+        return name, confidence
+    return None, 0.0
+
+
+def _location(header: str) -> Optional[str]:
+    for line in header.splitlines()[:10]:
+        for segment in _segments(line):
+            match = LOCATION_RE.match(segment)
+            if match and _is_location(segment):
+                return ', '.join(part.strip() for part in match.groups() if part)
+    return None
+
+
+def _experience_entries(body: str) -> List[Dict[str, Any]]:
+    """Dated entries of an experience section: header lines, dates and bullets.
+
+    An entry starts at a non-bullet line that carries a date range, or that
+    directly precedes one; other non-bullet lines continue the previous bullet.
+    """
+    lines = [line.strip() for line in body.splitlines() if line.strip()]
+    entries: List[Dict[str, Any]] = []
+    current: Optional[Dict[str, Any]] = None
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        if BULLET_RE.match(line):
+            if current is not None:
+                current['bullets'].append(BULLET_RE.sub('', line))
+            index += 1
+            continue
+        dated = DATE_RANGE_RE.search(line)
+        following = lines[index + 1] if index + 1 < len(lines) else ''
+        if dated or (DATE_RANGE_RE.search(following) and not BULLET_RE.match(following)):
+            header_lines = [line]
+            if not dated:
+                header_lines.append(following)
+                dated = DATE_RANGE_RE.search(following)
+                index += 1
+            current = _experience_entry(header_lines, dated)
+            entries.append(current)
+        elif current is not None and current['bullets']:
+            current['bullets'][-1] += f" {line}"
+        elif current is not None:
+            current['header'].append(line)
+        index += 1
+    for entry in entries:
+        entry['title'], entry['company'], entry['location'] = _title_company(entry.pop('header'))
+    return entries
+
+
+def _experience_entry(header_lines: List[str], dated) -> Dict[str, Any]:
+    end = dated.group('end')
+    current = end.lower() in ('present', 'current', 'now', 'today', 'ongoing', 'date')
+    return {
+        'header': [DATE_RANGE_RE.sub('', line).strip(' ,|–—-()') for line in header_lines],
+        'start_date': normalize_date(dated.group('start')),
+        'end_date': '' if current else normalize_date(end),
+        'current': current,
+        'bullets': [],
+        'achievements': [],
+        'skills': [],
+    }
+
+
+def _title_company(header_lines: List[str]) -> Tuple[str, str, str]:
+    parts = []
+    for segment in (segment for line in header_lines for segment in _segments(line)):
+        # "Senior Engineer, Razorpay" -> two parts; "Austin, TX" stays a location
+        if ',' in segment and not _is_location(segment):
+            parts.extend(part.strip() for part in segment.split(',') if part.strip())
+        else:
+            parts.append(segment)
+    title = company = location = ''
+    for part in parts:
+        if not location and (_is_location(part) or part.lower() in ('remote', 'hybrid', 'onsite')):
+            location = part
+        elif not title and _is_title(part):
+            title = part
+        elif not company:
+            company = part
+    return title, company, location
+
+
+def _experience_confidence(entries: List[Dict[str, Any]], has_section: bool) -> float:
+    if not has_section:
+        return 0.3
+    if not entries:
+        return 0.2
+    complete = sum(1 for entry in entries if entry['title'] and entry['company'])
+    return 0.85 if complete == len(entries) else 0.5
+
+
+def _current_role(experience: List[Dict[str, Any]], header: str) -> Tuple[Optional[str], Optional[str], float]:
+    if experience:
+        entry = next((entry for entry in experience if entry['current']), experience[0])
+        if entry['title'] and entry['company']:
+            return entry['title'], entry['company'], 0.85
+        return entry['title'] or None, entry['company'] or None, 0.5
+    # "Name | Senior Engineer" style headline
+    for line in header.splitlines()[:4]:
+        for segment in _segments(line):
+            if _is_title(segment) and len(segment) <= 60:
+                return segment, None, 0.6
+    return None, None, 0.0
+
+
+def _education_entries(body: str) -> List[Dict[str, Any]]:
+    entries: List[Dict[str, Any]] = []
+    current: Optional[Dict[str, Any]] = None
+    for line in _lines(body):
+        degree = DEGREE_RE.search(line)
+        institution = INSTITUTION_RE.search(line)
+        starts_entry = (degree and (current is None or current['degree'])) or \
+                       (institution and (current is None or current['institution']))
+        if starts_entry or current is None:
+            current = {'degree': '', 'field': '', 'institution': '', 'start_date': '',
+                       'end_date': '', 'location': '', 'gpa': ''}
+            entries.append(current)
+        # Dates and GPA first: their "-" and "/" would otherwise split segments
+        dated = DATE_RANGE_RE.search(line)
+        if dated:
+            current['start_date'] = normalize_date(dated.group('start'))
+            current['end_date'] = normalize_date(dated.group('end'))
+            line = DATE_RANGE_RE.sub('', line)
+        gpa = GPA_RE.search(line)
+        if gpa:
+            current['gpa'] = gpa.group(1)
+            line = GPA_RE.sub('', line)
+        for segment in (part.strip(' ()') for part in EDUCATION_SPLIT_RE.split(line)):
+            if not segment:
+                continue
+            if DEGREE_RE.search(segment) and not current['degree']:
+                field_of_study = FIELD_OF_STUDY_RE.search(segment)
+                if field_of_study:
+                    current['field'] = field_of_study.group(1).strip()
+                    segment = segment[:field_of_study.start()].strip()
+                current['degree'] = segment
+            elif INSTITUTION_RE.search(segment) and not current['institution']:
+                current['institution'] = segment
+            elif not current['end_date'] and YEAR_RE.search(segment) and len(segment) <= 15:
+                current['end_date'] = normalize_date(segment)
+    return [entry for entry in entries if entry['degree'] or entry['institution']]
+
+
+def _education_confidence(entries: List[Dict[str, Any]], sections: Dict[str, str], text: str) -> float:
+    if entries:
+        complete = all(entry['degree'] and entry['institution'] for entry in entries)
+        return 0.85 if complete else 0.55
+    if 'education' in sections:
+        return 0.2
+    # No education section: confidently empty unless a degree is mentioned elsewhere
+    return 0.3 if DEGREE_RE.search(text) else 0.8
+
+
+def _skills(section: Optional[str], text: str) -> Tuple[List[str], float]:
+    taxonomy = get_skill_taxonomy()
+    listed = []
+    for item in _items(section or ''):
+        # "Languages: Python, Go" -> drop the category label
+        item = item.split(':', 1)[-1].strip()
+        if 1 <= len(item) <= 40:
+            listed.append(taxonomy.canonical_name(item))
+    matched = taxonomy.extract(text)
+    skills = _unique(listed + matched)
+    if len(listed) >= 3:
+        return skills, 0.9
+    if len(matched) >= 5:
+        return skills, 0.75
+    return skills, 0.4
+
+
+__all__ = [
+    'CONFIDENCE_THRESHOLD',
+    'FIELDS',
+    'ResumeExtraction',
+    'ResumeExtractor',
+    'split_sections',
+    'normalize_date',
+]
@@ -0,0 +1,12 @@
+from .run_store import RunStore
+from .jd_artifacts import JDArtifact, JDArtifactStore
+from .result_sink import ResultSink, create_result_sink, get_result_sink
+
+__all__ = [
+    'RunStore',
+    'JDArtifact',
+    'JDArtifactStore',
+    'ResultSink',
+    'create_result_sink',
+    'get_result_sink'
+]
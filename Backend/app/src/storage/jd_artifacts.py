@@ -0,0 +1,141 @@
+"""
+Persistent JD artifacts.
+
+Everything the pipeline derives from one job description: its extracted
+text, a summary, the parsed JobDescription and the PDL search terms. The
+workflow builds the artifact once, before any stage runs; parsing, candidate
+search and discovery all read from it. JDs uploaded through the API
+(jds.jd_id) keep their artifact in Postgres, so later runs for the same JD
+repeat none of that work.
+
+The table definition is owned by the API's Alembic migrations
+(app/models/jd_artifact.py); this module only speaks SQL.
+"""
+
+import hashlib
+import logging
+import re
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+try:
+    import psycopg
+    PSYCOPG_AVAILABLE = True
+except ImportError:
+    PSYCOPG_AVAILABLE = False
+
+from src.core import serialization
+from src.core.models import JobDescription
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JDArtifact:
+    """A job description and what was derived from it; fields are filled as stages compute them."""
+    text: str
+    parsed_job: Optional[JobDescription] = None
+    search_terms: Optional[Dict[str, Any]] = None
+    summary: Optional[str] = None
+    jd_id: Optional[str] = None
+
+    @property
+    def text_sha256(self) -> str:
+        return hashlib.sha256(self.text.encode('utf-8')).hexdigest()
+
+    @property
+    def complete(self) -> bool:
+        return self.parsed_job is not None and self.search_terms is not None and bool(self.summary)
+
+
+def summarize_job(job: JobDescription) -> str:
+    """A short summary built from the parsed fields, for JDs without an uploaded summary."""
+    role = job.title + (f" at {job.company}" if job.company else "")
+    details = [job.experience_level.value if job.experience_level else None]
+    if job.experience_years and job.experience_years.minimum is not None:
+        details.append(f"{job.experience_years.minimum}+ years")
+    if job.location and (job.location.city or job.location.country):
+        details.append(", ".join(part for part in (job.location.city, job.location.country) if part))
+    details = [detail for detail in details if detail]
+    summary = role + (f" ({'; '.join(details)})" if details else "") + "."
+    if job.required_skills:
+        summary += f" Required skills: {', '.join(job.required_skills[:10])}."
+    return summary
+
+
+class JDArtifactStore:
+    """Reads and writes JD artifacts, keyed by jds.jd_id."""
+
+    def __init__(self, database_url: str):
+        """Initialize the store with a SQLAlchemy-style or libpq database URL."""
+        if not PSYCOPG_AVAILABLE:
+            raise ImportError("psycopg is required for the JD artifact store. Install with: pip install 'psycopg[binary]'")
+        self.conninfo = re.sub(r'^postgres(ql)?(\+\w+)?://', 'postgresql://', database_url)
+
+    @classmethod
+    def from_settings(cls, settings) -> Optional['JDArtifactStore']:
+        """Create a store if a database is configured, else return None."""
+        if not settings.database_url:
+            return None
+        try:
+            return cls(settings.database_url)
+        except ImportError as e:
+            logger.warning(f"JD artifact persistence disabled: {e}")
+            return None
+
+    def load(self, jd_id: str) -> Optional[JDArtifact]:
+        """The stored artifact of a JD, or None if it has none yet."""
+        with psycopg.connect(self.conninfo) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT a.extracted_text, COALESCE(a.parsed_job, j.job_data), a.search_terms,
+                           COALESCE(a.summary, j.jd_parsed_summary)
+                    FROM jd_artifacts a JOIN jds j ON j.jd_id = a.jd_id
+                    WHERE a.jd_id = %s
+                    """,
+                    (uuid.UUID(jd_id),),
+                )
+                row = cur.fetchone()
+        if row is None:
+            return None
+
+        text, parsed_job, search_terms, summary = row
+        return JDArtifact(
+            text=text,
+            parsed_job=JobDescription(**parsed_job) if parsed_job else None,
+            search_terms=search_terms,
+            summary=summary,
+            jd_id=jd_id,
+        )
+
+    def save(self, artifact: JDArtifact) -> None:
+        """Insert or update the artifact of artifact.jd_id; missing fields keep their stored value."""
+        if artifact.jd_id is None:
+            raise ValueError("Only artifacts of stored JDs (with a jd_id) can be saved")
+        with psycopg.connect(self.conninfo) as conn:
+            conn.execute(
+                """
+                INSERT INTO jd_artifacts (jd_id, text_sha256, extracted_text, summary, parsed_job, search_terms)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                ON CONFLICT (jd_id) DO UPDATE SET
+                    text_sha256 = EXCLUDED.text_sha256,
+                    extracted_text = EXCLUDED.extracted_text,
+                    summary = COALESCE(EXCLUDED.summary, jd_artifacts.summary),
+                    parsed_job = COALESCE(EXCLUDED.parsed_job, jd_artifacts.parsed_job),
+                    search_terms = COALESCE(EXCLUDED.search_terms, jd_artifacts.search_terms),
+                    updated_at = now()
+                """,
+                (
+                    uuid.UUID(artifact.jd_id),
+                    artifact.text_sha256,
+                    artifact.text,
+                    artifact.summary,
+                    serialization.dumps(artifact.parsed_job) if artifact.parsed_job else None,
+                    serialization.dumps(artifact.search_terms) if artifact.search_terms is not None else None,
+                ),
+            )
+
+
+__all__ = ['JDArtifact', 'JDArtifactStore', 'summarize_job', 'PSYCOPG_AVAILABLE']
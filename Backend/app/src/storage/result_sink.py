@@ -0,0 +1,343 @@
+"""
+Pluggable result sinks for intermediate and final recruitment results.
+
+Discovery iterations and post-discovery exports used to write a new,
+pretty-printed JSON file and a CSV file into ``results/`` on every call.
+Sinks replace that with records streamed to a single destination:
+
+- ``none``: drop everything (benchmarks, API workers)
+- ``jsonl``: append compact JSON lines, one file per stream, rotated by size
+  and gzip-compacted, keeping a bounded number of rotated files
+- ``parquet``: columnar part files per stream, compacted into one file
+  once too many parts accumulate, keeping a bounded number of compacted
+  files (requires pyarrow)
+- ``database``: COPY into the ``result_records`` table
+
+All sinks except ``none`` buffer records in memory and write them from a
+background thread, so callers never wait on disk or network I/O.
+"""
+
+import abc
+import atexit
+import glob
+import gzip
+import logging
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import psycopg
+    PSYCOPG_AVAILABLE = True
+except ImportError:
+    PSYCOPG_AVAILABLE = False
+
+from src.core import serialization
+
+logger = logging.getLogger(__name__)
+
+Record = Dict[str, Any]
+
+
+class ResultSink(abc.ABC):
+    """Base sink: accepts records grouped into named streams."""
+
+    @abc.abstractmethod
+    def write(self, stream: str, record: Record) -> None:
+        """Write a single record to a stream."""
+
+    def write_many(self, stream: str, records: Iterable[Record]) -> None:
+        """Write several records to a stream."""
+        for record in records:
+            self.write(stream, record)
+
+    def flush(self) -> None:
+        """Block until every record written so far has reached the destination."""
+
+    def close(self) -> None:
+        """Flush and release resources."""
+
+    def describe(self) -> str:
+        """Human-readable description of where records end up."""
+        return self.__class__.__name__
+
+
+class NullSink(ResultSink):
+    """Sink that discards everything."""
+
+    def write(self, stream: str, record: Record) -> None:
+        pass
+
+    def write_many(self, stream: str, records: Iterable[Record]) -> None:
+        pass
+
+    def describe(self) -> str:
+        return "disabled"
+
+
+class BufferedSink(ResultSink):
+    """Sink that queues records and writes them in batches from a background thread."""
+
+    def __init__(self, batch_size: int = 200, flush_interval: float = 1.0, max_queue: int = 10000):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Optional[Tuple[str, Record]]]" = queue.Queue(maxsize=max_queue)
+        self._flush_requests: "queue.Queue[threading.Event]" = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"{self.__class__.__name__}-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, stream: str, record: Record) -> None:
+        if self._closed:
+            logger.warning(f"Dropping record for stream '{stream}': sink is closed")
+            return
+        # Blocks only if the writer falls max_queue records behind
+        self._queue.put((stream, record))
+
+    def flush(self) -> None:
+        if self._closed:
+            return
+        done = threading.Event()
+        self._flush_requests.put(done)
+        self._queue.put(None)  # wake the writer up
+        done.wait()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout=10)
+
+    def _run(self) -> None:
+        batch: List[Tuple[str, Record]] = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while True:
+            timeout = max(deadline - time.monotonic(), 0.0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is not None:
+                batch.append(item)
+
+            # Take the pending flush requests before writing, so a request is only
+            # acknowledged once everything queued ahead of it has been written
+            flush_requests = []
+            while not self._flush_requests.empty():
+                flush_requests.append(self._flush_requests.get())
+
+            if flush_requests:
+                # Drain what is already queued ahead of the wake-up marker
+                while True:
+                    try:
+                        pending = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if pending is not None:
+                        batch.append(pending)
+
+            if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline or flush_requests or self._closed):
+                self._write_grouped(batch)
+                batch = []
+
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+
+            for done in flush_requests:
+                done.set()
+
+            if self._closed and self._queue.empty():
+                if batch:
+                    self._write_grouped(batch)
+                return
+
+    def _write_grouped(self, batch: List[Tuple[str, Record]]) -> None:
+        by_stream: Dict[str, List[Record]] = {}
+        for stream, record in batch:
+            by_stream.setdefault(stream, []).append(record)
+        for stream, records in by_stream.items():
+            try:
+                self._write_batch(stream, records)
+            except Exception as e:
+                logger.error(f"{self.describe()}: failed to write {len(records)} records to '{stream}': {e}")
+
+    @abc.abstractmethod
+    def _write_batch(self, stream: str, records: List[Record]) -> None:
+        """Write a batch of records for one stream. Runs on the writer thread."""
+
+
+class JSONLSink(BufferedSink):
+    """Appends records as compact JSON lines, rotating and compressing files by size."""
+
+    def __init__(self, directory: str, max_bytes: int = 50 * 1024 * 1024, max_files: int = 10, **kwargs):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        super().__init__(**kwargs)
+
+    def describe(self) -> str:
+        return f"JSONL files in {self.directory}"
+
+    def _write_batch(self, stream: str, records: List[Record]) -> None:
+        path = self.directory / f"{_safe_stream_name(stream)}.jsonl"
+        lines = b"".join(serialization.dumps_bytes(record) + b"\n" for record in records)
+        with open(path, "ab") as f:
+            f.write(lines)
+        if path.stat().st_size >= self.max_bytes:
+            self._rotate(path)
+
+    def _rotate(self, path: Path) -> None:
+        """Move the active file aside as a gzip archive and prune old archives."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        archive = path.with_name(f"{path.stem}.{timestamp}.jsonl.gz")
+        with open(path, "rb") as src, gzip.open(archive, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        path.unlink()
+
+        archives = sorted(glob.glob(str(path.with_name(f"{path.stem}.*.jsonl.gz"))))
+        for old_archive in archives[:-self.max_files] if self.max_files > 0 else archives:
+            os.remove(old_archive)
+        logger.info(f"Rotated result stream {path.name} to {archive.name}")
+
+
+class ParquetSink(BufferedSink):
+    """Writes each batch as a Parquet part file, compacting parts per stream and pruning old compactions."""
+
+    def __init__(self, directory: str, max_parts: int = 50, max_files: int = 10, **kwargs):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for the parquet result sink. Install with: pip install pyarrow")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_parts = max_parts
+        self.max_files = max_files
+        self._sequence = 0
+        super().__init__(**kwargs)
+
+    def describe(self) -> str:
+        return f"Parquet files in {self.directory}"
+
+    def _write_batch(self, stream: str, records: List[Record]) -> None:
+        stream_dir = self.directory / _safe_stream_name(stream)
+        stream_dir.mkdir(exist_ok=True)
+        self._sequence += 1
+        part = stream_dir / f"part-{datetime.now():%Y%m%d%H%M%S}-{self._sequence:06d}.parquet"
+        # Nested values (lists of strings, score dicts) are stored as JSON text so
+        # that batches with slightly different shapes still share one schema
+        rows = [
+            {key: serialization.dumps(value) if isinstance(value, (dict, list)) else value
+             for key, value in record.items()}
+            for record in records
+        ]
+        pq.write_table(pa.Table.from_pylist(rows), part)
+
+        parts = sorted(stream_dir.glob("part-*.parquet"))
+        if len(parts) > self.max_parts:
+            self._compact(stream_dir, parts)
+
+    def _compact(self, stream_dir: Path, parts: List[Path]) -> None:
+        """Merge all part files of a stream into a single file and prune old compacted files."""
+        table = pa.concat_tables([pq.read_table(part) for part in parts], promote_options="default")
+        compacted = stream_dir / f"compacted-{datetime.now():%Y%m%d%H%M%S%f}.parquet"
+        pq.write_table(table, compacted)
+        for part in parts:
+            part.unlink()
+
+        # Like rotated JSONL archives, only the newest max_files compactions are kept
+        compactions = sorted(stream_dir.glob("compacted-*.parquet"))
+        for old_compaction in compactions[:-self.max_files] if self.max_files > 0 else compactions:
+            old_compaction.unlink()
+        logger.info(f"Compacted {len(parts)} parquet parts into {compacted.name}")
+
+
+class DatabaseSink(BufferedSink):
+    """Streams records into the result_records table with COPY."""
+
+    def __init__(self, database_url: str, **kwargs):
+        if not PSYCOPG_AVAILABLE:
+            raise ImportError("psycopg is required for the database result sink. Install with: pip install 'psycopg[binary]'")
+        self.conninfo = re.sub(r'^postgres(ql)?(\+\w+)?://', 'postgresql://', database_url)
+        super().__init__(**kwargs)
+
+    def describe(self) -> str:
+        return "the result_records table"
+
+    def _write_batch(self, stream: str, records: List[Record]) -> None:
+        with psycopg.connect(self.conninfo) as conn:
+            with conn.cursor() as cur:
+                with cur.copy("COPY result_records (stream, payload) FROM STDIN") as copy:
+                    for record in records:
+                        copy.write_row((stream, serialization.dumps(record)))
+
+
+def _safe_stream_name(stream: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', stream)
+
+
+def create_result_sink(settings) -> ResultSink:
+    """Create the sink selected by the RESULT_SINK setting."""
+    kind = settings.result_sink.lower()
+    try:
+        if kind in ("none", "null"):
+            return NullSink()
+        if kind == "jsonl":
+            return JSONLSink(
+                settings.default_output_dir,
+                max_bytes=settings.result_sink_max_bytes,
+                max_files=settings.result_sink_max_files
+            )
+        if kind == "parquet":
+            return ParquetSink(settings.default_output_dir, max_files=settings.result_sink_max_files)
+        if kind == "database":
+            if not settings.database_url:
+                raise ValueError("RESULT_SINK=database requires DATABASE_URL")
+            return DatabaseSink(settings.database_url)
+        raise ValueError(f"Unknown result sink: {settings.result_sink}")
+    except (ImportError, ValueError) as e:
+        logger.warning(f"Result sink '{kind}' unavailable ({e}); results will not be recorded")
+        return NullSink()
+
+
+_result_sink: Optional[ResultSink] = None
+_result_sink_lock = threading.Lock()
+
+
+def get_result_sink() -> ResultSink:
+    """Get the process-wide result sink, creating it on first use."""
+    global _result_sink
+    if _result_sink is None:
+        with _result_sink_lock:
+            if _result_sink is None:
+                from src.config.settings import get_settings
+                _result_sink = create_result_sink(get_settings())
+                atexit.register(_result_sink.close)
+    return _result_sink
+
+
+__all__ = [
+    'ResultSink',
+    'NullSink',
+    'BufferedSink',
+    'JSONLSink',
+    'ParquetSink',
+    'DatabaseSink',
+    'create_result_sink',
+    'get_result_sink'
+]
@@ -0,0 +1,228 @@
+"""
+Persistent run store for the recruitment workflow.
+
+Each finished workflow run is written to Postgres in one transaction: the run
+row and its step timings go in with executemany, and the candidate and ranking
+rows are streamed with COPY. A past run can then be re-opened as a
+WorkflowResult object without re-running the LLM and PDL calls.
+
+The table definitions are owned by the API's Alembic migrations
+(app/models/workflow_run.py); this module only speaks SQL.
+"""
+
+import logging
+import re
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+try:
+    import psycopg
+    PSYCOPG_AVAILABLE = True
+except ImportError:
+    PSYCOPG_AVAILABLE = False
+
+from src.core import serialization
+from src.core.models import (
+    CandidateProfile, CandidateRanking, JobDescription,
+    SearchMetadata, WorkflowResult
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RunStore:
+    """Writes workflow runs to Postgres and reads them back."""
+
+    def __init__(self, database_url: str):
+        """Initialize the store with a SQLAlchemy-style or libpq database URL."""
+        if not PSYCOPG_AVAILABLE:
+            raise ImportError("psycopg is required for the run store. Install with: pip install 'psycopg[binary]'")
+        # SQLAlchemy URLs carry the driver ("postgresql+psycopg://"), libpq does not
+        self.conninfo = re.sub(r'^postgres(ql)?(\+\w+)?://', 'postgresql://', database_url)
+
+    @classmethod
+    def from_settings(cls, settings) -> Optional['RunStore']:
+        """Create a store if run persistence is configured, else return None."""
+        if not settings.persist_workflow_runs or not settings.database_url:
+            logger.info("Workflow run persistence disabled (no DATABASE_URL configured)")
+            return None
+        try:
+            return cls(settings.database_url)
+        except ImportError as e:
+            logger.warning(f"Workflow run persistence disabled: {e}")
+            return None
+
+    def save_run(
+        self,
+        run_id: str,
+        result: WorkflowResult,
+        steps: List[Dict[str, Any]],
+        *,
+        status: str,
+        job_description_text: str,
+        max_candidates: int,
+        errors: List[str],
+        warnings: List[str],
+        org_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> None:
+        """Persist a finished run, its step timings, candidates and rankings."""
+        run_uuid = uuid.UUID(run_id)
+        metadata = result.metadata
+
+        step_rows = []
+        for position, step in enumerate(steps):
+            started_at = None
+            if step.get('start_time') is not None:
+                started_at = datetime.fromtimestamp(step['start_time'], tz=timezone.utc)
+            step_rows.append((
+                run_uuid,
+                position,
+                step['name'],
+                step['success'],
+                started_at,
+                step.get('duration_ms'),
+                step.get('error_message'),
+            ))
+
+        with psycopg.connect(self.conninfo) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO workflow_runs (
+                        id, org_id, user_id, status, job_title, job_description_text, job_data,
+                        max_candidates, candidates_found, candidates_ranked, llm_tokens_used, fallbacks_used,
+                        processing_time_seconds, workflow_version, errors, warnings, created_at
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    """,
+                    (
+                        run_uuid,
+                        org_id,
+                        user_id,
+                        status,
+                        result.job_data.title[:200],
+                        job_description_text,
+                        serialization.dumps(result.job_data),
+                        max_candidates,
+                        metadata.candidates_found,
+                        metadata.candidates_ranked,
+                        metadata.llm_tokens_used,
+                        metadata.fallbacks_used,
+                        metadata.processing_time_seconds,
+                        metadata.workflow_version,
+                        serialization.dumps(errors),
+                        serialization.dumps(warnings),
+                        metadata.timestamp,
+                    ),
+                )
+
+                if step_rows:
+                    cur.executemany(
+                        """
+                        INSERT INTO workflow_run_steps (
+                            run_id, position, name, success, started_at, duration_ms, error_message
+                        ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+                        """,
+                        step_rows,
+                    )
+
+                if result.candidates:
+                    with cur.copy(
+                        "COPY workflow_run_candidates "
+                        "(run_id, position, candidate_id, full_name, current_title, current_company, profile) "
+                        "FROM STDIN"
+                    ) as copy:
+                        for position, candidate in enumerate(result.candidates):
+                            copy.write_row((
+                                run_uuid,
+                                position,
+                                candidate.candidate_id,
+                                candidate.full_name,
+                                candidate.current_title,
+                                candidate.current_company,
+                                serialization.dumps(candidate),
+                            ))
+
+                if result.rankings:
+                    with cur.copy(
+                        "COPY workflow_run_rankings "
+                        "(run_id, rank, candidate_id, candidate_name, overall_score, confidence_level, ranking) "
+                        "FROM STDIN"
+                    ) as copy:
+                        for rank, ranking in enumerate(result.rankings, 1):
+                            copy.write_row((
+                                run_uuid,
+                                rank,
+                                ranking.candidate_id,
+                                ranking.candidate_name,
+                                ranking.overall_score,
+                                ranking.confidence_level.value,
+                                serialization.dumps(ranking),
+                            ))
+
+        logger.info(
+            f"Persisted workflow run {run_id}: {len(step_rows)} steps, "
+            f"{len(result.candidates)} candidates, {len(result.rankings)} rankings"
+        )
+
+    def load_run(self, run_id: str) -> Optional[WorkflowResult]:
+        """Rebuild the WorkflowResult of a stored run, or return None if it does not exist."""
+        run_uuid = uuid.UUID(run_id)
+
+        with psycopg.connect(self.conninfo) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT job_data, candidates_found, candidates_ranked, llm_tokens_used, fallbacks_used,
+                           processing_time_seconds, workflow_version, created_at
+                    FROM workflow_runs WHERE id = %s
+                    """,
+                    (run_uuid,),
+                )
+                run_row = cur.fetchone()
+                if run_row is None:
+                    return None
+
+                cur.execute(
+                    "SELECT profile FROM workflow_run_candidates WHERE run_id = %s ORDER BY position",
+                    (run_uuid,),
+                )
+                candidate_rows = cur.fetchall()
+
+                cur.execute(
+                    "SELECT ranking FROM workflow_run_rankings WHERE run_id = %s ORDER BY rank",
+                    (run_uuid,),
+                )
+                ranking_rows = cur.fetchall()
+
+                cur.execute(
+                    "SELECT name, duration_ms FROM workflow_run_steps WHERE run_id = %s ORDER BY position",
+                    (run_uuid,),
+                )
+                step_rows = cur.fetchall()
+
+        (job_data, candidates_found, candidates_ranked, llm_tokens_used, fallbacks_used,
+         processing_time, workflow_version, created_at) = run_row
+
+        return WorkflowResult(
+            job_data=JobDescription(**job_data),
+            candidates=[CandidateProfile(**profile) for (profile,) in candidate_rows],
+            rankings=[CandidateRanking(**ranking) for (ranking,) in ranking_rows],
+            metadata=SearchMetadata(
+                processing_time_seconds=processing_time,
+                candidates_found=candidates_found,
+                candidates_ranked=candidates_ranked,
+                llm_tokens_used=llm_tokens_used,
+                fallbacks_used=fallbacks_used,
+                step_timings_seconds={
+                    name: round(duration_ms / 1000, 3) for name, duration_ms in step_rows if duration_ms is not None
+                },
+                timestamp=created_at,
+                workflow_version=workflow_version or "2.0.0",
+                run_id=run_id,
+            ),
+        )
+
+
+__all__ = ['RunStore', 'PSYCOPG_AVAILABLE']
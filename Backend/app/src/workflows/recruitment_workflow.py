@@ -4,6 +4,7 @@ for state management and workflow coordination.
 """
 
 import time
+import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Any, TypedDict
 from dataclasses import dataclass
@@ -12,9 +13,12 @@ from src.core.models import (
     JobDescription, CandidateProfile, CandidateRanking, 
     SearchMetadata, WorkflowResult
 )
+from src.core import metrics, tracing
 from src.modules.jd_parser.parser import JobDescriptionParser
-from src.modules.candidate_retrieval.client import PDLAPIClient, CandidateConverter
+from src.modules.candidate_retrieval.client import PDLAPIClient, CandidateConverter, search_terms_from_job
 from src.modules.candidate_ranking.ranker import CandidateRanker
+from src.storage.jd_artifacts import JDArtifact, JDArtifactStore, summarize_job
+from src.storage.run_store import RunStore
 from src.config.settings import get_settings, get_logger
 
 logger = get_logger()
@@ -23,10 +27,14 @@ logger = get_logger()
 class WorkflowState(TypedDict):
     """State management for the recruitment workflow."""
     # Input
+    run_id: str
     job_description_text: str
     max_candidates: int
+    org_id: Optional[str]
+    user_id: Optional[str]
     
     # Intermediate states
+    jd_artifact: Optional[JDArtifact]
     parsed_job: Optional[JobDescription]
     raw_candidates: List[Dict[str, Any]]
     candidate_profiles: List[CandidateProfile]
@@ -51,6 +59,10 @@ class WorkflowStep:
     outputs: List[str]
     
     def __post_init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Clear execution state left over from a previous run."""
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
         self.success: bool = False
@@ -69,6 +81,8 @@ class RecruitmentWorkflow:
         self.pdl_client = PDLAPIClient()
         self.candidate_converter = CandidateConverter()
         self.candidate_ranker = CandidateRanker()
+        self.run_store = RunStore.from_settings(self.settings)
+        self.jd_artifact_store = JDArtifactStore.from_settings(self.settings)
         
         # Define workflow steps
         self.workflow_steps = [
@@ -104,14 +118,27 @@ class RecruitmentWorkflow:
             )
         ]
     
-    def run_workflow(self, job_description_text: str, max_candidates: int, with_discovery: bool = False) -> WorkflowResult:
-        """Run the complete recruitment workflow."""
+    def run_workflow(self, job_description_text: str, max_candidates: int, with_discovery: bool = False,
+                     org_id: Optional[str] = None, user_id: Optional[str] = None,
+                     jd_artifact: Optional[JDArtifact] = None) -> WorkflowResult:
+        """Run the complete recruitment workflow.
+
+        A ``jd_artifact`` (see load_jd_artifact) supplies whatever was already
+        derived from the JD; the run fills in the rest and stores it.
+        """
         logger.info("Starting LangGraph-orchestrated recruitment workflow...")
         
+        for step in self.workflow_steps:
+            step.reset()
+        
         # Initialize state
         state = WorkflowState(
+            run_id=str(uuid.uuid4()),
             job_description_text=job_description_text,
             max_candidates=max_candidates,
+            org_id=org_id,
+            user_id=user_id,
+            jd_artifact=jd_artifact,
             parsed_job=None,
             raw_candidates=[],
             candidate_profiles=[],
@@ -123,26 +150,32 @@ class RecruitmentWorkflow:
             workflow_result=None
         )
         
-        try:
-            # Execute workflow steps
-            for step in self.workflow_steps:
-                state = self._execute_step(step, state)
-                
-                # Check for critical errors
-                if step.name in ["parse_job_description", "search_candidates"] and not step.success:
-                    raise Exception(f"Critical step failed: {step.name} - {step.error_message}")
-            
-            # Return final result
-            if state["workflow_result"]:
-                logger.info("Workflow completed successfully")
-                return state["workflow_result"]
-            else:
-                raise Exception("Workflow completed but no result generated")
+        # Calls, tokens and fallbacks made during the run are collected for SearchMetadata;
+        # the run span is the parent of every step and external call span
+        with metrics.track_run(), tracing.span(
+            'workflow.run', run_id=state['run_id'], max_candidates=max_candidates,
+            with_discovery=with_discovery, org_id=org_id
+        ):
+            try:
+                # Execute workflow steps
+                for step in self.workflow_steps:
+                    state = self._execute_step(step, state)
+                    
+                    # Check for critical errors
+                    if step.name in ["parse_job_description", "search_candidates"] and not step.success:
+                        raise Exception(f"Critical step failed: {step.name} - {step.error_message}")
                 
-        except Exception as e:
-            logger.error(f"Workflow failed: {e}")
-            # Create error result
-            return self._create_error_result(state, str(e))
+                # Return final result
+                if state["workflow_result"]:
+                    logger.info("Workflow completed successfully")
+                    return state["workflow_result"]
+                else:
+                    raise Exception("Workflow completed but no result generated")
+                    
+            except Exception as e:
+                logger.error(f"Workflow failed: {e}")
+                # Create error result
+                return self._create_error_result(state, str(e))
     
     def _execute_step(self, step: WorkflowStep, state: WorkflowState) -> WorkflowState:
         """Execute a single workflow step."""
@@ -152,22 +185,23 @@ class RecruitmentWorkflow:
         state["current_step"] = step.name
         
         try:
-            # Validate required inputs
-            self._validate_step_inputs(step, state)
-            
-            # Execute step based on name
-            if step.name == "parse_job_description":
-                state = self._parse_job_description(state)
-            elif step.name == "search_candidates":
-                state = self._search_candidates(state)
-            elif step.name == "convert_candidates":
-                state = self._convert_candidates(state)
-            elif step.name == "rank_candidates":
-                state = self._rank_candidates(state)
-            elif step.name == "finalize_results":
-                state = self._finalize_results(state)
-            else:
-                raise ValueError(f"Unknown step: {step.name}")
+            with metrics.workflow_step(step.name):
+                # Validate required inputs
+                self._validate_step_inputs(step, state)
+                
+                # Execute step based on name
+                if step.name == "parse_job_description":
+                    state = self._parse_job_description(state)
+                elif step.name == "search_candidates":
+                    state = self._search_candidates(state)
+                elif step.name == "convert_candidates":
+                    state = self._convert_candidates(state)
+                elif step.name == "rank_candidates":
+                    state = self._rank_candidates(state)
+                elif step.name == "finalize_results":
+                    state = self._finalize_results(state)
+                else:
+                    raise ValueError(f"Unknown step: {step.name}")
             
             step.success = True
             logger.info(f"Step {step.name} completed successfully")
@@ -191,17 +225,47 @@ class RecruitmentWorkflow:
             if required_input not in state or state[required_input] is None:
                 raise ValueError(f"Required input '{required_input}' not available for step '{step.name}'")
     
+    def load_jd_artifact(self, jd_id: str) -> JDArtifact:
+        """The stored artifact of an uploaded JD (jds.jd_id), to pass to run_workflow."""
+        if self.jd_artifact_store is None:
+            raise ValueError("Runs for a stored JD need DATABASE_URL")
+        artifact = self.jd_artifact_store.load(jd_id)
+        if artifact is None:
+            raise ValueError(f"JD {jd_id} has no stored artifact (uploaded before artifacts were kept?)")
+        return artifact
+
     def _parse_job_description(self, state: WorkflowState) -> WorkflowState:
-        """Parse job description step."""
+        """Parse job description step; reuses the JD artifact's parse when it has one."""
         try:
-            parsed_job = self.job_parser.parse_job_description(state["job_description_text"])
-            state["parsed_job"] = parsed_job
-            logger.info(f"Successfully parsed job: {parsed_job.title}")
+            artifact = state.get("jd_artifact") or JDArtifact(text=state["job_description_text"])
+            if not artifact.complete:
+                if artifact.parsed_job is None:
+                    artifact.parsed_job = self.job_parser.parse_job_description(artifact.text)
+                if artifact.search_terms is None:
+                    # Read off the parse; the search step asks the LLM only if this finds none
+                    artifact.search_terms = search_terms_from_job(artifact.parsed_job)
+                if not artifact.summary:
+                    artifact.summary = summarize_job(artifact.parsed_job)
+                self._save_jd_artifact(artifact)
+            else:
+                logger.info("Reusing the stored JD artifact")
+            state["jd_artifact"] = artifact
+            state["parsed_job"] = artifact.parsed_job
+            logger.info(f"Successfully parsed job: {artifact.parsed_job.title}")
         except Exception as e:
             logger.error(f"Job description parsing failed: {e}")
             raise
         
         return state
+
+    def _save_jd_artifact(self, artifact: JDArtifact) -> None:
+        """Store the artifact of an uploaded JD; a failure only costs the reuse."""
+        if artifact.jd_id is None or self.jd_artifact_store is None:
+            return
+        try:
+            self.jd_artifact_store.save(artifact)
+        except Exception as e:
+            logger.warning(f"Could not store the artifact of JD {artifact.jd_id}: {e}")
     
    
 
@@ -241,9 +305,14 @@ class RecruitmentWorkflow:
                 
                 logger.info(f"🔍 Calling PDL API for 1 candidate with job description: {search_text[:100]}...")
                 
+                artifact = state["jd_artifact"]
+                if artifact.search_terms is None:
+                    artifact.search_terms = self.pdl_client.generate_search_terms(search_text)
+                    self._save_jd_artifact(artifact)
                 raw_candidates = self.pdl_client.search_candidates(
                     search_text, 
-                    state["max_candidates"] # This will always be 1 at this point
+                    state["max_candidates"], # This will always be 1 at this point
+                    search_terms=artifact.search_terms
                 )
                 state["raw_candidates"] = raw_candidates
                 logger.info(f"Found {len(raw_candidates)} raw candidates from PDL.")
@@ -333,8 +402,8 @@ class RecruitmentWorkflow:
                 candidates_ranked=len(state["candidate_rankings"]),
                 timestamp=datetime.now(),
                 workflow_version=self.settings.workflow_version,
-                search_queries_used=[],  # Could be populated from PDL client
-                api_calls_made=0  # Could be tracked
+                run_id=state["run_id"],
+                **self._run_stats_metadata()
             )
             
             # Create final result
@@ -348,12 +417,28 @@ class RecruitmentWorkflow:
             state["workflow_result"] = workflow_result
             logger.info(f"Workflow finalized in {total_time:.2f} seconds")
             
+            self._persist_run(state, workflow_result, status="completed")
+            
         except Exception as e:
             logger.error(f"Result finalization failed: {e}")
             raise
         
         return state
     
+    def _run_stats_metadata(self) -> Dict[str, Any]:
+        """SearchMetadata fields taken from the current run's instrumentation."""
+        stats = metrics.current_run()
+        if stats is None:
+            return {}
+        return {
+            'search_queries_used': list(stats.search_queries),
+            'api_calls_made': stats.api_calls_made,
+            'llm_tokens_used': stats.tokens_used,
+            'llm_cost_usd': round(stats.cost_usd, 4),
+            'fallbacks_used': stats.fallbacks,
+            'step_timings_seconds': dict(stats.step_seconds),
+        }
+    
     def _create_error_result(self, state: WorkflowState, error_message: str) -> WorkflowResult:
         """Create an error result when workflow fails."""
         total_time = time.time() - state["start_time"]
@@ -364,7 +449,9 @@ class RecruitmentWorkflow:
             candidates_found=0,
             candidates_ranked=0,
             timestamp=datetime.now(),
-            workflow_version=self.settings.workflow_version
+            workflow_version=self.settings.workflow_version,
+            run_id=state["run_id"],
+            **self._run_stats_metadata()
         )
         
         # Create minimal job data if parsing failed
@@ -374,12 +461,54 @@ class RecruitmentWorkflow:
         else:
             job_data = state["parsed_job"]
         
-        return WorkflowResult(
+        error_result = WorkflowResult(
             job_data=job_data,
             candidates=[],
             rankings=[],
             metadata=metadata
         )
+        
+        self._persist_run(state, error_result, status="failed")
+        
+        return error_result
+    
+    def _persist_run(self, state: WorkflowState, workflow_result: WorkflowResult, status: str) -> None:
+        """Write the run, its step timings, candidates and rankings to the run store."""
+        if not self.run_store:
+            return
+        
+        now = time.time()
+        steps = []
+        for step in self.workflow_steps:
+            if step.start_time is None:
+                continue
+            # The step calling us (finalize_results) has not ended yet, but it
+            # has produced the result we are about to store.
+            end_time = step.end_time or now
+            steps.append({
+                'name': step.name,
+                'success': step.success if step.end_time else True,
+                'start_time': step.start_time,
+                'duration_ms': round((end_time - step.start_time) * 1000, 2),
+                'error_message': step.error_message
+            })
+        
+        try:
+            self.run_store.save_run(
+                state["run_id"],
+                workflow_result,
+                steps,
+                status=status,
+                job_description_text=state["job_description_text"],
+                max_candidates=state["max_candidates"],
+                errors=state["errors"],
+                warnings=state["warnings"],
+                org_id=state.get("org_id"),
+                user_id=state.get("user_id")
+            )
+        except Exception as e:
+            # History is best-effort: never fail a run because it could not be stored
+            logger.warning(f"Could not persist workflow run {state['run_id']}: {e}")
     
     def get_workflow_status(self) -> Dict[str, Any]:
         """Get current workflow status and step information."""
@@ -1,14 +1,47 @@
 # In file: Backend/app/supabase.py
 
+import asyncio
 import os
-from supabase import create_client, Client
-# from dotenv import load_dotenv  <- You can remove this line
+from functools import lru_cache
+from typing import Optional, Tuple
+from supabase import acreate_client, create_client, AsyncClient, Client
 
-# load_dotenv() <- And this line
 
-# os.environ.get() will now work because Docker provides the variables
-url: str = os.environ.get("SUPABASE_URL")
-key: str = os.environ.get("SUPABASE_KEY")
+@lru_cache(maxsize=1)
+def get_client() -> Client:
+    """
+    Create the Supabase client on first use.
 
-# This creates the client instance
-supabase_client: Client = create_client(url, key)
\ No newline at end of file
+    os.environ.get() works because Docker provides the variables. Creating the
+    client lazily lets the app import (and serve /health) without Supabase
+    configured, and lets SUPABASE_URL point at a local stand-in for load tests.
+    """
+    return create_client(*_credentials())
+
+
+_async_client: Optional[AsyncClient] = None
+_async_client_lock = asyncio.Lock()
+
+
+async def get_async_client() -> AsyncClient:
+    """
+    The shared async (httpx) Supabase client, created on first use.
+
+    Its connection pools are reused across requests, so batch endpoints can
+    run storage uploads concurrently and send table writes in bulk without a
+    new connection per call.
+    """
+    global _async_client
+    if _async_client is None:
+        async with _async_client_lock:
+            if _async_client is None:
+                _async_client = await acreate_client(*_credentials())
+    return _async_client
+
+
+def _credentials() -> Tuple[str, str]:
+    url = os.environ.get("SUPABASE_URL")
+    key = os.environ.get("SUPABASE_KEY")
+    if not url or not key:
+        raise RuntimeError("SUPABASE_URL and SUPABASE_KEY must be set to use Supabase.")
+    return url, key
@@ -0,0 +1,158 @@
+"""
+JD fallback parser benchmark: multi-scan legacy parser vs single-pass JDFallbackParser.
+
+The legacy parser (kept below as the baseline) ran about ten scans per JD:
+four location patterns, five experience patterns, a DOTALL regex compiled
+from an f-string for each of nine section keywords, plus salary, education,
+skill and keyword loops. JDFallbackParser walks the lines once with
+precompiled patterns. The JD fixture is repeated to simulate large postings.
+
+The two are not doing the same work: the legacy section and location
+patterns escape their newlines, so they match far less than intended, and
+its skill check is a bare substring test ('go' in 'google'). Skill matching
+goes through the taxonomy and is much faster with pyahocorasick installed.
+
+Usage (from Backend/):
+    python benchmarks/bench_jd_fallback.py
+    python benchmarks/bench_jd_fallback.py --copies 1 10 50 --repeat 50
+"""
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from src.modules.jd_parser.fallback import JDFallbackParser  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "harness", "fixtures", "job_description.txt")
+
+LEGACY_SKILLS = [
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'php', 'ruby',
+    'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql',
+    'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel',
+    'rails', 'asp.net', 'jquery', 'bootstrap', 'tensorflow', 'pytorch', 'pandas', 'numpy',
+    'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra', 'oracle',
+    'sqlite', 'dynamodb',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'ci/cd', 'terraform',
+    'ansible', 'chef', 'puppet', 'git', 'github', 'gitlab', 'bitbucket',
+    'machine learning', 'ai', 'data science', 'analytics', 'tableau', 'power bi',
+    'project management', 'agile', 'scrum', 'leadership', 'communication', 'api',
+    'rest', 'graphql', 'microservices', 'linux', 'unix', 'windows',
+]
+
+
+def legacy_fields(text: str) -> dict:
+    """The pre-single-pass fallback field extraction, unchanged in behaviour."""
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    text_lower = text.lower()
+
+    title = "Unknown Position"
+    for line in lines[:10]:
+        if line and len(line) > 5 and not line.lower().startswith(('job', 'position', 'role', 'we are', 'about')):
+            title = line
+            break
+    company = None
+    for line in lines[:15]:
+        for indicator in ['company:', 'organization:', 'employer:', 'at ']:
+            if indicator in line.lower():
+                company = line.split(':', 1)[-1].strip() if ':' in line else line.strip()
+                break
+        if company:
+            break
+
+    location = None
+    for pattern in [r'location[:\s]+([^\\n]+)', r'based in[:\s]+([^\\n]+)', r'office[:\s]+([^\\n]+)',
+                    r'([a-zA-Z\s]+,\s*[a-zA-Z]{2,})']:
+        matches = re.findall(pattern, text_lower)
+        if matches:
+            location = matches[0].strip()
+            break
+
+    skills = []
+    for keyword in LEGACY_SKILLS:
+        if keyword in text_lower:
+            skills.append(keyword.title())
+
+    experience = None
+    for pattern in [r'(\d+)\+?\s*years?', r'(\d+)-(\d+)\s*years?', r'minimum\s+(\d+)\s*years?',
+                    r'at least\s+(\d+)\s*years?', r'(\d+)\s*to\s*(\d+)\s*years?']:
+        matches = re.findall(pattern, text_lower)
+        if matches:
+            experience = matches[0]
+            break
+
+    level = next((k for k in ['entry', 'junior', 'mid', 'senior', 'lead', 'principal', 'executive']
+                  if k in text_lower), None)
+    employment = next((k for k in ['full time', 'full-time', 'part time', 'part-time', 'contract',
+                                   'freelance', 'internship'] if k in text_lower), None)
+
+    def list_items(keywords):
+        items = []
+        for keyword in keywords:
+            pattern = rf'{keyword}[:\s]*([^\\n]*(?:\\n[^\\n]*)*?)(?=\\n\\n|\\n[A-Z]|$)'
+            for match in re.findall(pattern, text_lower, re.MULTILINE | re.DOTALL):
+                for line in re.split(r'[•\-\*]|\n', match):
+                    line = line.strip()
+                    if line and len(line) > 10:
+                        items.append(line[:200])
+        return list(set(items))[:10]
+
+    salary = None
+    for pattern in [r'\$[\d,]+\s*-\s*\$[\d,]+', r'\$[\d,]+k?\s*-\s*\$[\d,]+k?',
+                    r'salary[:\s]*\$[\d,]+', r'compensation[:\s]*\$[\d,]+']:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        if matches:
+            salary = matches[0]
+            break
+
+    education = [k.title() for k in ["bachelor's degree", "master's degree", "phd", "doctorate",
+                                     "computer science", "engineering", "mathematics", "mba"]
+                 if k in text_lower]
+
+    return dict(
+        title=title, company=company, location=location, required_skills=list(set(skills))[:15],
+        experience_years=experience, experience_level=level, employment_type=employment,
+        responsibilities=list_items(['responsibilities', 'duties', 'role']),
+        requirements=list_items(['requirements', 'qualifications', 'must have']),
+        benefits=list_items(['benefits', 'perks', 'we offer']),
+        salary_range=salary, education_requirements=list(set(education)),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--copies", type=int, nargs="+", default=[1, 10, 50],
+                        help="how many times the JD fixture is repeated")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with open(FIXTURE, encoding="utf-8") as f:
+        fixture = f.read()
+    single_pass = JDFallbackParser()
+    single_pass.extract_fields(fixture)  # build the skill automaton outside the timings
+
+    for copies in args.copies:
+        text = "\n\n".join([fixture] * copies)
+        print(f"\nJD x{copies} ({len(text) / 1024:.0f} KiB)")
+        print("-" * 72)
+        cases = [
+            ("legacy multi-scan parser", lambda: legacy_fields(text)),
+            ("JDFallbackParser (single pass)", lambda: single_pass.extract_fields(text)),
+        ]
+        baseline = None
+        for name, func in cases:
+            per_call_ms = min(timeit.repeat(func, number=args.repeat, repeat=3)) / args.repeat * 1000
+            baseline = baseline or per_call_ms
+            print(f"  {name:<45} {per_call_ms:8.3f} ms  {baseline / per_call_ms:5.1f}x")
+
+    fields = single_pass.extract_fields(fixture)
+    print("\nFixture fields (single pass):")
+    for key in ("title", "company", "experience_level", "employment_type", "salary_range", "required_skills"):
+        print(f"  {key:<20} {fields[key]}")
+
+
+if __name__ == "__main__":
+    main()
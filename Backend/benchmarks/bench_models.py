@@ -0,0 +1,63 @@
+"""
+Pydantic construction benchmark: validated vs trusted model paths.
+
+Compares, per ranking:
+- full validation (CandidateRanking(**fields)), as used at ingress
+- rebuilding a validated ranking field by field (the old enhance path)
+- model_copy(update=...), used by enhance_rankings_with_discovery_metadata
+- model_construct, used for fallback and emergency rankings
+
+Usage (from Backend/):
+    python benchmarks/bench_models.py
+    python benchmarks/bench_models.py --size 500 --repeat 20
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from bench_serialization import build_result  # noqa: E402
+from src.core.models import CandidateProfile, CandidateRanking, DimensionScores  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=200, help="Number of rankings per pass")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    result = build_result(args.size)
+    rankings = result.rankings
+    ranking_fields = [dict(ranking.__dict__, dimension_scores=ranking.dimension_scores.model_dump()) for ranking in rankings]
+    profile_fields = [candidate.model_dump() for candidate in result.candidates]
+    explanation = "GEMINI 2.5 PRO DISCOVERED CANDIDATE (Iteration 1): enhanced"
+
+    def construct_ranking(fields):
+        return CandidateRanking.model_construct(
+            **dict(fields, dimension_scores=DimensionScores.model_construct(**fields["dimension_scores"]))
+        )
+
+    cases = [
+        ("CandidateProfile(**fields)", lambda: [CandidateProfile(**fields) for fields in profile_fields]),
+        ("CandidateRanking(**fields)", lambda: [CandidateRanking(**fields) for fields in ranking_fields]),
+        ("rebuild from validated ranking", lambda: [
+            CandidateRanking(**dict(ranking.__dict__, match_explanation=explanation)) for ranking in rankings
+        ]),
+        ("ranking.model_copy(update=...)", lambda: [
+            ranking.model_copy(update={"match_explanation": explanation}) for ranking in rankings
+        ]),
+        ("CandidateRanking.model_construct", lambda: [construct_ranking(fields) for fields in ranking_fields]),
+    ]
+
+    print(f"{args.size} models per pass, best of 3 x {args.repeat}")
+    print("-" * 72)
+    for name, func in cases:
+        per_model_us = min(timeit.repeat(func, number=args.repeat, repeat=3)) / args.repeat / args.size * 1e6
+        print(f"  {name:<45} {per_model_us:8.2f} us/model")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Candidate pool benchmark: list scans vs CandidatePool.
+
+For growing pool sizes, times id lookup, dedup of a discovery batch and
+top-k seed selection, and reports the memory held by the pool's indexes
+and columns.
+
+Usage (from Backend/):
+    python benchmarks/bench_pool.py
+    python benchmarks/bench_pool.py --sizes 1000 10000 50000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from src.core.models import CandidateProfile, CandidateRanking, ConfidenceLevel, DimensionScores  # noqa: E402
+from src.core.pool import CandidatePool  # noqa: E402
+
+SKILLS = [f"skill_{i}" for i in range(500)]
+
+
+def build_profiles(size: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [
+        CandidateProfile.model_construct(
+            candidate_id=f"pdl_{i:07d}",
+            full_name=f"Candidate {i}",
+            current_company=f"Company {i % 997}",
+            skills=rng.sample(SKILLS, 25),
+        )
+        for i in range(size)
+    ]
+
+
+def build_rankings(profiles, seed: int = 7):
+    rng = random.Random(seed)
+    rankings = []
+    for profile in profiles:
+        score = rng.random()
+        rankings.append(CandidateRanking.model_construct(
+            candidate_id=profile.candidate_id,
+            candidate_name=profile.full_name,
+            overall_score=score,
+            dimension_scores=DimensionScores.model_construct(
+                technical_skills=score, experience_relevance=score, seniority_match=score,
+                education_fit=score, industry_experience=score, location_compatibility=score
+            ),
+            confidence_level=ConfidenceLevel.MEDIUM,
+            match_explanation="Synthetic ranking for benchmarking",
+        ))
+    return rankings
+
+
+def timed(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        profiles = build_profiles(size)
+        rankings = build_rankings(profiles)
+        lookup_ids = [profiles[random.randrange(size)].candidate_id for _ in range(args.lookups)]
+        batch = build_profiles(25, seed=size)  # mostly duplicates of existing rows
+
+        tracemalloc.start()
+        pool = CandidatePool(profiles)
+        pool.set_rankings(rankings)
+        pool_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        def scan_lookup():
+            for candidate_id in lookup_ids:
+                next(c for c in profiles if c.candidate_id == candidate_id)
+
+        def scan_dedup():
+            existing = {CandidatePool.signature(c) for c in profiles}
+            return [c for c in batch if CandidatePool.signature(c) not in existing]
+
+        print(f"\n{size} candidates (pool indexes + columns: {pool_bytes / 1024 / 1024:.1f} MiB)")
+        print("-" * 72)
+        print(f"  {args.lookups} lookups, list scan      {timed(scan_lookup, 1):10.2f} ms")
+        print(f"  {args.lookups} lookups, pool.get       {timed(lambda: [pool.get(i) for i in lookup_ids]):10.2f} ms")
+        print(f"  dedup 25 new, rebuild signatures {timed(scan_dedup):10.2f} ms")
+        print(f"  dedup 25 new, pool index         {timed(lambda: [c for c in batch if CandidatePool.signature(c) not in pool._signatures]):10.2f} ms")
+        print(f"  top 5, sorted(rankings)          {timed(lambda: sorted(rankings, key=lambda r: r.overall_score, reverse=True)[:5]):10.2f} ms")
+        print(f"  top 5, pool.top                  {timed(lambda: pool.top(5)):10.2f} ms")
+        print(f"  skill overlap, pool              {timed(lambda: pool.skill_overlap(SKILLS[:10])):10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Serialization benchmark: stdlib json vs orjson on ranking payloads.
+
+Builds a WorkflowResult with N candidates and N rankings (nested dimension
+scores, lists of strengths/concerns) and times the export and API response
+paths with each encoder.
+
+Usage (from Backend/):
+    python benchmarks/bench_serialization.py
+    python benchmarks/bench_serialization.py --sizes 10 50 200 --repeat 200
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from src.core import serialization  # noqa: E402
+from src.core.models import (  # noqa: E402
+    CandidateProfile, CandidateRanking, ConfidenceLevel, DimensionScores,
+    JobDescription, Location, SearchMetadata, WorkflowResult
+)
+
+
+def build_result(size: int) -> WorkflowResult:
+    """Build a synthetic workflow result with `size` ranked candidates."""
+    job = JobDescription(
+        title="Senior Backend Engineer",
+        company="Acme",
+        location=Location(city="Bengaluru", state="Karnataka", country="India"),
+        required_skills=["python", "fastapi", "postgresql", "aws", "docker", "kubernetes"],
+        preferred_skills=["kafka", "redis", "terraform"],
+        responsibilities=[f"Responsibility {i}" for i in range(10)],
+        requirements=[f"Requirement {i}" for i in range(10)],
+    )
+    candidates = []
+    rankings = []
+    for i in range(size):
+        candidates.append(CandidateProfile(
+            candidate_id=f"pdl_{i:06d}",
+            full_name=f"Candidate {i}",
+            current_title="Software Engineer",
+            current_company=f"Company {i % 17}",
+            location=Location(city="Pune", state="Maharashtra", country="India"),
+            linkedin_url=f"https://www.linkedin.com/in/candidate-{i}",
+            skills=[f"skill_{j}" for j in range(40)],
+            experience_years=i % 20,
+            previous_companies=[f"Previous {j}" for j in range(8)],
+        ))
+        rankings.append(CandidateRanking(
+            candidate_id=f"pdl_{i:06d}",
+            candidate_name=f"Candidate {i}",
+            current_title="Software Engineer",
+            current_company=f"Company {i % 17}",
+            overall_score=round(1.0 - i / (size * 2), 4),
+            dimension_scores=DimensionScores(
+                technical_skills=0.8, experience_relevance=0.7, seniority_match=0.6,
+                education_fit=0.9, industry_experience=0.5, location_compatibility=1.0
+            ),
+            strengths=[f"Strength {j} with some explanatory text" for j in range(5)],
+            concerns=[f"Concern {j} with some explanatory text" for j in range(3)],
+            recommendations=[f"Recommendation {j}" for j in range(3)],
+            confidence_level=ConfidenceLevel.HIGH,
+            match_explanation="Strong match on core backend skills and relevant industry experience. " * 3,
+            key_differentiators=[f"Differentiator {j}" for j in range(4)],
+            interview_focus_areas=[f"Focus area {j}" for j in range(4)],
+        ))
+    return WorkflowResult(
+        job_data=job,
+        candidates=candidates,
+        rankings=rankings,
+        metadata=SearchMetadata(processing_time_seconds=12.5, candidates_found=size, candidates_ranked=size),
+    )
+
+
+def build_cases(result: WorkflowResult):
+    """Return (name, callable) pairs to time."""
+    cases = [
+        ("stdlib json, indent=2 (old export)", lambda: json.dumps(result.model_dump(mode="json"), indent=2, ensure_ascii=False)),
+        ("stdlib json, compact", lambda: json.dumps(result.model_dump(mode="json"))),
+        ("pydantic model_dump_json", lambda: result.model_dump_json()),
+        (f"serialization.dumps_bytes ({'orjson' if serialization.ORJSON_AVAILABLE else 'stdlib fallback'})",
+         lambda: serialization.dumps_bytes(result)),
+        ("serialization.dumps_bytes, indent", lambda: serialization.dumps_bytes(result, indent=True)),
+    ]
+
+    try:
+        from fastapi.encoders import jsonable_encoder
+        from fastapi.responses import JSONResponse, ORJSONResponse
+    except ImportError:
+        return cases
+
+    cases += [
+        ("FastAPI JSONResponse", lambda: JSONResponse(jsonable_encoder(result)).body),
+        ("FastAPI ORJSONResponse", lambda: ORJSONResponse(jsonable_encoder(result)).body),
+    ]
+    return cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        result = build_result(size)
+        payload_kb = len(serialization.dumps_bytes(result)) / 1024
+        print(f"\n{size} candidates ({payload_kb:.0f} KiB compact)")
+        print("-" * 72)
+        baseline = None
+        for name, func in build_cases(result):
+            per_call_ms = min(timeit.repeat(func, number=args.repeat, repeat=3)) / args.repeat * 1000
+            baseline = baseline or per_call_ms
+            print(f"  {name:<45} {per_call_ms:8.3f} ms  {baseline / per_call_ms:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Local stand-ins for external services, used by the end-to-end benchmarks."""
+
+from .fakes import (
+    CallLog,
+    FakeServices,
+    FaultInjector,
+    InjectedError,
+    ServiceProfile,
+    fake_services,
+    load_fixture,
+    pdl_people,
+    peak_memory,
+    percentile,
+    summarize,
+)
+
+__all__ = [
+    'CallLog',
+    'FakeServices',
+    'FaultInjector',
+    'InjectedError',
+    'ServiceProfile',
+    'fake_services',
+    'load_fixture',
+    'pdl_people',
+    'peak_memory',
+    'percentile',
+    'summarize',
+]
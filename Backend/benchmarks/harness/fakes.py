@@ -0,0 +1,559 @@
+"""
+Deterministic local stand-ins for OpenAI, Gemini, People Data Labs and Supabase.
+
+Responses are built from the recorded fixtures in ``fixtures/`` and shaped to
+the request (one ranking per candidate in a ranking prompt, ``size`` people for
+a PDL search), so the pipeline's parsing code runs on realistic payloads. Every
+call goes through a FaultInjector that adds latency and injects errors, and is
+counted in a CallLog.
+"""
+
+import asyncio
+import copy
+import itertools
+import json
+import random
+import re
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+import zlib
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from unittest import mock
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+FIRST_NAMES = [
+    "Aarav", "Vivaan", "Aditya", "Vihaan", "Arjun", "Sai", "Reyansh", "Ayaan", "Krishna", "Ishaan",
+    "Ananya", "Diya", "Priya", "Aadhya", "Saanvi", "Kavya", "Meera", "Riya", "Nisha", "Pooja",
+    "Rahul", "Rohan", "Karan", "Nikhil", "Varun", "Neha", "Sneha", "Divya", "Shreya", "Tanvi",
+]
+LAST_NAMES = [
+    "Sharma", "Verma", "Iyer", "Reddy", "Nair", "Menon", "Rao", "Gupta", "Patel", "Shah",
+    "Kulkarni", "Deshpande", "Joshi", "Mehta", "Bose", "Das", "Sen", "Pillai", "Naidu", "Kapoor",
+    "Malhotra", "Chopra", "Bhat", "Hegde", "Shetty", "Kamath", "Prabhu", "Banerjee", "Ghosh", "Mukherjee",
+    "Agarwal", "Jain", "Saxena", "Tiwari", "Mishra", "Pandey", "Yadav", "Chauhan", "Thakur", "Rathore",
+]
+# Discovered candidates use a separate surname list so they never collide with the seed pool
+DISCOVERY_LAST_NAMES = [
+    "Acharya", "Bhatt", "Chatterjee", "Dutta", "Ganguly", "Haldar", "Iyengar", "Jha", "Kaur", "Lal",
+    "Mathur", "Nambiar", "Oberoi", "Parekh", "Qureshi", "Rastogi", "Sinha", "Trivedi", "Upadhyay", "Vohra",
+]
+COMPANIES = ["Flipkart", "Swiggy", "Zomato", "Freshworks", "Zoho", "Ola", "Myntra", "Meesho", "Groww", "Zerodha"]
+
+
+def load_fixture(name: str) -> Any:
+    """Load a fixture: JSON files are parsed, anything else is returned as text."""
+    path = FIXTURES_DIR / name
+    text = path.read_text(encoding="utf-8")
+    return json.loads(text) if path.suffix == ".json" else text
+
+
+def person_name(index: int, last_names: List[str] = LAST_NAMES) -> str:
+    """Deterministic, digit-free, unique-per-index full name."""
+    first = FIRST_NAMES[index % len(FIRST_NAMES)]
+    last = last_names[(index // len(FIRST_NAMES)) % len(last_names)]
+    suffix = index // (len(FIRST_NAMES) * len(last_names))
+    middle = f" {FIRST_NAMES[suffix % len(FIRST_NAMES)]}" if suffix else ""
+    return f"{first}{middle} {last}"
+
+
+def pdl_people(count: int, start: int = 0) -> List[Dict[str, Any]]:
+    """PDL person records derived from the recorded fixture."""
+    template = load_fixture("pdl_person.json")
+    people = []
+    for index in range(start, start + count):
+        person = copy.deepcopy(template)
+        name = person_name(index)
+        slug = name.lower().replace(" ", "-")
+        company = COMPANIES[index % len(COMPANIES)]
+        person.update({
+            "id": f"{template['id'][:-4]}{index:04d}",
+            "full_name": name,
+            "first_name": name.split()[0],
+            "last_name": name.split()[-1],
+            "job_company_name": company,
+            "linkedin_url": f"linkedin.com/in/{slug}",
+        })
+        person["experience"][0]["company"]["name"] = company
+        people.append(person)
+    return people
+
+
+class InjectedError(Exception):
+    """Raised by fakes when the fault injector decides a call should fail."""
+
+
+@dataclass
+class ServiceProfile:
+    """Latency and failure behaviour for one fake service."""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+
+
+@dataclass
+class FaultInjector:
+    """Adds latency and injects errors per service, reproducibly for a given seed."""
+    profiles: Dict[str, ServiceProfile] = field(default_factory=dict)
+    seed: int = 1234
+
+    def __post_init__(self):
+        self._rng = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    def decide(self, service: str) -> Tuple[float, bool]:
+        """Draw (delay in seconds, whether to fail) for one call to a service."""
+        profile = self.profiles.get(service, ServiceProfile())
+        with self._lock:
+            delay = profile.latency_ms + self._rng.uniform(0, profile.jitter_ms)
+            fail = self._rng.random() < profile.error_rate
+        return delay / 1000, fail
+
+    def apply(self, service: str) -> None:
+        """Sleep for the drawn delay, then raise InjectedError if the call should fail."""
+        delay, fail = self.decide(service)
+        if delay > 0:
+            time.sleep(delay)
+        if fail:
+            raise InjectedError(f"Error code: 503 - {service} unavailable (injected)")
+
+
+class CallLog:
+    """Thread-safe count of calls per service."""
+
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, service: str) -> None:
+        with self._lock:
+            self._counts[service] += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+class FakeLLM:
+    """Answers OpenAI-style prompts from fixtures, based on what the prompt asks for."""
+
+    def __init__(self, injector: FaultInjector, calls: CallLog):
+        self.injector = injector
+        self.calls = calls
+        self._discovery_counter = itertools.count()
+        self._fixtures = {
+            name: load_fixture(name) for name in (
+                "jd_parsed.json", "jd_summary.json", "search_terms.json", "ranking.json",
+                "discovered_candidate.json", "resume_parsed.json",
+            )
+        }
+
+    def complete(self, messages: List[Dict[str, str]]) -> str:
+        self.calls.record("openai")
+        self.injector.apply("openai")
+        prompt = "\n".join(message.get("content", "") for message in messages)
+
+        if "GEMINI RESPONSE:" in prompt:
+            return json.dumps(self._discovered_candidates(prompt))
+        if "job_titles" in prompt and "skills" in prompt and "CANDIDATE 1" not in prompt:
+            return json.dumps(self._fixtures["search_terms.json"])
+        if "CANDIDATE 1" in prompt and "dimension_scores" in prompt:
+            return json.dumps(self._rankings(prompt))
+        if "resume parser" in prompt:
+            return json.dumps(self._fixtures["resume_parsed.json"])
+        if "jd_parsed_summary" in prompt:
+            return json.dumps(self._fixtures["jd_summary.json"])
+        if "job description" in prompt.lower():
+            return json.dumps(self._fixtures["jd_parsed.json"])
+        return "{}"
+
+    def _rankings(self, prompt: str) -> List[Dict[str, Any]]:
+        names = re.findall(r"^Name: (.+)$", prompt, flags=re.MULTILINE)
+        rankings = []
+        for name in names:
+            # Stable pseudo-score per candidate name
+            score = 0.40 + (zlib.crc32(name.encode()) % 550) / 1000
+            ranking = copy.deepcopy(self._fixtures["ranking.json"])
+            ranking["candidate_name"] = name
+            ranking["overall_score"] = round(score, 3)
+            for dimension in ranking["dimension_scores"]:
+                ranking["dimension_scores"][dimension] = round(min(score + 0.05, 1.0), 3)
+            ranking["confidence_level"] = "high" if score > 0.8 else "medium"
+            rankings.append(ranking)
+        return rankings
+
+    def _discovered_candidates(self, prompt: str) -> List[Dict[str, Any]]:
+        names = re.findall(r"\*\*(.+?)\*\*", prompt)
+        candidates = []
+        for name in names:
+            candidate = copy.deepcopy(self._fixtures["discovered_candidate.json"])
+            candidate["full_name"] = name
+            candidate["linkedin_url"] = f"https://www.linkedin.com/in/{name.lower().replace(' ', '-')}"
+            candidates.append(candidate)
+        return candidates
+
+    def gemini_text(self) -> str:
+        """Grounded-search style free text naming five new candidates."""
+        self.calls.record("gemini")
+        self.injector.apply("gemini")
+        text = load_fixture("gemini_discovery.txt")
+        for slot in range(1, 6):
+            name = person_name(next(self._discovery_counter), DISCOVERY_LAST_NAMES)
+            text = text.replace(f"{{name_{slot}}}", name).replace(f"{{slug_{slot}}}", name.lower().replace(" ", "-"))
+        return text
+
+
+# ----------------------------------------------------------------------
+# OpenAI SDK
+# ----------------------------------------------------------------------
+
+class _FakeCompletions:
+    def __init__(self, llm: FakeLLM):
+        self._llm = llm
+
+    def create(self, model: str = "", messages: Optional[List[Dict[str, str]]] = None, **kwargs):
+        content = self._llm.complete(messages or [])
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason="stop")],
+            usage=SimpleNamespace(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+            model=model,
+        )
+
+
+class FakeOpenAIClient:
+    """Drop-in for ``openai.OpenAI`` exposing ``chat.completions.create``."""
+
+    llm: Optional[FakeLLM] = None  # set by fake_services()
+
+    def __init__(self, *args, **kwargs):
+        self.chat = SimpleNamespace(completions=_FakeCompletions(self.llm))
+
+
+# ----------------------------------------------------------------------
+# Gemini SDK
+# ----------------------------------------------------------------------
+
+class _FakeGeminiModels:
+    def __init__(self, llm: FakeLLM):
+        self._llm = llm
+
+    def generate_content(self, model: str = "", contents: Any = None, config: Any = None):
+        return SimpleNamespace(text=self._llm.gemini_text())
+
+
+class FakeGeminiClient:
+    """Drop-in for ``genai.Client`` exposing ``models.generate_content``."""
+
+    llm: Optional[FakeLLM] = None  # set by fake_services()
+
+    def __init__(self, *args, **kwargs):
+        self.models = _FakeGeminiModels(self.llm)
+
+
+# ----------------------------------------------------------------------
+# HTTP (requests.post to OpenAI REST and PDL)
+# ----------------------------------------------------------------------
+
+class FakeHTTPResponse:
+    def __init__(self, status_code: int, payload: Any):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = json.dumps(payload)
+
+    def json(self) -> Any:
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            import requests
+            raise requests.HTTPError(f"{self.status_code} Error (fake)", response=self)
+
+
+class FakeHTTP:
+    """Routes ``requests.post`` calls to the fake LLM and a fake PDL search."""
+
+    def __init__(self, llm: FakeLLM, injector: FaultInjector, calls: CallLog, real_post):
+        self.llm = llm
+        self.injector = injector
+        self.calls = calls
+        self.real_post = real_post
+        self._pdl_offset = 0
+
+    def post(self, url: str, *args, **kwargs):
+        body = kwargs.get("json") or {}
+        if "openai.com" in url:
+            try:
+                content = self.llm.complete(body.get("messages", []))
+            except InjectedError as e:
+                return FakeHTTPResponse(503, {"error": {"message": str(e)}})
+            return FakeHTTPResponse(200, {"choices": [{"message": {"content": content}}]})
+
+        if "peopledatalabs.com" in url:
+            self.calls.record("pdl")
+            try:
+                self.injector.apply("pdl")
+            except InjectedError as e:
+                return FakeHTTPResponse(503, {"error": {"message": str(e)}})
+            size = int(body.get("size", 10))
+            people = pdl_people(size, start=self._pdl_offset)
+            self._pdl_offset += size
+            return FakeHTTPResponse(200, {"status": 200, "data": people, "total": 10000})
+
+        return self.real_post(url, *args, **kwargs)
+
+
+# ----------------------------------------------------------------------
+# Supabase
+# ----------------------------------------------------------------------
+
+class _FakeQuery:
+    """One PostgREST-style query on an in-memory table: insert, upsert or a filtered select."""
+
+    # Columns the database fills in on insert, besides "id"
+    GENERATED_KEYS = {"jds": "jd_id"}
+
+    def __init__(self, supabase: "FakeSupabase", table: str):
+        self._supabase = supabase
+        self._table = table
+        self._operation = "select"
+        self._rows: List[Dict[str, Any]] = []
+        self._on_conflict: List[str] = []
+        self._filters: List[Callable[[Dict[str, Any]], bool]] = []
+        self._order: Optional[Tuple[str, bool]] = None
+        self._limit: Optional[int] = None
+        self._single = False
+
+    def insert(self, rows):
+        self._operation = "insert"
+        self._rows = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def upsert(self, rows, on_conflict: str = "id", **kwargs):
+        self._operation = "upsert"
+        self._rows = rows if isinstance(rows, list) else [rows]
+        self._on_conflict = [column.strip() for column in on_conflict.split(",")]
+        return self
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def eq(self, column: str, value: Any):
+        self._filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column: str, values):
+        values = set(values)
+        self._filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def order(self, column: str, desc: bool = False):
+        self._order = (column, desc)
+        return self
+
+    def limit(self, count: int):
+        self._limit = count
+        return self
+
+    def single(self):
+        self._single = True
+        return self
+
+    def execute(self):
+        self._supabase.calls.record("supabase_db")
+        self._supabase.injector.apply("supabase_db")
+        with self._supabase.lock:
+            table = self._supabase.tables.setdefault(self._table, [])
+            if self._operation == "insert":
+                data = [self._new_row(row) for row in self._rows]
+                table.extend(data)
+            elif self._operation == "upsert":
+                data = [self._upsert(table, row) for row in self._rows]
+            else:
+                data = [dict(row) for row in table if all(matches(row) for matches in self._filters)]
+                if self._order is not None:
+                    column, desc = self._order
+                    data.sort(key=lambda row: str(row.get(column) or ""), reverse=desc)
+                if self._limit is not None:
+                    data = data[:self._limit]
+        if self._single:
+            return SimpleNamespace(data=data[0] if data else None, count=len(data))
+        return SimpleNamespace(data=data, count=len(data))
+
+    def _new_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        row = dict(row, id=row.get("id") or str(uuid.uuid4()))
+        key = self.GENERATED_KEYS.get(self._table)
+        if key:
+            row.setdefault(key, str(uuid.uuid4()))
+        return row
+
+    def _upsert(self, table: List[Dict[str, Any]], row: Dict[str, Any]) -> Dict[str, Any]:
+        for existing in table:
+            if all(existing.get(column) == row.get(column) for column in self._on_conflict):
+                existing.update(row)
+                return dict(existing)
+        new_row = self._new_row(row)
+        table.append(new_row)
+        return dict(new_row)
+
+
+class _FakeBucket:
+    def __init__(self, supabase: "FakeSupabase", bucket: str):
+        self._supabase = supabase
+        self._bucket = bucket
+
+    def upload(self, path: str, file: Any, file_options: Optional[Dict[str, Any]] = None):
+        self._supabase.calls.record("supabase_storage")
+        self._supabase.injector.apply("supabase_storage")
+        data = file.read() if hasattr(file, "read") else file
+        self._supabase.objects[f"{self._bucket}/{path}"] = len(data)
+        return SimpleNamespace(path=path, full_path=f"{self._bucket}/{path}")
+
+
+class FakeSupabase:
+    """In-memory Supabase client: storage uploads, and table inserts, upserts and filtered selects."""
+
+    def __init__(self, injector: FaultInjector, calls: CallLog):
+        self.injector = injector
+        self.calls = calls
+        self.lock = threading.Lock()
+        self.tables: Dict[str, List[Dict[str, Any]]] = {}
+        self.objects: Dict[str, int] = {}
+        self.storage = SimpleNamespace(from_=lambda bucket: _FakeBucket(self, bucket))
+
+    def table(self, name: str) -> _FakeQuery:
+        return _FakeQuery(self, name)
+
+
+class _FakeAsyncQuery(_FakeQuery):
+    async def execute(self):
+        # In a worker thread, so injected latency does not block the event loop
+        return await asyncio.to_thread(super().execute)
+
+
+class _FakeAsyncBucket(_FakeBucket):
+    async def upload(self, path: str, file: Any, file_options: Optional[Dict[str, Any]] = None):
+        return await asyncio.to_thread(super().upload, path, file, file_options)
+
+
+class FakeAsyncSupabase:
+    """Drop-in for ``supabase.AsyncClient`` over the same tables and objects as a FakeSupabase."""
+
+    def __init__(self, supabase: FakeSupabase):
+        self._supabase = supabase
+        self.storage = SimpleNamespace(from_=lambda bucket: _FakeAsyncBucket(supabase, bucket))
+
+    def table(self, name: str) -> _FakeAsyncQuery:
+        return _FakeAsyncQuery(self._supabase, name)
+
+
+# ----------------------------------------------------------------------
+# Wiring
+# ----------------------------------------------------------------------
+
+@dataclass
+class FakeServices:
+    """Handles to the active fakes, returned by fake_services()."""
+    injector: FaultInjector
+    calls: CallLog
+    llm: FakeLLM
+    http: FakeHTTP
+    supabase: FakeSupabase
+    async_supabase: FakeAsyncSupabase
+
+
+def _fake_gemini_modules() -> Dict[str, Any]:
+    google = sys.modules.get("google") or ModuleType("google")
+    if not hasattr(google, "__path__"):
+        google.__path__ = []
+    genai = ModuleType("google.genai")
+    types = ModuleType("google.genai.types")
+    types.Tool = lambda **kwargs: SimpleNamespace(**kwargs)
+    types.GoogleSearch = lambda **kwargs: SimpleNamespace(**kwargs)
+    types.GenerateContentConfig = lambda **kwargs: SimpleNamespace(**kwargs)
+    genai.types = types
+    genai.Client = FakeGeminiClient
+    return {
+        "google": google,
+        "google.genai": genai,
+        "google.genai.types": types,
+    }
+
+
+@contextmanager
+def fake_services(injector: Optional[FaultInjector] = None) -> Iterator[FakeServices]:
+    """
+    Route OpenAI, Gemini, PDL and Supabase traffic to in-process fakes.
+
+    Patches ``openai.OpenAI``, ``requests.post`` and the ``google.genai`` module
+    for the duration of the block. Code that binds
+    ``from openai import OpenAI`` at import time must be imported inside it.
+    """
+    import openai
+    import requests
+
+    injector = injector or FaultInjector()
+    calls = CallLog()
+    llm = FakeLLM(injector, calls)
+    http = FakeHTTP(llm, injector, calls, requests.post)
+    supabase = FakeSupabase(injector, calls)
+
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.object(FakeOpenAIClient, "llm", llm))
+        stack.enter_context(mock.patch.object(FakeGeminiClient, "llm", llm))
+        stack.enter_context(mock.patch.object(openai, "OpenAI", FakeOpenAIClient))
+        stack.enter_context(mock.patch.object(requests, "post", http.post))
+        modules = _fake_gemini_modules()
+        stack.enter_context(mock.patch.dict(sys.modules, modules))
+        # ``from google import genai`` resolves the attribute first, so patch that too
+        stack.enter_context(mock.patch.object(modules["google"], "genai", modules["google.genai"], create=True))
+        yield FakeServices(injector=injector, calls=calls, llm=llm, http=http, supabase=supabase,
+                           async_supabase=FakeAsyncSupabase(supabase))
+
+
+# ----------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of a list of samples."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """p50/p95/max/mean of latencies in seconds, reported in milliseconds."""
+    return {
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "max_ms": round(max(latencies) * 1000, 2) if latencies else 0.0,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+    }
+
+
+def peak_memory(func: Callable[[], Any]) -> float:
+    """Run func once under tracemalloc and return the peak traced memory in MiB."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / (1024 * 1024), 2)
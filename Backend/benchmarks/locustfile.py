@@ -0,0 +1,164 @@
+"""
+Load profile for the recruiter API.
+
+Each simulated recruiter runs the main flow in order: upload a JD, upload a
+batch of resumes against it, list roles, rank the resumes (twice: the second
+request is served from the stored rankings), favorite the best candidate and
+read the favorites back. Run it against an API whose providers point at
+benchmarks/mock_server.py (see its docstring for the environment variables).
+
+Authentication uses the access-token cookie. Set LOAD_TEST_TOKEN to a token
+issued by the API, or set JWT_PRIVATE_KEY, LOAD_TEST_USER_ID and
+LOAD_TEST_ORG_ID to mint one. The favorites and roles routes read the user and
+membership from DATABASE_URL, so that user must exist there.
+
+Usage (from Backend/):
+    locust -f benchmarks/locustfile.py --host http://localhost:8000
+    locust -f benchmarks/locustfile.py --host http://localhost:8000 --headless -u 50 -r 5 -t 10m
+
+Settings:
+    LOAD_TEST_RESUMES   resumes uploaded per JD (default 5)
+    LOAD_TEST_WAIT      max seconds of think time between steps (default 3)
+"""
+
+import os
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from locust import HttpUser, SequentialTaskSet, between, task
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from harness import load_fixture  # noqa: E402
+
+COOKIE_NAME = os.getenv("COOKIE_NAME", "access_token")
+RESUMES_PER_JD = int(os.getenv("LOAD_TEST_RESUMES", "5"))
+THINK_TIME = float(os.getenv("LOAD_TEST_WAIT", "3"))
+
+JD_TEXT = load_fixture("job_description.txt").encode("utf-8")
+RESUME_TEXT = load_fixture("resume.txt").encode("utf-8")
+
+
+def access_token() -> str:
+    """LOAD_TEST_TOKEN if set, otherwise a token minted like app.security.jwt.issue_jwt."""
+    token = os.getenv("LOAD_TEST_TOKEN")
+    if token:
+        return token
+    import jwt
+
+    now = datetime.now(timezone.utc)
+    payload = {
+        "iat": now,
+        "exp": now + timedelta(hours=12),
+        "sub": os.environ["LOAD_TEST_USER_ID"],
+        "org_id": os.environ["LOAD_TEST_ORG_ID"],
+        "role": "admin",
+    }
+    return jwt.encode(payload, os.environ["JWT_PRIVATE_KEY"].encode("utf-8"), algorithm="RS256")
+
+
+def ranking_data(resume: dict, rank: int) -> dict:
+    """RankingData payload for POST /favorites built from an uploaded resume row."""
+    score = round(random.uniform(0.6, 0.95), 3)
+    return {
+        "rank": rank,
+        "candidate_name": resume.get("person_name") or "Unknown Candidate",
+        "current_title": resume.get("role"),
+        "current_company": resume.get("company"),
+        "linkedin_url": None,
+        "overall_score": score,
+        "technical_skills": score,
+        "experience_relevance": score,
+        "seniority_match": score,
+        "education_fit": score,
+        "industry_experience": score,
+        "location_compatibility": score,
+        "confidence_level": "medium",
+        "strengths": ["Strong backend experience"],
+        "concerns": [],
+        "recommendations": ["Proceed to technical interview"],
+        "match_explanation": "Load test ranking",
+        "key_differentiators": [],
+        "interview_focus_areas": ["System design"],
+        "source": "uploaded_resume",
+    }
+
+
+class RecruiterFlow(SequentialTaskSet):
+    """upload JD -> upload resumes -> list roles -> rank (new, then cached) -> favorite -> list favorites."""
+
+    def on_start(self):
+        self.jd_id = None
+        self.resumes = []
+
+    @task
+    def upload_jd(self):
+        files = {"file": (f"jd_{uuid.uuid4().hex[:8]}.txt", JD_TEXT, "text/plain")}
+        with self.client.post("/upload/jd", files=files, name="/upload/jd", catch_response=True) as response:
+            if response.status_code == 200:
+                self.jd_id = response.json()["id"]
+            else:
+                response.failure(f"{response.status_code}: {response.text[:200]}")
+        if self.jd_id is None:
+            self.interrupt(reschedule=True)
+
+    @task
+    def upload_resumes(self):
+        files = [
+            ("files", (f"resume_{i}.txt", RESUME_TEXT, "text/plain"))
+            for i in range(RESUMES_PER_JD)
+        ]
+        with self.client.post(f"/upload/resumes/{self.jd_id}", files=files,
+                              name="/upload/resumes/[jd_id]", catch_response=True) as response:
+            if response.status_code != 200:
+                response.failure(f"{response.status_code}: {response.text[:200]}")
+            else:
+                body = response.json()
+                self.resumes = body.get("successful_uploads", [])
+                if body.get("failed_uploads"):
+                    response.failure(f"{len(body['failed_uploads'])} of {RESUMES_PER_JD} resumes failed")
+
+    @task
+    def list_roles(self):
+        self.client.get("/roles/roles", name="/roles/roles")
+
+    @task
+    def rank(self):
+        self._rank("/roles/[jd_id]/rank")
+
+    @task
+    def rank_cached(self):
+        self._rank("/roles/[jd_id]/rank (cached)")
+
+    def _rank(self, name: str):
+        with self.client.post(f"/roles/{self.jd_id}/rank", name=name, catch_response=True) as response:
+            if response.status_code != 200:
+                response.failure(f"{response.status_code}: {response.text[:200]}")
+            elif len(response.json()["rankings"]) < len(self.resumes):
+                response.failure(f"{len(response.json()['rankings'])} of {len(self.resumes)} resumes ranked")
+
+    @task
+    def favorite(self):
+        if not self.resumes:
+            self.interrupt(reschedule=True)
+        resume = self.resumes[0]
+        self.client.post("/favorites", name="/favorites", json={
+            "job_id": str(self.jd_id),
+            "candidate_id": str(resume.get("id", uuid.uuid4())),
+            "ranking_data": ranking_data(resume, rank=1),
+        })
+
+    @task
+    def list_favorites(self):
+        self.client.get(f"/favorites/{self.jd_id}", name="/favorites/[job_id]")
+        self.interrupt(reschedule=True)
+
+
+class Recruiter(HttpUser):
+    tasks = [RecruiterFlow]
+    wait_time = between(THINK_TIME / 3, THINK_TIME)
+
+    def on_start(self):
+        self.client.cookies.set(COOKIE_NAME, access_token())
@@ -0,0 +1,270 @@
+"""
+Local stand-in server for OpenAI, Gemini, People Data Labs and Supabase.
+
+Serves the same recorded fixtures as the in-process harness over HTTP, with
+per-service latency, error injection and rate limiting, so the API and the CLI
+pipeline can be load-tested without live keys. Point the services at it with:
+
+    OPENAI_BASE_URL=http://localhost:8900/openai/v1
+    GEMINI_BASE_URL=http://localhost:8900/gemini
+    PDL_BASE_URL=http://localhost:8900/pdl/v5
+    SUPABASE_URL=http://localhost:8900/supabase
+    SUPABASE_KEY=mock.mock.mock      # any JWT-shaped string
+
+Routes:
+    POST /openai/v1/chat/completions
+    POST /gemini/{version}/models/{model}:generateContent
+    POST /pdl/v5/person/search
+    POST /supabase/storage/v1/object/{bucket}/{path}
+    POST /supabase/rest/v1/{table}     GET /supabase/rest/v1/{table}?col=eq.value
+    GET  /_stats                       POST /_reset
+
+Usage (from Backend/):
+    python benchmarks/mock_server.py
+    python benchmarks/mock_server.py --profile fast --port 8900
+    python benchmarks/mock_server.py --error-rate 0.02 --rate-limit 20
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from harness import CallLog, FaultInjector, ServiceProfile, pdl_people  # noqa: E402
+from harness.fakes import FakeLLM  # noqa: E402
+
+SERVICES = ("openai", "gemini", "pdl", "supabase_db", "supabase_storage")
+
+# Latencies observed against the live services; grounded Gemini search is by far the slowest
+PROFILES = {
+    "realistic": {
+        "openai": ServiceProfile(latency_ms=1500, jitter_ms=1500),
+        "gemini": ServiceProfile(latency_ms=8000, jitter_ms=6000),
+        "pdl": ServiceProfile(latency_ms=600, jitter_ms=400),
+        "supabase_db": ServiceProfile(latency_ms=30, jitter_ms=30),
+        "supabase_storage": ServiceProfile(latency_ms=120, jitter_ms=80),
+    },
+    "fast": {service: ServiceProfile() for service in SERVICES},
+}
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` requests per second with a burst of the same size."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Tuple[bool, float]:
+        """Take a token if available. Returns (allowed, seconds until the next token)."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True, 0.0
+            return False, (1 - self._tokens) / self.rate
+
+
+def _error_body(service: str, status: int, message: str) -> Dict[str, Any]:
+    """Error payload in the shape each provider returns."""
+    if service == "openai":
+        code = "rate_limit_exceeded" if status == 429 else "server_error"
+        return {"error": {"message": message, "type": code, "param": None, "code": code}}
+    if service == "gemini":
+        state = "RESOURCE_EXHAUSTED" if status == 429 else "UNAVAILABLE"
+        return {"error": {"code": status, "message": message, "status": state}}
+    if service == "pdl":
+        return {"status": status, "error": {"type": "rate_limit_exceeded" if status == 429 else "server_error", "message": message}}
+    return {"statusCode": str(status), "error": "Too Many Requests" if status == 429 else "Service Unavailable", "message": message}
+
+
+def create_app(profiles: Dict[str, ServiceProfile], rate_limit: float = 0.0, seed: int = 1234) -> FastAPI:
+    """Build the stand-in server."""
+    app = FastAPI(title="External service stand-ins")
+    injector = FaultInjector(profiles=profiles, seed=seed)
+    calls = CallLog()
+    # The LLM fake gets a no-op injector: latency and errors are applied here, asynchronously.
+    # Calls are counted once they get past the gate; rejected ones as <service>_429 / _503.
+    llm = FakeLLM(FaultInjector(), calls)
+    limiters = {service: RateLimiter(rate_limit) for service in SERVICES} if rate_limit > 0 else {}
+    pdl_offset = itertools.count()
+    tables: Dict[str, List[Dict[str, Any]]] = {}
+    objects: Dict[str, int] = {}
+
+    async def gate(service: str) -> Optional[JSONResponse]:
+        """Apply rate limiting, latency and error injection. Returns an error response or None."""
+        limiter = limiters.get(service)
+        if limiter:
+            allowed, retry_after = limiter.acquire()
+            if not allowed:
+                calls.record(f"{service}_429")
+                return JSONResponse(
+                    _error_body(service, 429, f"Rate limit of {limiter.rate:g}/s exceeded"),
+                    status_code=429,
+                    headers={"Retry-After": f"{max(retry_after, 0.001):.3f}"},
+                )
+        delay, fail = injector.decide(service)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if fail:
+            calls.record(f"{service}_503")
+            return JSONResponse(_error_body(service, 503, f"{service} unavailable (injected)"), status_code=503)
+        return None
+
+    @app.post("/openai/v1/chat/completions")
+    async def openai_chat(request: Request):
+        error = await gate("openai")
+        if error:
+            return error
+        body = await request.json()
+        messages = body.get("messages", [])
+        content = llm.complete(messages)
+        prompt_tokens = sum(len(m.get("content", "")) for m in messages) // 4
+        completion_tokens = len(content) // 4
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "gpt-4o"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    @app.post("/gemini/{version}/models/{model_action}")
+    async def gemini_generate(version: str, model_action: str):
+        error = await gate("gemini")
+        if error:
+            return error
+        text = llm.gemini_text()
+        return {
+            "candidates": [{
+                "content": {"parts": [{"text": text}], "role": "model"},
+                "finishReason": "STOP",
+                "index": 0,
+            }],
+            "usageMetadata": {"promptTokenCount": 900, "candidatesTokenCount": len(text) // 4},
+            "modelVersion": model_action.split(":")[0],
+        }
+
+    @app.post("/pdl/v5/person/search")
+    async def pdl_search(request: Request):
+        error = await gate("pdl")
+        if error:
+            return error
+        calls.record("pdl")
+        body = await request.json()
+        size = int(body.get("size", 10))
+        start = next(pdl_offset) * size
+        return {"status": 200, "data": pdl_people(size, start=start), "total": 10000, "scroll_token": None}
+
+    @app.post("/supabase/storage/v1/object/{bucket}/{path:path}")
+    async def storage_upload(bucket: str, path: str, request: Request):
+        error = await gate("supabase_storage")
+        if error:
+            return error
+        calls.record("supabase_storage")
+        objects[f"{bucket}/{path}"] = len(await request.body())
+        return {"Key": f"{bucket}/{path}", "Id": str(uuid.uuid4())}
+
+    @app.post("/supabase/rest/v1/{table}")
+    async def rest_insert(table: str, request: Request):
+        error = await gate("supabase_db")
+        if error:
+            return error
+        calls.record("supabase_db")
+        payload = await request.json()
+        now = datetime.now(timezone.utc).isoformat()
+        rows = [{"id": str(uuid.uuid4()), "created_at": now, **row} for row in (payload if isinstance(payload, list) else [payload])]
+        tables.setdefault(table, []).extend(rows)
+        if "return=minimal" in request.headers.get("prefer", ""):
+            return JSONResponse(None, status_code=201)
+        return JSONResponse(rows, status_code=201)
+
+    @app.get("/supabase/rest/v1/{table}")
+    async def rest_select(table: str, request: Request):
+        error = await gate("supabase_db")
+        if error:
+            return error
+        calls.record("supabase_db")
+        filters = {key: value[3:] for key, value in request.query_params.items() if value.startswith("eq.")}
+        rows = [row for row in tables.get(table, []) if all(str(row.get(k)) == v for k, v in filters.items())]
+        if not rows and table == "users" and "id" in filters:
+            # Any authenticated user id resolves to a synthetic user
+            rows = [{
+                "id": filters["id"],
+                "email": f"load-{filters['id'][:8]}@example.com",
+                "name": "Load Test User",
+                "avatar_url": None,
+                "is_superadmin": False,
+                "organization_id": os.getenv("LOAD_TEST_ORG_ID"),
+            }]
+        if "vnd.pgrst.object+json" in request.headers.get("accept", ""):
+            if len(rows) != 1:
+                return JSONResponse({"code": "PGRST116", "message": "JSON object requested, multiple (or no) rows returned"}, status_code=406)
+            return rows[0]
+        return rows
+
+    @app.get("/_stats")
+    async def stats():
+        return {
+            "calls": calls.snapshot(),
+            "rows": {table: len(rows) for table, rows in tables.items()},
+            "objects": len(objects),
+            "stored_bytes": sum(objects.values()),
+        }
+
+    @app.post("/_reset")
+    async def reset():
+        calls.reset()
+        tables.clear()
+        objects.clear()
+        return {"status": "ok"}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="realistic")
+    parser.add_argument("--latency-ms", type=float, help="override latency for every service")
+    parser.add_argument("--jitter-ms", type=float, help="override jitter for every service")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of calls answered with 503")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="requests per second per service before 429s (0 = unlimited)")
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    profiles = {}
+    for service, profile in PROFILES[args.profile].items():
+        profiles[service] = ServiceProfile(
+            latency_ms=profile.latency_ms if args.latency_ms is None else args.latency_ms,
+            jitter_ms=profile.jitter_ms if args.jitter_ms is None else args.jitter_ms,
+            error_rate=args.error_rate,
+        )
+
+    import uvicorn
+    uvicorn.run(create_app(profiles, rate_limit=args.rate_limit, seed=args.seed), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()